@@ -0,0 +1,74 @@
+"""Time registering and looking up 500 commands with 3 aliases each.
+
+    python benchmarks/commands.py
+"""
+
+import asyncio
+import random
+import timeit
+
+import guilded
+from guilded.ext import commands
+
+COMMANDS = 500
+ALIASES = 3
+
+
+async def callback(ctx):
+    pass
+
+
+def make_commands():
+    return [
+        commands.Command(callback, name=f'command{index}', aliases=[f'alias{index}x{alias}' for alias in range(ALIASES)])
+        for index in range(COMMANDS)
+    ]
+
+
+def timed(label: str, func, number: int, per: int = 1) -> None:
+    total = timeit.timeit(func, number=number)
+    print(f'{label}: {total / (number * per) * 1e6:.2f} us')
+
+
+def main() -> None:
+    prepared = make_commands()
+    for case_insensitive in (False, True):
+        print(f'case_insensitive={case_insensitive}')
+
+        def register():
+            bot = commands.Bot(command_prefix='!', help_command=None, case_insensitive=case_insensitive)
+            for command in prepared:
+                bot.add_command(command)
+            return bot
+
+        timed(f'  register {COMMANDS} commands', register, number=20)
+
+        bot = register()
+        names = [name for command in bot.commands for name in (command.name, *command.aliases)]
+        random.shuffle(names)
+        timed('  get_command', lambda: [bot.get_command(name) for name in names], number=20, per=len(names))
+        timed('  all_commands lookup', lambda: [bot.all_commands.get(name) for name in names], number=20, per=len(names))
+
+        state = bot.http
+        state.add_to_user_cache(state.create_user(data={'id': 'author', 'name': 'author', 'type': 'user'}))
+        messages = [
+            guilded.ChatMessage(state=state, channel=None, data={
+                'id': 'message-id',
+                'type': 'default',
+                'channelId': 'channel-id',
+                'content': f'!{name} argument',
+                'createdBy': 'author',
+                'createdAt': '2022-01-01T00:00:00.000Z',
+            })
+            for name in names[:200]
+        ]
+
+        async def get_contexts():
+            for message in messages:
+                await bot.get_context(message)
+
+        timed('  get_context', lambda: asyncio.run(get_contexts()), number=20, per=len(messages))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Time and memory of 100k distinct users hitting a command with a per-user
+cooldown and a per-user max concurrency.
+
+    python benchmarks/cooldowns.py
+"""
+
+import asyncio
+import time
+import tracemalloc
+
+from guilded.ext.commands.cooldowns import BucketType, Cooldown, CooldownMapping, MaxConcurrency
+
+USERS = 100000
+CHUNK = 10000
+# One user every 10ms against a 60s cooldown keeps about 6000 buckets live
+INTERVAL = 0.01
+
+
+class Author:
+    __slots__ = ('id',)
+
+    def __init__(self, id: int):
+        self.id = id
+
+
+class Message:
+    __slots__ = ('author',)
+
+    def __init__(self, author_id: int):
+        self.author = Author(author_id)
+
+
+def cooldowns() -> None:
+    mapping = CooldownMapping(Cooldown(1, 60), BucketType.user)
+    messages = [Message(user_id) for user_id in range(USERS)]
+
+    tracemalloc.start()
+    for start in range(0, USERS, CHUNK):
+        started = time.perf_counter()
+        for user_id in range(start, start + CHUNK):
+            now = user_id * INTERVAL
+            mapping.get_bucket(messages[user_id], now).update_rate_limit(now)
+        elapsed = time.perf_counter() - started
+        current = tracemalloc.get_traced_memory()[0]
+        print(
+            f'cooldowns, users {start + CHUNK:>6}: {elapsed / CHUNK * 1e6:.2f} us per call, '
+            f'{len(mapping._cache)} buckets, {current / 2**20:.2f} MiB'
+        )
+    tracemalloc.stop()
+
+
+async def max_concurrency() -> None:
+    concurrency = MaxConcurrency(1, per=BucketType.user, wait=False)
+    messages = [Message(user_id) for user_id in range(USERS)]
+
+    started = time.perf_counter()
+    for message in messages:
+        await concurrency.acquire(message)
+        await concurrency.release(message)
+    elapsed = time.perf_counter() - started
+    print(f'max concurrency: {elapsed / USERS * 1e6:.2f} us per acquire and release, {len(concurrency._mapping)} semaphores left')
+
+
+def main() -> None:
+    cooldowns()
+    asyncio.run(max_concurrency())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Memory used by 100k cached members spread across 1k servers.
+
+Payloads are decoded from JSON, as they would be from the gateway, so that
+repeated values such as server and role IDs start out as separate strings.
+
+    python benchmarks/members.py
+"""
+
+import gc
+import json
+import tracemalloc
+
+import guilded
+from guilded.server import Server
+
+SERVERS = 1000
+MEMBERS_PER_SERVER = 100
+ROLES_PER_SERVER = 10
+
+
+def member_payload(server_index: int, member_index: int) -> dict:
+    user_id = f'{server_index:04d}{member_index:04d}'
+    return {
+        'user': {
+            'id': user_id,
+            'type': 'user',
+            'name': f'user {user_id}',
+            'avatar': f'https://img.guildedcdn.com/UserAvatar/{user_id}-Large.png',
+            'createdAt': '2021-06-01T12:34:56.789Z',
+        },
+        'roleIds': [server_index * ROLES_PER_SERVER + role for role in range(member_index % 4 + 1)],
+        'nickname': f'nick {member_index}' if member_index % 3 == 0 else None,
+        'joinedAt': '2022-01-02T03:04:05.678Z',
+        'isOwner': member_index == 0,
+    }
+
+
+def main() -> None:
+    encoded = json.dumps([
+        [member_payload(server_index, member_index) for member_index in range(MEMBERS_PER_SERVER)]
+        for server_index in range(SERVERS)
+    ])
+    state = guilded.Client().http
+
+    gc.collect()
+    tracemalloc.start()
+    payloads = json.loads(encoded)
+    payload_bytes = tracemalloc.get_traced_memory()[0]
+
+    for server_index, members in enumerate(payloads):
+        server = Server(state=state, data={'id': f'server{server_index:04d}', 'name': 'server', 'ownerId': 'owner'})
+        state.add_to_server_cache(server)
+        for data in members:
+            server._add_member(state.create_member(data=data, server=server))
+
+    del payloads
+    gc.collect()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    count = SERVERS * MEMBERS_PER_SERVER
+    print(f'{count} members across {SERVERS} servers')
+    print(f'decoded payloads: {payload_bytes / 2**20:.1f} MiB')
+    print(f'cached models: {current / 2**20:.1f} MiB ({current / count:.0f} bytes per member)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Memory and time of building messages from history payloads depending on
+which of their lazily parsed fields are read.
+
+    python benchmarks/messages.py
+"""
+
+import gc
+import json
+import time
+import tracemalloc
+
+import guilded
+
+MESSAGES = 50000
+
+
+def message_payload(index: int) -> dict:
+    return {
+        'id': f'00000000-0000-4000-8000-{index:012d}',
+        'type': 'default',
+        'serverId': 'server01',
+        'channelId': '00000000-0000-4000-8000-000000000000',
+        'content': f'message {index} for <@user{index % 1000:04d}> ![](https://img.guildedcdn.com/ContentMedia/{index}-Full.png)',
+        'mentions': {'users': [{'id': f'user{index % 1000:04d}'}], 'everyone': index % 50 == 0},
+        'embeds': [{'title': 'embed', 'description': f'embed {index}'}] if index % 10 == 0 else [],
+        'createdBy': f'user{index % 1000:04d}',
+        'createdAt': '2022-01-02T03:04:05.678Z',
+        'updatedAt': '2022-01-02T03:05:06.789Z' if index % 5 == 0 else None,
+    }
+
+
+def read_author(message) -> None:
+    message.author_id
+
+
+def read_content(message) -> None:
+    message.content
+    message.author_id
+
+
+def read_everything(message) -> None:
+    message.content
+    message.author_id
+    message.mentions
+    message.attachments
+    message.embeds
+    message.created_at
+    message.updated_at
+
+
+def build(encoded: str, read):
+    state = guilded.Client().http
+    payloads = json.loads(encoded)
+    started = time.perf_counter()
+    messages = []
+    for data in payloads:
+        message = state.create_message(data=data)
+        read(message)
+        messages.append(message)
+    return messages, time.perf_counter() - started
+
+
+def measure(encoded: str, read) -> None:
+    _, elapsed = build(encoded, read)
+
+    gc.collect()
+    tracemalloc.start()
+    messages, _ = build(encoded, read)
+    gc.collect()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del messages
+
+    print(f'{read.__name__}: {elapsed:.2f}s, {current / 2**20:.1f} MiB retained ({current / MESSAGES:.0f} bytes per message)')
+
+
+def main() -> None:
+    encoded = json.dumps([message_payload(index) for index in range(MESSAGES)])
+    print(f'{MESSAGES} messages')
+    measure(encoded, read_author)
+    measure(encoded, read_content)
+    measure(encoded, read_everything)
+
+
+if __name__ == '__main__':
+    main()
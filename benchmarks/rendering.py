@@ -0,0 +1,77 @@
+"""Time rendering legacy rich-text documents into message content.
+
+    python benchmarks/rendering.py
+"""
+
+import timeit
+
+import guilded
+from guilded.message import HasContentMixin
+
+STATE = guilded.Client().http
+
+
+class Content(HasContentMixin):
+    created_by_bot = False
+    server = None
+
+    def __init__(self):
+        super().__init__()
+        self._state = STATE
+        self.server_id = 'server01'
+
+
+def leaf(text, *marks):
+    return {'object': 'leaf', 'text': text, 'marks': [{'type': mark} for mark in marks]}
+
+
+def paragraph(*nodes):
+    return {'object': 'block', 'type': 'paragraph', 'nodes': list(nodes)}
+
+
+def chat_paragraph(index):
+    return paragraph(
+        {'object': 'text', 'leaves': [leaf('Hey '), leaf('everyone', 'bold', 'italic'), leaf(', ')]},
+        {
+            'object': 'inline',
+            'type': 'mention',
+            'data': {'mention': {'type': 'person', 'id': f'user{index:04d}', 'name': 'someone'}},
+            'nodes': [{'object': 'text', 'leaves': [leaf('@someone')]}],
+        },
+        {'object': 'text', 'leaves': [leaf(' see '), leaf('this', 'underline', 'spoiler'), leaf(' ')]},
+        {
+            'object': 'inline',
+            'type': 'link',
+            'data': {'href': 'https://www.guilded.gg'},
+            'nodes': [{'object': 'text', 'leaves': [leaf('link')]}],
+        },
+    )
+
+
+def forum_paragraph(index):
+    return paragraph({
+        'object': 'text',
+        'leaves': [leaf(f'Line {index} of a long post with ')] + [leaf('some', 'bold'), leaf(' formatted ', 'italic'), leaf('words.')],
+    })
+
+
+DOCUMENTS = {
+    'large chat message (200 paragraphs)': {'document': {'nodes': [chat_paragraph(index) for index in range(200)]}},
+    'long forum post (5000 paragraphs)': {'document': {'nodes': [forum_paragraph(index) for index in range(5000)]}},
+}
+
+
+def main() -> None:
+    for name, data in DOCUMENTS.items():
+        for collect_mentions in (True, False):
+            number = 20
+            total = timeit.timeit(
+                lambda: Content()._get_full_content(data, collect_mentions=collect_mentions),
+                number=number,
+            )
+            label = 'with mentions' if collect_mentions else 'content only'
+            print(f'{name}, {label}: {total / number * 1000:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Time parsing the timestamps of a 100k member payload.
+
+    python benchmarks/timestamps.py
+"""
+
+import datetime
+import json
+import time
+
+import guilded
+from guilded.server import Server
+from guilded.utils import ISO8601
+
+MEMBERS = 100000
+
+
+def member_payload(index: int) -> dict:
+    seconds = index % 60
+    return {
+        'user': {
+            'id': f'user{index:05d}',
+            'type': 'user',
+            'name': f'user {index}',
+            'createdAt': f'2021-06-01T12:34:{seconds:02d}.{index % 1000:03d}Z',
+        },
+        'roleIds': [1],
+        # Some timestamps come without milliseconds
+        'joinedAt': f'2022-01-02T03:04:{seconds:02d}Z' if index % 10 == 0 else f'2022-01-02T03:04:{seconds:02d}.678Z',
+    }
+
+
+def timed(label: str, func) -> None:
+    started = time.perf_counter()
+    func()
+    print(f'{label}: {time.perf_counter() - started:.3f}s')
+
+
+def strptime(string: str) -> datetime.datetime:
+    # The parser ISO8601 used for every timestamp before its fast path
+    try:
+        return datetime.datetime.strptime(string, '%Y-%m-%dT%H:%M:%S.%fZ')
+    except ValueError:
+        return datetime.datetime.strptime(string, '%Y-%m-%dT%H:%M:%SZ')
+
+
+def main() -> None:
+    payloads = json.loads(json.dumps([member_payload(index) for index in range(MEMBERS)]))
+    strings = [data['joinedAt'] for data in payloads] + [data['user']['createdAt'] for data in payloads]
+    assert all(ISO8601(string) == strptime(string) for string in strings[::997])
+
+    print(f'{len(strings)} timestamps from {MEMBERS} members')
+    timed('strptime', lambda: [strptime(string) for string in strings])
+    timed('ISO8601', lambda: [ISO8601(string) for string in strings])
+
+    state = guilded.Client().http
+    server = Server(state=state, data={'id': 'server01', 'name': 'server', 'ownerId': 'owner'})
+    members = []
+    timed('build members', lambda: members.extend(state.create_member(data=data, server=server) for data in payloads))
+    timed('read joined_at and created_at', lambda: [(member.joined_at, member.created_at) for member in members])
+
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,7 @@ import logging
 from . import abc as abc, utils as utils
 from .utils import Object as Object
 from .asset import *
+from .cache import *
 from .category import *
 from .channel import *
 from .client import *
@@ -16,6 +17,7 @@ from .emote import *
 from .enums import *
 from .errors import *
 from .events import *
+from .export import *
 from .file import *
 from .flowbot import *
 from .group import *
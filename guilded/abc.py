@@ -52,20 +52,22 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import abc
+import asyncio
 import datetime
 import re
-from typing import TYPE_CHECKING, List, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Union
 
 from .asset import Asset
 from .colour import Colour
 from .enums import ChannelType, ChannelVisibility, try_enum, UserType
-from .errors import InvalidArgument
+from .errors import InvalidArgument, NotFound
+from .iterators import _PaginatedIterator, _oldest_created_at, _paginate
 from .message import HasContentMixin, ChatMessage
 from .mixins import Hashable
 from .override import ChannelRoleOverride, ChannelUserOverride
 from .presence import Presence
 from .status import Status
-from .utils import ISO8601, MISSING
+from .utils import ISO8601, MISSING, _ISO8601Slot, _intern, maybe_coroutine
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -106,6 +108,9 @@ class Messageable(metaclass=abc.ABCMeta):
         * :class:`.Member`
         * :class:`.ext.commands.Context`
     """
+
+    __slots__ = ()
+
     def __init__(self, *, state, data):
         self._state = state
         self.id: str = data.get('id')
@@ -203,53 +208,236 @@ class Messageable(metaclass=abc.ABCMeta):
 
         return message
 
-    async def history(self,
+    def history(self,
         *,
         before: datetime.datetime = None,
         after: datetime.datetime = None,
-        limit: int = 50,
+        limit: Optional[int] = 50,
         include_private: bool = False,
-    ) -> List[ChatMessage]:
-        """|coro|
+        prefetch: int = 1,
+        raw: bool = False,
+    ) -> _PaginatedIterator[ChatMessage]:
+        """An :term:`asynchronous iterator` for the message history of this channel.
 
-        Fetch the message history of this channel.
+        Messages are yielded newest first. Pages of up to 100 messages are
+        requested as needed, and the next page is fetched while the current
+        one is being consumed.
 
         All parameters are optional.
 
+        .. versionchanged:: 1.14
+            This is now an asynchronous iterator that paginates automatically.
+            Awaiting it directly still returns a list of every message.
+
+        Examples
+        ---------
+
+        Usage ::
+
+            async for message in channel.history(limit=500):
+                print(f'{message.author}: {message.content}')
+
+        Flattening into a list ::
+
+            messages = await channel.history(limit=150)
+            # messages is now a list of ChatMessage
+
         Parameters
         -----------
         before: :class:`datetime.datetime`
             Fetch messages sent before this timestamp.
         after: :class:`datetime.datetime`
             Fetch messages sent after this timestamp.
-        limit: :class:`int`
+        limit: Optional[:class:`int`]
             The maximum number of messages to fetch. Defaults to 50.
+            If ``None``, the entire history is fetched.
         include_private: :class:`bool`
             Whether to include private messages in the response. Defaults to ``False``.
             If the client is a user account, this has no effect and is always ``True``.
+        prefetch: :class:`int`
+            How many pages may be fetched ahead of the page currently being
+            consumed. Defaults to 1.
+
+            .. versionadded:: 1.14
+        raw: :class:`bool`
+            Whether to yield the raw message payloads instead of constructing
+            :class:`.ChatMessage` objects. Useful for bulk exports.
+            Defaults to ``False``.
+
+            .. versionadded:: 1.14
+
+        Yields
+        -------
+        :class:`.ChatMessage`
+            A message in this channel's history.
+
+        Raises
+        -------
+        Forbidden
+            You do not have permission to read this channel's messages.
+        HTTPException
+            Failed to get the messages.
+        """
+        state = self._state
+        channel_id = self._channel_id
+
+        async def fetch_page(cursor: Optional[Union[datetime.datetime, str]], page_limit: int):
+            data = await state.get_channel_messages(
+                channel_id,
+                before=cursor,
+                after=after,
+                limit=page_limit,
+                include_private=include_private,
+            )
+            return data.get('messages', [])
+
+        payloads = _paginate(
+            fetch_page,
+            cursor=before,
+            next_cursor=_oldest_created_at,
+            limit=limit,
+            page_size=100,
+            prefetch=prefetch,
+        )
+        if raw:
+            return _PaginatedIterator(payloads)
+
+        async def messages():
+            async for message in payloads:
+                try:
+                    created = state.create_message(channel=self._channel, data=message)
+                except Exception:
+                    continue
+                yield created
+
+        return _PaginatedIterator(messages())
+
+    async def purge(
+        self,
+        *,
+        limit: Optional[int] = 100,
+        check: Optional[Callable[[ChatMessage], Any]] = None,
+        before: Optional[datetime.datetime] = None,
+        after: Optional[datetime.datetime] = None,
+        max_concurrency: int = 5,
+        on_progress: Optional[Callable[[int, int], Any]] = None,
+    ) -> List[ChatMessage]:
+        """|coro|
+
+        Delete messages in this channel in bulk.
+
+        Candidates are streamed from :meth:`.history` and deleted
+        concurrently while later pages are still being fetched. If Guilded
+        rate limits the deletions, every pending deletion waits out the
+        limit together rather than each being rejected in turn.
+
+        .. versionadded:: 1.14
+
+        Examples
+        ---------
+
+        Deleting a raider's messages ::
+
+            def is_raider(message):
+                return message.author_id == raider.id
+
+            deleted = await channel.purge(limit=1000, check=is_raider)
+            await channel.send(f'Deleted {len(deleted)} message(s)')
+
+        Parameters
+        -----------
+        limit: Optional[:class:`int`]
+            The number of messages to search through, not necessarily the
+            number that will be deleted. Defaults to 100.
+            If ``None``, the entire history is searched.
+        check: Optional[Callable[[:class:`.ChatMessage`], :class:`bool`]]
+            A function used to check whether a message should be deleted.
+            If not provided, every message searched is deleted.
+        before: Optional[:class:`datetime.datetime`]
+            Delete messages sent before this timestamp.
+        after: Optional[:class:`datetime.datetime`]
+            Delete messages sent after this timestamp.
+        max_concurrency: :class:`int`
+            The maximum number of deletions to have in flight at once.
+            Defaults to 5.
+        on_progress: Optional[Callable[[:class:`int`, :class:`int`], Any]]
+            A function or coroutine function called after each deletion with
+            the number of messages deleted and searched so far.
 
         Returns
         --------
         List[:class:`.ChatMessage`]
+            The messages that were deleted. Messages that had already been
+            deleted by the time their deletion was attempted are left out.
+
+        Raises
+        -------
+        Forbidden
+            You do not have permission to delete messages in this channel.
+        HTTPException
+            Searching or deleting messages failed.
         """
-        # TODO: Paginate automatically if limit > 100
-        # TODO: Return an async iterator
-        history = await self._state.get_channel_messages(
-            self._channel_id,
-            before=before,
-            after=after,
-            limit=limit,
-            include_private=include_private,
-        )
 
-        messages = []
-        for message in history.get('messages', []):
+        state = self._state
+        channel_id = self._channel_id
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(max_concurrency, 1) * 2)
+        deleted: List[ChatMessage] = []
+        searched = 0
+
+        async def worker() -> None:
+            while True:
+                message = await queue.get()
+                if message is None:
+                    return
+
+                try:
+                    await state.delete_channel_message(channel_id, message.id)
+                except NotFound:
+                    continue
+
+                deleted.append(message)
+                if on_progress is not None:
+                    await maybe_coroutine(on_progress, len(deleted), searched)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(max(max_concurrency, 1))]
+
+        async def enqueue(item: Optional[ChatMessage]) -> None:
+            # Waiting for queue space also surfaces a worker's failure
+            # promptly rather than after the whole history is read, and
+            # never waits on a queue that no worker is left to drain
+            put = asyncio.ensure_future(queue.put(item))
             try:
-                messages.append(self._state.create_message(channel=self._channel, data=message))
-            except:
-                pass
+                while not put.done():
+                    running = []
+                    for task in workers:
+                        if task.done():
+                            task.result()
+                        else:
+                            running.append(task)
+                    if not running:
+                        return
+
+                    await asyncio.wait([put, *running], return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                put.cancel()
+
+        try:
+            async for message in self.history(before=before, after=after, limit=limit):
+                searched += 1
+                if check is not None and not check(message):
+                    continue
 
-        return messages
+                await enqueue(message)
+
+            for _ in workers:
+                await enqueue(None)
+            await asyncio.gather(*workers)
+
+        finally:
+            for task in workers:
+                task.cancel()
+
+        return deleted
 
     async def fetch_message(self, message_id: str, /) -> ChatMessage:
         """|coro|
@@ -394,6 +582,7 @@ class User(Hashable, metaclass=abc.ABCMeta):
     """
 
     __slots__ = (
+        '_state',
         'type',
         '_user_type',
         'id',
@@ -402,6 +591,7 @@ class User(Hashable, metaclass=abc.ABCMeta):
         'name',
         'nick',
         'colour',
+        'slug',
         'subdomain',
         'games',
         'bio',
@@ -409,9 +599,9 @@ class User(Hashable, metaclass=abc.ABCMeta):
         'presence',
         'status',
         'roblox_id',
-        'blocked_at',
-        'online_at',
-        'created_at',
+        '_blocked_at',
+        '_online_at',
+        '_created_at',
         'default_avatar',
         'avatar',
         'banner',
@@ -420,6 +610,10 @@ class User(Hashable, metaclass=abc.ABCMeta):
         'stonks',
     )
 
+    blocked_at = _ISO8601Slot('_blocked_at')
+    online_at = _ISO8601Slot('_online_at')
+    created_at = _ISO8601Slot('_created_at')
+
     def __init__(self, *, state, data: UserPayload, **extra):
         self._state = state
         data = data.get('user', data)
@@ -440,9 +634,9 @@ class User(Hashable, metaclass=abc.ABCMeta):
         self.status = Status(data=data.get('status')) if data.get('status') else None
         self.roblox_id: Optional[int] = int(data.get("robloxId")) if data.get("robloxId") else None
 
-        self.blocked_at: Optional[datetime.datetime] = ISO8601(data.get('blockedDate'))
-        self.online_at: Optional[datetime.datetime] = ISO8601(data.get('lastOnline'))
-        self.created_at: datetime.datetime = ISO8601(data.get('createdAt') or data.get('joinDate'))
+        self._blocked_at: Optional[str] = data.get('blockedDate')
+        self._online_at: Optional[str] = data.get('lastOnline')
+        self._created_at: Optional[str] = data.get('createdAt') or data.get('joinDate')
         # in profilev3, createdAt is returned instead of joinDate
 
         self.default_avatar: Asset = Asset._from_default_user_avatar(self._state, 1)
@@ -534,12 +728,34 @@ class ServerChannel(Hashable, metaclass=abc.ABCMeta):
         * :class:`.VoiceChannel`
     """
 
+    __slots__ = (
+        '_state',
+        '_group',
+        'group_id',
+        'server_id',
+        'category_id',
+        'id',
+        'type',
+        'name',
+        'topic',
+        'visibility',
+        'created_by_id',
+        '_created_at',
+        '_updated_at',
+        'archived_by_id',
+        '_archived_at',
+    )
+
+    created_at = _ISO8601Slot('_created_at')
+    updated_at = _ISO8601Slot('_updated_at')
+    archived_at = _ISO8601Slot('_archived_at')
+
     def __init__(self, *, state, data: ServerChannelPayload, group: Optional[Group] = None, **extra):
         self._state = state
         self._group = group
 
-        self.group_id: str = data.get('groupId')
-        self.server_id: str = data.get('serverId')
+        self.group_id: str = _intern(data.get('groupId'))
+        self.server_id: str = _intern(data.get('serverId'))
         self.category_id: Optional[int] = data.get('categoryId')
 
         self.id: str = data['id']
@@ -549,11 +765,11 @@ class ServerChannel(Hashable, metaclass=abc.ABCMeta):
         self.visibility: Optional[ChannelVisibility] = try_enum(ChannelVisibility, data['visibility']) if data.get('visibility') else None
 
         self.created_by_id: Optional[str] = extra.get('createdBy')
-        self.created_at: datetime.datetime = ISO8601(data.get('createdAt'))
-        self.updated_at: Optional[datetime.datetime] = ISO8601(data.get('updatedAt'))
+        self._created_at: Optional[str] = data.get('createdAt')
+        self._updated_at: Optional[str] = data.get('updatedAt')
 
         self.archived_by_id: Optional[str] = data.get('archivedBy')
-        self.archived_at: Optional[datetime.datetime] = ISO8601(data.get('archivedAt'))
+        self._archived_at: Optional[str] = data.get('archivedAt')
 
     @property
     def share_url(self) -> str:
@@ -108,6 +108,8 @@ def url_with_signature(url: str, signature: str) -> str:
 
 
 class AssetMixin:
+    __slots__ = ()
+
     url: str
     _state: Optional[Any]
 
@@ -285,6 +287,8 @@ class Asset(AssetMixin):
         '_state',
         '_url',
         '_animated',
+        '_maybe_animated',
+        '_banner',
         '_key',
     )
 
@@ -0,0 +1,546 @@
+"""
+MIT License
+
+Copyright (c) 2020-present shay (shayypy)
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+------------------------------------------------------------------------------
+
+This project includes code from https://github.com/Rapptz/discord.py, which is
+available under the MIT license:
+
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar, Union
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .role import Role
+    from .server import Server
+    from .user import Member
+
+__all__ = (
+    'CachePolicy',
+    'MemberCachePolicy',
+    'ServerCacheStats',
+)
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class _CacheStore(OrderedDict, Generic[K, V]):
+    """A mapping that evicts items once it exceeds ``max_size`` items or once
+    they have not been touched for ``ttl`` seconds.
+
+    Items are kept in order of last use (or of insertion if ``lru`` is
+    ``False``), so eviction only ever has to look at the front of the
+    mapping. Expired items are dropped whenever the mapping is read from,
+    and :meth:`_expire` may be called periodically to reclaim them when it
+    is not. ``on_evict`` is called with the key and value of every item that
+    is evicted, but not of items that are removed explicitly.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        lru: bool = True,
+        on_evict: Optional[Callable[[K, V], Any]] = None,
+    ):
+        super().__init__()
+        self.max_size: Optional[int] = max_size
+        self.ttl: Optional[float] = ttl
+        self.lru: bool = lru
+        self.on_evict: Optional[Callable[[K, V], Any]] = on_evict
+        self._stamps: Dict[K, float] = OrderedDict()
+
+    def __setitem__(self, key: K, value: V) -> None:
+        super().__setitem__(key, value)
+        if self.lru:
+            self.move_to_end(key)
+        if self.ttl is not None:
+            self._stamps[key] = time.monotonic()
+            self._stamps.move_to_end(key)
+
+        self._trim()
+
+    def __getitem__(self, key: K) -> V:
+        value = super().__getitem__(key)
+        if self.ttl is not None:
+            now = time.monotonic()
+            if now - self._stamps.get(key, now) > self.ttl:
+                self._evict(key)
+                raise KeyError(key)
+
+            self._stamps[key] = now
+            self._stamps.move_to_end(key)
+
+        if self.lru:
+            self.move_to_end(key)
+        return value
+
+    def __delitem__(self, key: K) -> None:
+        super().__delitem__(key)
+        self._stamps.pop(key, None)
+
+    def __contains__(self, key: Any) -> bool:
+        if not super().__contains__(key):
+            return False
+
+        if self.ttl is not None:
+            now = time.monotonic()
+            if now - self._stamps.get(key, now) > self.ttl:
+                self._evict(key)
+                return False
+
+        return True
+
+    def __len__(self) -> int:
+        self._expire()
+        return super().__len__()
+
+    def __iter__(self):
+        self._expire()
+        return super().__iter__()
+
+    def keys(self):
+        self._expire()
+        return super().keys()
+
+    def values(self):
+        self._expire()
+        return super().values()
+
+    def items(self):
+        self._expire()
+        return super().items()
+
+    def get(self, key: K, default: Any = None) -> Optional[V]:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key: K, *default: Any) -> Optional[V]:
+        self._stamps.pop(key, None)
+        return super().pop(key, *default)
+
+    def clear(self) -> None:
+        super().clear()
+        self._stamps.clear()
+
+    def _evict(self, key: K) -> None:
+        value = super().pop(key)
+        self._stamps.pop(key, None)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _expire(self) -> None:
+        if self.ttl is None:
+            return
+
+        cutoff = time.monotonic() - self.ttl
+        while self._stamps:
+            key, stamp = next(iter(self._stamps.items()))
+            if stamp > cutoff:
+                break
+            self._evict(key)
+
+    def _trim(self) -> None:
+        if self.max_size is not None:
+            while super().__len__() > self.max_size:
+                self._evict(next(super().__iter__()))
+
+        self._expire()
+
+
+class _NameIndex:
+    """Maps casefolded names to the IDs of the objects that have them.
+
+    Names are also kept in a sorted list so that every name starting with a
+    prefix can be found with a binary search rather than a full scan.
+    """
+
+    __slots__ = (
+        '_ids_by_name',
+        '_names_by_id',
+        '_sorted_names',
+    )
+
+    def __init__(self):
+        self._ids_by_name: Dict[str, Set[str]] = {}
+        self._names_by_id: Dict[str, Tuple[str, ...]] = {}
+        self._sorted_names: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._names_by_id)
+
+    def add(self, id: str, names: Iterable[Optional[str]]) -> None:
+        keys = tuple({name.casefold() for name in names if name})
+        if self._names_by_id.get(id) == keys:
+            return
+
+        self.remove(id)
+        if not keys:
+            return
+
+        self._names_by_id[id] = keys
+        for key in keys:
+            ids = self._ids_by_name.get(key)
+            if ids is None:
+                self._ids_by_name[key] = {id}
+                insort(self._sorted_names, key)
+            else:
+                ids.add(id)
+
+    def remove(self, id: str) -> None:
+        for key in self._names_by_id.pop(id, ()):
+            ids = self._ids_by_name[key]
+            ids.discard(id)
+            if not ids:
+                del self._ids_by_name[key]
+                del self._sorted_names[bisect_left(self._sorted_names, key)]
+
+    def clear(self) -> None:
+        self._ids_by_name.clear()
+        self._names_by_id.clear()
+        self._sorted_names.clear()
+
+    def find(self, name: str) -> Set[str]:
+        return self._ids_by_name.get(name.casefold(), set())
+
+    def find_prefix(self, prefix: str, *, limit: Optional[int] = None) -> List[str]:
+        prefix = prefix.casefold()
+        names = self._sorted_names
+        found: Dict[str, None] = {}
+
+        index = bisect_left(names, prefix)
+        while index < len(names) and names[index].startswith(prefix):
+            for id in self._ids_by_name[names[index]]:
+                found[id] = None
+                if limit is not None and len(found) >= limit:
+                    return list(found)
+            index += 1
+
+        return list(found)
+
+
+class CachePolicy:
+    """Controls how many objects of a kind the client keeps in its internal
+    cache, and for how long.
+
+    These are passed to :class:`.Client` as ``user_cache_policy`` and
+    ``dm_channel_cache_policy``.
+
+    .. versionadded:: 1.14
+
+    Parameters
+    -----------
+    enabled: :class:`bool`
+        Whether objects of this kind should be cached at all.
+        Defaults to ``True``.
+    max_size: Optional[:class:`int`]
+        The maximum number of objects to keep. When this is exceeded, the
+        least recently used object is evicted. ``None`` means unbounded.
+    ttl: Optional[:class:`float`]
+        The number of seconds an object may stay in the cache without being
+        accessed or updated before it is evicted. ``None`` means forever.
+    """
+
+    __slots__ = (
+        'enabled',
+        'max_size',
+        'ttl',
+    )
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        if max_size is not None and max_size < 0:
+            raise ValueError('max_size must be a non-negative integer or None')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('ttl must be a positive number or None')
+
+        self.enabled: bool = enabled
+        self.max_size: Optional[int] = max_size
+        self.ttl: Optional[float] = ttl
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} enabled={self.enabled!r} max_size={self.max_size!r} ttl={self.ttl!r}>'
+
+    @classmethod
+    def all(cls) -> Self:
+        """A factory method that creates a :class:`CachePolicy` that caches
+        every object forever. This is the default."""
+        return cls()
+
+    @classmethod
+    def none(cls) -> Self:
+        """A factory method that creates a :class:`CachePolicy` that caches
+        nothing."""
+        return cls(enabled=False)
+
+    @classmethod
+    def lru(cls, max_size: int) -> Self:
+        """A factory method that creates a :class:`CachePolicy` that keeps
+        at most ``max_size`` of the most recently used objects."""
+        return cls(max_size=max_size)
+
+    @classmethod
+    def expiring(cls, ttl: float) -> Self:
+        """A factory method that creates a :class:`CachePolicy` that evicts
+        objects that have not been used for ``ttl`` seconds."""
+        return cls(ttl=ttl)
+
+    def _create_store(
+        self,
+        *,
+        on_evict: Optional[Callable[[Any, Any], Any]] = None,
+    ) -> Union[Dict[Any, Any], _CacheStore]:
+        if self.max_size is None and self.ttl is None:
+            # Unbounded caches don't need the bookkeeping
+            return {}
+        return _CacheStore(max_size=self.max_size, ttl=self.ttl, on_evict=on_evict)
+
+
+class MemberCachePolicy:
+    """Controls which server members the client keeps in its internal cache.
+
+    This is passed to :class:`.Client` as ``member_cache_policy``. The
+    client's own member object is always cached regardless of this policy.
+
+    .. versionadded:: 1.14
+
+    Parameters
+    -----------
+    enabled: :class:`bool`
+        Whether members should be cached at all. Defaults to ``True``.
+    active_within: Optional[:class:`float`]
+        Only cache members of servers that have received an event within
+        this many seconds. Members of servers that go idle for longer are
+        evicted.
+    expire_after: Optional[:class:`float`]
+        Evict members that have not been seen (accessed or updated) for
+        this many seconds.
+    roles: Optional[Iterable[Union[:class:`.Role`, :class:`int`]]]
+        Only cache members that have at least one of these roles.
+    """
+
+    __slots__ = (
+        'enabled',
+        'active_within',
+        'expire_after',
+        'role_ids',
+    )
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        active_within: Optional[float] = None,
+        expire_after: Optional[float] = None,
+        roles: Optional[Iterable[Union[Role, int]]] = None,
+    ):
+        if active_within is not None and active_within <= 0:
+            raise ValueError('active_within must be a positive number or None')
+        if expire_after is not None and expire_after <= 0:
+            raise ValueError('expire_after must be a positive number or None')
+
+        self.enabled: bool = enabled
+        self.active_within: Optional[float] = active_within
+        self.expire_after: Optional[float] = expire_after
+        self.role_ids: Optional[Set[int]] = (
+            {getattr(role, 'id', role) for role in roles}
+            if roles is not None
+            else None
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f'<MemberCachePolicy enabled={self.enabled!r} active_within={self.active_within!r} '
+            f'expire_after={self.expire_after!r} role_ids={self.role_ids!r}>'
+        )
+
+    @classmethod
+    def all(cls) -> Self:
+        """A factory method that creates a :class:`MemberCachePolicy` that
+        caches every member. This is the default."""
+        return cls()
+
+    @classmethod
+    def none(cls) -> Self:
+        """A factory method that creates a :class:`MemberCachePolicy` that
+        caches no members other than the client's own."""
+        return cls(enabled=False)
+
+    @classmethod
+    def active_servers(cls, seconds: float) -> Self:
+        """A factory method that creates a :class:`MemberCachePolicy` that
+        only caches members of servers that have received an event within
+        the last ``seconds`` seconds."""
+        return cls(active_within=seconds)
+
+    @classmethod
+    def recent(cls, seconds: float) -> Self:
+        """A factory method that creates a :class:`MemberCachePolicy` that
+        evicts members that have not been seen in the last ``seconds``
+        seconds."""
+        return cls(expire_after=seconds)
+
+    @classmethod
+    def with_roles(cls, *roles: Union[Role, int]) -> Self:
+        """A factory method that creates a :class:`MemberCachePolicy` that
+        only caches members with at least one of ``roles``."""
+        return cls(roles=roles)
+
+    def _create_store(
+        self,
+        *,
+        on_evict: Optional[Callable[[str, Member], Any]] = None,
+    ) -> Union[Dict[str, Member], _CacheStore]:
+        if self.expire_after is None:
+            return {}
+        return _CacheStore(ttl=self.expire_after, on_evict=on_evict)
+
+    def _should_cache(self, member: Member, server: Server) -> bool:
+        if member.id == member._state.my_id:
+            return True
+
+        if not self.enabled:
+            return False
+
+        if self.role_ids is not None and self.role_ids.isdisjoint(member._role_ids):
+            return False
+
+        if not self._is_active(server):
+            return False
+
+        return True
+
+    def _is_active(self, server: Server) -> bool:
+        return self.active_within is None or time.monotonic() - server._last_activity <= self.active_within
+
+
+class _ServerStub:
+    """The compact form a :class:`.Server` is demoted to after it has been
+    idle for too long. It is rehydrated into a full server on next use."""
+
+    __slots__ = (
+        'id',
+        'name',
+        'owner_id',
+        'demoted_at',
+    )
+
+    def __init__(self, server: Server):
+        self.id: str = server.id
+        self.name: Optional[str] = server.name
+        self.owner_id: Optional[str] = server.owner_id
+        self.demoted_at: float = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f'<_ServerStub id={self.id!r} name={self.name!r}>'
+
+
+class ServerCacheStats:
+    """A snapshot of the client's server cache, as returned by
+    :attr:`.Client.server_cache_stats`.
+
+    .. versionadded:: 1.14
+
+    Attributes
+    -----------
+    resident: :class:`int`
+        The number of servers whose full state is cached.
+    demoted: :class:`int`
+        The number of idle servers that are currently only cached as a
+        compact stub.
+    rehydrations: :class:`int`
+        The number of times a demoted server has been rehydrated.
+    last_rehydration_latency: Optional[:class:`float`]
+        How long, in seconds, the most recent rehydration took to fetch the
+        server. This does not include members and roles, which are filled in
+        the background.
+    average_rehydration_latency: Optional[:class:`float`]
+        The mean rehydration latency in seconds.
+    """
+
+    __slots__ = (
+        'resident',
+        'demoted',
+        'rehydrations',
+        'last_rehydration_latency',
+        'average_rehydration_latency',
+    )
+
+    def __init__(
+        self,
+        *,
+        resident: int,
+        demoted: int,
+        rehydrations: int,
+        last_rehydration_latency: Optional[float],
+        total_rehydration_latency: float,
+    ):
+        self.resident: int = resident
+        self.demoted: int = demoted
+        self.rehydrations: int = rehydrations
+        self.last_rehydration_latency: Optional[float] = last_rehydration_latency
+        self.average_rehydration_latency: Optional[float] = (
+            total_rehydration_latency / rehydrations
+            if rehydrations
+            else None
+        )
+
+    def __repr__(self) -> str:
+        return f'<ServerCacheStats resident={self.resident!r} demoted={self.demoted!r} rehydrations={self.rehydrations!r}>'
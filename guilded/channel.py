@@ -53,7 +53,7 @@ from __future__ import annotations
 
 import datetime
 import re
-from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, List, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, List, Tuple, Union
 
 import guilded.abc
 
@@ -61,6 +61,7 @@ from .asset import Asset
 from .colour import Colour
 from .enums import ChannelType, CustomRepeatInterval, DeleteSeriesType, FileType, RSVPStatus, RepeatInterval, Weekday, try_enum
 from .group import Group
+from .iterators import _PaginatedIterator, _oldest_created_at, _paginate, _paginate_models
 from .message import HasContentMixin
 from .mixins import Hashable
 from .reply import AnnouncementReply, CalendarEventReply, DocReply, ForumTopicReply
@@ -121,6 +122,9 @@ __all__ = (
 
 class CalendarChannel(guilded.abc.ServerChannel):
     """Represents a calendar channel in a :class:`.Server`."""
+
+    __slots__: Tuple[str, ...] = ()
+
     def __init__(self, **fields):
         super().__init__(**fields)
         self.type = ChannelType.calendar
@@ -293,12 +297,14 @@ class CalendarChannel(guilded.abc.ServerChannel):
         event = CalendarEvent(state=self._state, data=data['calendarEvent'], channel=self)
         return event
 
-    async def events(
+    def events(
         self,
         limit: Optional[int] = 25,
         after: Optional[Union[datetime.datetime, CalendarEvent]] = None,
         before: Optional[Union[datetime.datetime, CalendarEvent]] = None,
-    ) -> AsyncIterator[CalendarEvent]:
+        *,
+        prefetch: int = 1,
+    ) -> _PaginatedIterator[CalendarEvent]:
         """An :term:`asynchronous iterator` for the events in this channel.
 
         Results are ordered ascending by :attr:`.CalendarEvent.starts_at`.
@@ -320,11 +326,16 @@ class CalendarChannel(guilded.abc.ServerChannel):
         -----------
         limit: Optional[:class:`int`]
             The maximum number of events to return.
-            Defaults to 25 if not specified.
+            Defaults to 25 if not specified. If ``None``, every event is returned.
         before: Optional[Union[:class:`.CalendarEvent`, :class:`datetime.datetime`]]
             The event to stop pagination at.
         after: Optional[Union[:class:`.CalendarEvent`, :class:`datetime.datetime`]]
             The event to begin pagination at.
+        prefetch: :class:`int`
+            How many pages may be fetched ahead of the page currently being
+            consumed. Defaults to 1.
+
+            .. versionadded:: 1.14
 
         Yields
         -------
@@ -344,28 +355,32 @@ class CalendarChannel(guilded.abc.ServerChannel):
         if isinstance(after, CalendarEvent):
             after = after.starts_at
 
-        while True:
-            sublimit = min(500 if limit is None else limit, 500)
-            if sublimit < 1:
-                return
+        state = self._state
 
-            data = await self._state.get_calendar_events(
+        async def fetch_page(cursor, page_limit: int):
+            data = await state.get_calendar_events(
                 self.id,
-                limit=sublimit,
+                limit=page_limit,
                 before=before,
-                after=after,
+                after=cursor,
             )
-            data = data['calendarEvents']
-
-            # Adjust sublimit according to how much data is left
-            if len(data) < 500:
-                limit = 0
-            else:
-                limit -= len(data)
-
-            for event_data in data:
-                yield CalendarEvent(state=self._state, data=event_data, channel=self)
-
+            return data['calendarEvents']
+
+        def next_cursor(events):
+            # Events are ascending, so continue after the latest start
+            return max(event['startsAt'] for event in events)
+
+        return _paginate_models(
+            _paginate(
+                fetch_page,
+                cursor=after,
+                next_cursor=next_cursor,
+                limit=limit,
+                page_size=500,
+                prefetch=prefetch,
+            ),
+            lambda data: CalendarEvent(state=state, data=data, channel=self),
+        )
 
 class CalendarEvent(Hashable, HasContentMixin):
     """Represents an event in a :class:`CalendarChannel`.
@@ -1301,6 +1316,11 @@ class CalendarEventRSVP:
 
 class ChatChannel(guilded.abc.ServerChannel, guilded.abc.Messageable):
     """Represents a chat channel in a :class:`.Server`."""
+
+    __slots__: Tuple[str, ...] = (
+        '_channel_id',
+    )
+
     def __init__(self, **fields):
         super().__init__(**fields)
         self.type = ChannelType.chat
@@ -1622,6 +1642,11 @@ class Doc(Hashable, HasContentMixin):
 
 class DocsChannel(guilded.abc.ServerChannel):
     """Represents a docs channel in a :class:`.Server`."""
+
+    __slots__: Tuple[str, ...] = (
+        '_docs',
+    )
+
     def __init__(self, **fields):
         super().__init__(**fields)
         self.type = ChannelType.docs
@@ -1681,35 +1706,74 @@ class DocsChannel(guilded.abc.ServerChannel):
         doc = Doc(data=data['doc'], channel=self, state=self._state)
         return doc
 
-    # TODO: async iterator
-    async def fetch_docs(self, *, limit: int = None, before: datetime.datetime = None) -> List[Doc]:
-        """|coro|
-
-        Fetch multiple docs in this channel.
+    def fetch_docs(
+        self,
+        *,
+        limit: Optional[int] = 25,
+        before: Optional[Union[datetime.datetime, Doc]] = None,
+        prefetch: int = 1,
+    ) -> _PaginatedIterator[Doc]:
+        """An :term:`asynchronous iterator` for the docs in this channel.
 
         All parameters are optional.
 
+        .. versionchanged:: 1.14
+            This is now an asynchronous iterator that paginates automatically.
+            Awaiting it directly still returns a list of docs.
+
+        Examples
+        ---------
+
+        Usage ::
+
+            async for doc in channel.fetch_docs(limit=None):
+                print(doc.title)
+
+        Flattening into a list ::
+
+            docs = await channel.fetch_docs()
+            # docs is now a list of Doc
+
         Parameters
         -----------
-        limit: :class:`int`
-            The maximum number of docs to return.
-            Defaults to 25, can be at most 100.
-        before: :class:`datetime.datetime`
-            The latest date that an doc can be from. Defaults to the
+        limit: Optional[:class:`int`]
+            The maximum number of docs to return. Defaults to 25.
+            If ``None``, every doc is returned.
+        before: Optional[Union[:class:`.Doc`, :class:`datetime.datetime`]]
+            The latest date that a doc can be from. Defaults to the
             current time.
+        prefetch: :class:`int`
+            How many pages may be fetched ahead of the page currently being
+            consumed. Defaults to 1.
 
-        Returns
-        --------
-        List[:class:`.Doc`]
-            The docs in the channel.
+            .. versionadded:: 1.14
+
+        Yields
+        -------
+        :class:`.Doc`
+            A doc in the channel.
         """
 
-        data = await self._state.get_docs(self.id, limit=limit, before=before)
-        docs = []
-        for doc_data in data['docs']:
-            docs.append(Doc(data=doc_data, channel=self, state=self._state))
+        if isinstance(before, Doc):
+            before = before.created_at
 
-        return docs
+        state = self._state
+
+        async def fetch_page(cursor, page_limit: int):
+            data = await state.get_docs(self.id, limit=page_limit, before=cursor)
+            return data['docs']
+
+        return _paginate_models(
+            _paginate(
+                fetch_page,
+                cursor=before,
+                next_cursor=_oldest_created_at,
+                limit=limit,
+                page_size=100,
+                prefetch=prefetch,
+            ),
+            lambda data: Doc(data=data, channel=self, state=state),
+        )
 
 
 class ForumTopic(Hashable, HasContentMixin):
@@ -2075,6 +2139,9 @@ class ForumTopic(Hashable, HasContentMixin):
 
 class ForumChannel(guilded.abc.ServerChannel):
     """Represents a forum channel in a :class:`.Server`."""
+
+    __slots__: Tuple[str, ...] = ()
+
     def __init__(self, **fields):
         super().__init__(**fields)
 
@@ -2148,12 +2215,16 @@ class ForumChannel(guilded.abc.ServerChannel):
         topic = ForumTopic(data=data['forumTopic'], channel=self, state=self._state)
         return topic
 
-    async def topics(
+    def topics(
         self,
         limit: Optional[int] = 25,
         before: Optional[Union[datetime.datetime, ForumTopic]] = None,
-    ) -> AsyncIterator[ForumTopic]:
-        """An :term:`asynchronous iterator` for the events in this channel.
+        *,
+        prefetch: int = 1,
+    ) -> _PaginatedIterator[ForumTopic]:
+        """An :term:`asynchronous iterator` for the topics in this channel.
+
+        Results are ordered descending by each topic's latest activity.
 
         Examples
         ---------
@@ -2172,9 +2243,14 @@ class ForumChannel(guilded.abc.ServerChannel):
         -----------
         limit: Optional[:class:`int`]
             The maximum number of topics to return.
-            Defaults to 25 if not specified.
+            Defaults to 25 if not specified. If ``None``, every topic is returned.
         before: Optional[Union[:class:`.ForumTopic`, :class:`datetime.datetime`]]
-            The topic to stop pagination at.
+            The topic to begin pagination at.
+        prefetch: :class:`int`
+            How many pages may be fetched ahead of the page currently being
+            consumed. Defaults to 1.
+
+            .. versionadded:: 1.14
 
         Yields
         -------
@@ -2190,32 +2266,44 @@ class ForumChannel(guilded.abc.ServerChannel):
         """
 
         if isinstance(before, ForumTopic):
-            before = before.starts_at
+            before = before.bumped_at or before.created_at
 
-        while True:
-            sublimit = min(100 if limit is None else limit, 100)
-            if sublimit < 1:
-                return
+        state = self._state
 
-            data = await self._state.get_forum_topics(
+        async def fetch_page(cursor, page_limit: int):
+            data = await state.get_forum_topics(
                 self.id,
-                limit=sublimit,
-                before=before,
+                limit=page_limit,
+                before=cursor,
             )
-            data = data['forumTopics']
-
-            # Adjust sublimit according to how much data is left
-            if len(data) < 100:
-                limit = 0
-            else:
-                limit -= len(data)
-
-            for event_data in data:
-                yield ForumTopic(state=self._state, data=event_data, channel=self)
+            return data['forumTopics']
+
+        def next_cursor(topics):
+            # Topics are sorted by activity, which is their creation
+            # date until they have been bumped
+            return min(topic.get('bumpedAt') or topic['createdAt'] for topic in topics)
+
+        return _paginate_models(
+            _paginate(
+                fetch_page,
+                cursor=before,
+                next_cursor=next_cursor,
+                limit=limit,
+                page_size=100,
+                prefetch=prefetch,
+            ),
+            lambda data: ForumTopic(state=state, data=data, channel=self),
+        )
 
 
 class VoiceChannel(guilded.abc.ServerChannel, guilded.abc.Messageable):
     """Represents a voice channel in a :class:`.Server`."""
+
+    __slots__: Tuple[str, ...] = (
+        '_channel_id',
+        '_ws',
+    )
+
     def __init__(self, **fields):
         super().__init__(**fields)
         self.type = ChannelType.voice
@@ -2276,7 +2364,7 @@ class Thread(guilded.abc.ServerChannel, guilded.abc.Messageable):
     """
 
     __slots__: Tuple[str, ...] = (
-        'type',
+        '_channel_id',
         'root_id',
         'parent_id',
         'starter_message_id',
@@ -2646,6 +2734,9 @@ class Announcement(Hashable, HasContentMixin):
 
 class AnnouncementChannel(guilded.abc.ServerChannel):
     """Represents an announcement channel in a :class:`.Server`."""
+
+    __slots__: Tuple[str, ...] = ()
+
     def __init__(self, **fields):
         super().__init__(**fields)
 
@@ -2689,29 +2780,61 @@ class AnnouncementChannel(guilded.abc.ServerChannel):
         announcement = Announcement(data=data['announcement'], channel=self, state=self._state)
         return announcement
 
-    async def fetch_announcements(self, *, limit: int = None, before: datetime.datetime = None) -> List[Announcement]:
-        """|coro|
-
-        Fetch multiple announcements in this channel.
+    def fetch_announcements(
+        self,
+        *,
+        limit: Optional[int] = 25,
+        before: Optional[Union[datetime.datetime, Announcement]] = None,
+        prefetch: int = 1,
+    ) -> _PaginatedIterator[Announcement]:
+        """An :term:`asynchronous iterator` for the announcements in this channel.
 
         All parameters are optional.
 
+        .. versionchanged:: 1.14
+            This is now an asynchronous iterator that paginates automatically.
+            Awaiting it directly still returns a list of announcements.
+
         Parameters
         -----------
-        limit: :class:`int`
+        limit: Optional[:class:`int`]
             The maximum number of announcements to return. Defaults to 25.
-        before: :class:`datetime.datetime`
+            If ``None``, every announcement is returned.
+        before: Optional[Union[:class:`.Announcement`, :class:`datetime.datetime`]]
             The latest date that an announcement can be from. Defaults to the
             current time.
+        prefetch: :class:`int`
+            How many pages may be fetched ahead of the page currently being
+            consumed. Defaults to 1.
 
-        Returns
-        --------
-        List[:class:`.Announcement`]
-            The announcements in the channel.
+            .. versionadded:: 1.14
+
+        Yields
+        -------
+        :class:`.Announcement`
+            An announcement in the channel.
         """
 
-        data = await self._state.get_announcements(self.id, limit=limit, before=before)
-        return [Announcement(data=announcement_data, channel=self, state=self._state) for announcement_data in data['announcements']]
+        if isinstance(before, Announcement):
+            before = before.created_at
+
+        state = self._state
+
+        async def fetch_page(cursor, page_limit: int):
+            data = await state.get_announcements(self.id, limit=page_limit, before=cursor)
+            return data['announcements']
+
+        return _paginate_models(
+            _paginate(
+                fetch_page,
+                cursor=before,
+                next_cursor=_oldest_created_at,
+                limit=limit,
+                page_size=100,
+                prefetch=prefetch,
+            ),
+            lambda data: Announcement(data=data, channel=self, state=state),
+        )
 
     async def create_announcement(self, *, title: str, content: str) -> Announcement:
         """|coro|
@@ -3442,6 +3565,12 @@ class ListItem(Hashable, HasContentMixin):
 
 class MediaChannel(guilded.abc.ServerChannel):
     """Represents a media channel in a :class:`.Server`."""
+
+    __slots__: Tuple[str, ...] = (
+        '_medias',
+        'content_type',
+    )
+
     def __init__(self, **fields):
         super().__init__(**fields)
         self.type = ChannelType.media
@@ -3569,6 +3698,11 @@ class MediaChannel(guilded.abc.ServerChannel):
 
 class ListChannel(guilded.abc.ServerChannel):
     """Represents a list channel in a :class:`.Server`."""
+
+    __slots__: Tuple[str, ...] = (
+        '_items',
+    )
+
     def __init__(self, **fields):
         super().__init__(**fields)
         self.type = ChannelType.list
@@ -3832,6 +3966,11 @@ class Availability(Hashable):
 
 class SchedulingChannel(guilded.abc.ServerChannel):
     """Represents a scheduling channel in a :class:`.Server`."""
+
+    __slots__: Tuple[str, ...] = (
+        '_availabilities',
+    )
+
     def __init__(self, **fields):
         super().__init__(**fields)
         self.type = ChannelType.scheduling
@@ -3924,6 +4063,11 @@ class SchedulingChannel(guilded.abc.ServerChannel):
 
 class StreamChannel(guilded.abc.ServerChannel, guilded.abc.Messageable):
     """Represents a stream channel in a :class:`.Server`."""
+
+    __slots__: Tuple[str, ...] = (
+        '_channel_id',
+    )
+
     def __init__(self, **fields):
         super().__init__(**fields)
         self.type = ChannelType.stream
@@ -54,10 +54,13 @@ from __future__ import annotations
 import aiohttp
 import asyncio
 import logging
+import os
 import sys
+import time
 import traceback
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Generator, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, Generator, List, Optional, Type, Union
 
+from .cache import CachePolicy, MemberCachePolicy, ServerCacheStats
 from .errors import ClientException, HTTPException
 from .enums import *
 from .events import BaseEvent
@@ -65,8 +68,9 @@ from .gateway import GuildedWebSocket, WebSocketClosure
 from .http import HTTPClient
 from .invite import Invite
 from .server import Server
+from .snapshot import dump_payload, encode_payload, load_state
 from .user import ClientUser, User
-from .utils import MISSING
+from .utils import MISSING, find
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -146,6 +150,51 @@ class Client:
         This defaults to ``1000``. Passing in ``None`` disables the message cache.
     features: Optional[:class:`.ClientFeatures`]
         Client features to opt in or out of.
+    member_cache_policy: Optional[:class:`.MemberCachePolicy`]
+        Controls which server members are cached.
+        Defaults to caching every member.
+
+        .. versionadded:: 1.14
+    user_cache_policy: Optional[:class:`.CachePolicy`]
+        Controls how many users are cached and for how long.
+        Defaults to caching every user forever.
+
+        .. versionadded:: 1.14
+    dm_channel_cache_policy: Optional[:class:`.CachePolicy`]
+        Controls how many DM channels are cached and for how long.
+        Defaults to caching every DM channel forever.
+
+        .. versionadded:: 1.14
+    name_index: :class:`bool`
+        Whether to index cached users by name and members by name and
+        nickname. This speeds up :meth:`.get_user_named`,
+        :meth:`Server.get_member_named` and :meth:`Server.search_members`
+        (and so the name lookups of the commands extension's converters)
+        at the cost of some memory. Defaults to ``False``.
+
+        .. versionadded:: 1.14
+    server_idle_timeout: Optional[:class:`float`]
+        The number of seconds a server may go without receiving any events
+        before its members, roles, channels and other state are dropped from
+        the cache. Idle servers are transparently rehydrated on their next
+        event or on :meth:`.getch_server`. The server matching
+        ``internal_server_id`` is never dropped. Defaults to ``None``, which
+        never drops servers.
+
+        .. versionadded:: 1.14
+    snapshot_path: Optional[:class:`str`]
+        A file path to save a snapshot of the client's server cache to when
+        it is closed. If the file exists when the client starts, the cache is
+        restored from it instead of being fetched, the gateway connection
+        resumes from where the snapshot was taken, and the server list is
+        reconciled with the API in the background.
+
+        .. versionadded:: 1.14
+    snapshot_interval: Optional[:class:`float`]
+        If ``snapshot_path`` is set, additionally save a snapshot every this
+        many seconds while the client is running.
+
+        .. versionadded:: 1.14
 
     Attributes
     -----------
@@ -170,6 +219,13 @@ class Client:
         internal_server_id: Optional[str] = None,
         max_messages: Optional[int] = MISSING,
         features: Optional[ClientFeatures] = None,
+        member_cache_policy: Optional[MemberCachePolicy] = None,
+        user_cache_policy: Optional[CachePolicy] = None,
+        dm_channel_cache_policy: Optional[CachePolicy] = None,
+        name_index: bool = False,
+        server_idle_timeout: Optional[float] = None,
+        snapshot_path: Optional[str] = None,
+        snapshot_interval: Optional[float] = None,
         **options,
     ):
         # internal
@@ -188,10 +244,22 @@ class Client:
         self._ready: asyncio.Event = MISSING
 
         self.internal_server_id = internal_server_id
+        self.server_idle_timeout: Optional[float] = server_idle_timeout
+        self._idle_server_task: Optional[asyncio.Task] = None
+        # Rehydrations of demoted servers that are in flight, by server ID
+        self._rehydration_fetches: Dict[str, asyncio.Future] = {}
+        self._cache_sweep_task: Optional[asyncio.Task] = None
+        self.snapshot_path: Optional[str] = snapshot_path
+        self.snapshot_interval: Optional[float] = snapshot_interval
+        self._snapshot_task: Optional[asyncio.Task] = None
         self.ws: Optional[GuildedWebSocket] = None
         self.http: HTTPClient = HTTPClient(
             max_messages=self.max_messages,
             features=self.features,
+            member_cache_policy=member_cache_policy,
+            user_cache_policy=user_cache_policy,
+            dm_channel_cache_policy=dm_channel_cache_policy,
+            name_index=name_index,
         )
 
     async def __aenter__(self) -> Self:
@@ -263,6 +331,15 @@ class Client:
         """
         return self.servers
 
+    @property
+    def server_cache_stats(self) -> ServerCacheStats:
+        """:class:`.ServerCacheStats`: A snapshot of how many servers are
+        fully cached versus demoted for being idle.
+
+        .. versionadded:: 1.14
+        """
+        return self.http.server_cache_stats
+
     @property
     def latency(self) -> float:
         return float('nan') if self.ws is None else self.ws.latency
@@ -611,6 +688,34 @@ class Client:
         """Optional[:class:`~guilded.User`]: Get a user from your :attr:`.users`."""
         return self.http._get_user(user_id)
 
+    def get_user_named(self, name: str, /) -> Optional[User]:
+        """Get a user by their name from your :attr:`.users`.
+
+        This is case-sensitive. If more than one user has the name, any one
+        of them may be returned.
+
+        .. versionadded:: 1.14
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The name of the user.
+
+        Returns
+        --------
+        Optional[:class:`~guilded.User`]
+            The user with the name, if any.
+        """
+        if self.http._user_names is None:
+            return find(lambda user: user.name == name, self.http._users.values())
+
+        for user_id in tuple(self.http._user_names.find(name)):
+            user = self.http._get_user(user_id)
+            if user is not None and user.name == name:
+                return user
+
+        return None
+
     def get_channel(self, channel_id: str, /) -> Optional[ServerChannel]:
         """Optional[:class:`~.abc.ServerChannel`]: Get a server channel or DM
         channel from your channels."""
@@ -618,12 +723,7 @@ class Client:
 
     def get_emote(self, emote_id: int, /) -> Optional[Emote]:
         """Optional[:class:`.Emote`]: Get an emote from your :attr:`.emotes`."""
-        for server in self.servers:
-            emote = server.get_emote(emote_id)
-            if emote:
-                return emote
-
-        return None
+        return self.http._get_emote(emote_id)
 
     async def fetch_user(self, user_id: str, /) -> User:
         """|coro|
@@ -700,12 +800,76 @@ class Client:
 
         Try to get a server from internal cache, and if not found, try to fetch from the API.
 
+        If the server was demoted for being idle (see ``server_idle_timeout``),
+        it is fetched, cached again, and its members and roles are refilled in
+        the background.
+
         Returns
         --------
         :class:`.Server`
             The server from the ID.
         """
-        return self.get_server(server_id) or await self.fetch_server(server_id)
+        server = self.get_server(server_id)
+        if server is not None:
+            return server
+
+        if self.http._is_demoted(server_id):
+            return await self._rehydrate_server(server_id)
+
+        return await self.fetch_server(server_id)
+
+    async def _rehydrate_server(self, server_id: str) -> Server:
+        # Share a single rehydration between concurrent callers so that the
+        # server is only fetched and refilled once
+        future = self._rehydration_fetches.get(server_id)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_demoted_server(server_id))
+            self._rehydration_fetches[server_id] = future
+            future.add_done_callback(lambda _: self._rehydration_fetches.pop(server_id, None))
+
+        return await asyncio.shield(future)
+
+    async def _fetch_demoted_server(self, server_id: str) -> Server:
+        start = time.perf_counter()
+        server = await self.fetch_server(server_id)
+        self.http._record_rehydration(time.perf_counter() - start)
+        self.http.add_to_server_cache(server)
+        log.debug('Rehydrated idle server %s', server_id)
+
+        # Members and roles are refilled in the background; mark the server
+        # as filled so that the gateway doesn't also fill it inline.
+        server._members_filled = True
+
+        async def refill():
+            try:
+                await asyncio.gather(server.fill_members(), server.fill_roles())
+            except HTTPException as exc:
+                log.warning('Failed to refill rehydrated server %s: %s', server_id, exc)
+
+        self.loop.create_task(refill(), name=f'guilded.py: rehydrate {server_id}')
+        return server
+
+    async def _demote_idle_servers(self) -> None:
+        timeout = self.server_idle_timeout
+        # Check a few times per timeout period, but not excessively often
+        interval = min(max(timeout / 4, 1.0), 60.0)
+        while not self.closed:
+            await asyncio.sleep(interval)
+            cutoff = time.monotonic() - timeout
+            # The bot's own internal server is never demoted
+            idle = [
+                server.id
+                for server in self.http._servers.values()
+                if server._last_activity < cutoff and server.id != self.internal_server_id
+            ]
+            for server_id in idle:
+                self.http.demote_server(server_id)
+
+    async def _sweep_caches_periodically(self) -> None:
+        interval = self.http._cache_sweep_interval
+        while not self.closed:
+            await asyncio.sleep(interval)
+            self.http._sweep_caches()
 
     async def fetch_servers(self) -> List[Server]:
         """|coro|
@@ -859,6 +1023,95 @@ class Client:
 
         return assets
 
+    async def save_snapshot(self, path: Optional[str] = None) -> None:
+        """|coro|
+
+        Save a snapshot of the client's server cache to a file. This includes
+        servers and their roles, channels, threads, categories, members and
+        emotes, as well as the current gateway cursor.
+
+        .. versionadded:: 1.14
+
+        Parameters
+        -----------
+        path: Optional[:class:`str`]
+            The file to write to. Defaults to ``snapshot_path``.
+
+        Raises
+        -------
+        ValueError
+            No path was provided and the client has no ``snapshot_path``.
+        """
+        path = path or self.snapshot_path
+        if path is None:
+            raise ValueError('No snapshot path was provided.')
+
+        cursor = self.ws._last_message_id if self.ws else None
+        # Only copying the cache has to happen on the event loop; encoding
+        # and compressing a large cache would otherwise block the gateway
+        payload = dump_payload(self.http, cursor=cursor)
+
+        def write():
+            snapshot = encode_payload(payload)
+            # Write to a temporary file first so that a crash mid-write
+            # doesn't leave a truncated snapshot behind
+            tmp_path = f'{path}.tmp'
+            with open(tmp_path, 'wb') as fp:
+                fp.write(snapshot)
+            os.replace(tmp_path, path)
+
+        await asyncio.get_running_loop().run_in_executor(None, write)
+        log.debug('Saved cache snapshot of %s servers to %s', len(self.http._servers), path)
+
+    async def _restore_snapshot(self) -> bool:
+        path = self.snapshot_path
+
+        def read():
+            with open(path, 'rb') as fp:
+                return fp.read()
+
+        try:
+            snapshot = await self.loop.run_in_executor(None, read)
+        except FileNotFoundError:
+            return False
+
+        try:
+            servers, cursor = load_state(self.http, snapshot)
+        except Exception:
+            log.warning('Ignoring unreadable cache snapshot at %s', path, exc_info=True)
+            return False
+
+        self.http._resume_cursor = cursor
+        log.info('Restored %s servers from cache snapshot %s', len(servers), path)
+        return True
+
+    async def _reconcile_servers(self) -> None:
+        try:
+            data = await self.http.get_my_servers()
+        except HTTPException as exc:
+            log.warning('Failed to reconcile servers restored from snapshot: %s', exc)
+            return
+
+        fresh_ids = set()
+        for server_data in data['servers']:
+            fresh_ids.add(server_data['id'])
+            server = self.http._get_server(server_data['id'])
+            if server is None:
+                self.http.add_to_server_cache(Server(state=self.http, data=server_data))
+            else:
+                server._update(server_data)
+
+        for server_id in [server_id for server_id in self.http._servers if server_id not in fresh_ids]:
+            self.http.remove_from_server_cache(server_id)
+
+    async def _snapshot_periodically(self) -> None:
+        while not self.closed:
+            await asyncio.sleep(self.snapshot_interval)
+            try:
+                await self.save_snapshot()
+            except OSError:
+                log.warning('Failed to save cache snapshot', exc_info=True)
+
     async def on_error(self, event_method, *args, **kwargs) -> None:
         print(f'Ignoring exception in {event_method}:', file=sys.stderr)
         traceback.print_exc()
@@ -878,10 +1131,19 @@ class Client:
         await self._async_setup_hook()
         await self.setup_hook()
 
-        # The gateway does not send the client's servers upon connecting
-        servers = await self.fetch_servers()
-        for server in servers:
-            self.http.add_to_server_cache(server)
+        restored = False
+        if self.snapshot_path is not None:
+            restored = await self._restore_snapshot()
+
+        if restored:
+            # Get going with the snapshot and catch up with any servers we
+            # joined or left in the meantime
+            self.loop.create_task(self._reconcile_servers(), name='guilded.py: reconcile servers')
+        else:
+            # The gateway does not send the client's servers upon connecting
+            servers = await self.fetch_servers()
+            for server in servers:
+                self.http.add_to_server_cache(server)
 
         if self.internal_server_id and not self.get_server(self.internal_server_id):
             log.warn(
@@ -889,6 +1151,24 @@ class Client:
                 self.internal_server_id,
             )
 
+        if self.server_idle_timeout is not None and self._idle_server_task is None:
+            self._idle_server_task = self.loop.create_task(
+                self._demote_idle_servers(),
+                name='guilded.py: demote idle servers',
+            )
+
+        if self.http._cache_sweep_interval is not None and self._cache_sweep_task is None:
+            self._cache_sweep_task = self.loop.create_task(
+                self._sweep_caches_periodically(),
+                name='guilded.py: sweep expired cache entries',
+            )
+
+        if self.snapshot_path is not None and self.snapshot_interval is not None and self._snapshot_task is None:
+            self._snapshot_task = self.loop.create_task(
+                self._snapshot_periodically(),
+                name='guilded.py: save cache snapshots',
+            )
+
         await self.connect(token, reconnect=reconnect)
 
     async def connect(self, token: str = None, *, reconnect: bool = True) -> None:
@@ -975,9 +1255,27 @@ class Client:
         if self._closed:
             return
 
+        if self.snapshot_path is not None:
+            try:
+                await self.save_snapshot()
+            except OSError:
+                log.warning('Failed to save cache snapshot', exc_info=True)
+
         await self.http.close()
         self._closed = True
 
+        if self._idle_server_task is not None:
+            self._idle_server_task.cancel()
+            self._idle_server_task = None
+
+        if self._cache_sweep_task is not None:
+            self._cache_sweep_task.cancel()
+            self._cache_sweep_task = None
+
+        if self._snapshot_task is not None:
+            self._snapshot_task.cancel()
+            self._snapshot_task = None
+
         try:
             await self.ws.close(code=1000)
         except Exception:
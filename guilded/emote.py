@@ -58,7 +58,7 @@ from .asset import AssetMixin, Asset
 from .errors import InvalidArgument
 from .mixins import Hashable
 from .user import Member
-from .utils import ISO8601
+from .utils import ISO8601, _intern
 
 if TYPE_CHECKING:
     from .types.emote import Emote as EmotePayload
@@ -107,13 +107,29 @@ class Emote(Hashable, AssetMixin):
         The ID of the server that the emote is from, if any.
     """
 
+    __slots__ = (
+        '_state',
+        '_server',
+        'id',
+        'name',
+        'server_id',
+        'author_id',
+        'created_at',
+        'aliases',
+        'stock',
+        '_animated',
+        '_stock_guilded',
+        '_stock_unicode',
+        '_underlying',
+    )
+
     def __init__(self, *, state, data: EmotePayload, **extra):
         self._state = state
         self._server = extra.get('server')
 
         self.id: int = data.get('id')
         self.name: str = data.get('name') or ''
-        self.server_id: Optional[str] = data.get('serverId') or data.get('teamId')
+        self.server_id: Optional[str] = _intern(data.get('serverId') or data.get('teamId'))
         self.author_id: Optional[str] = data.get('createdBy')
         self.created_at: Optional[datetime.datetime] = ISO8601(data.get('createdAt'))
         _url: Optional[str] = data.get('url')
@@ -0,0 +1,618 @@
+"""
+MIT License
+
+Copyright (c) 2020-present shay (shayypy)
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+------------------------------------------------------------------------------
+
+This project includes code from https://github.com/Rapptz/discord.py, which is
+available under the MIT license:
+
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import functools
+import gzip
+import json
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from .abc import Messageable
+from .channel import AnnouncementChannel, CalendarChannel, DocsChannel, ForumChannel, ListChannel
+from .iterators import _oldest_created_at, _paginate
+from .utils import maybe_coroutine
+
+if TYPE_CHECKING:
+    from .abc import ServerChannel
+
+log = logging.getLogger(__name__)
+
+__all__ = (
+    'ChannelExporter',
+    'ExportProgress',
+)
+
+# A unit is a top-level item and everything exported alongside it, e.g. a
+# topic and its replies. Segments only ever end on a unit boundary so that
+# a checkpoint's cursor always describes exactly what has been written.
+_Record = Tuple[str, Dict[str, Any]]
+_Unit = Tuple[Union[str, int], List[_Record]]
+
+CHECKPOINT_FILENAME = 'checkpoint.json'
+
+
+class ExportProgress:
+    """Represents the progress of a channel export.
+
+    This is passed to :class:`ChannelExporter`'s ``on_progress`` callback and
+    returned by :meth:`ChannelExporter.export`.
+
+    .. versionadded:: 1.14
+
+    Attributes
+    -----------
+    channel_id: :class:`str`
+        The ID of the channel being exported.
+    records: :class:`int`
+        The number of records written so far, including those written by
+        previous runs that this export resumed from.
+    segments: :class:`int`
+        The number of segment files completed so far.
+    done: :class:`bool`
+        Whether the channel has been exported completely.
+    elapsed: :class:`float`
+        How many seconds this run has spent exporting the channel.
+    """
+
+    __slots__ = (
+        'channel_id',
+        'records',
+        'segments',
+        'done',
+        'elapsed',
+        '_resumed_records',
+    )
+
+    def __init__(self, channel_id: str, *, records: int = 0, segments: int = 0):
+        self.channel_id: str = channel_id
+        self.records: int = records
+        self.segments: int = segments
+        self.done: bool = False
+        self.elapsed: float = 0.0
+        self._resumed_records: int = records
+
+    def __repr__(self) -> str:
+        return f'<ExportProgress channel_id={self.channel_id!r} records={self.records} segments={self.segments} done={self.done}>'
+
+    @property
+    def rate(self) -> float:
+        """:class:`float`: The number of records written per second during this run."""
+        if not self.elapsed:
+            return 0.0
+        return (self.records - self._resumed_records) / self.elapsed
+
+
+class _SegmentWriter:
+    """Writes records to numbered NDJSON segments in a channel's directory.
+
+    Segments are written under a temporary name and only renamed, and the
+    checkpoint updated, once they are complete. Encoding, compression and
+    file operations all run in the loop's default executor, one at a time
+    per writer.
+    """
+
+    __slots__ = (
+        'directory',
+        'compress',
+        'segment_size',
+        'segments',
+        '_file',
+        '_records_in_segment',
+    )
+
+    def __init__(self, directory: str, *, compress: bool, segment_size: int, segments: int = 0):
+        self.directory = directory
+        self.compress = compress
+        self.segment_size = segment_size
+        self.segments = segments
+        self._file = None
+        self._records_in_segment = 0
+
+    def _segment_path(self, index: int) -> str:
+        extension = '.ndjson.gz' if self.compress else '.ndjson'
+        return os.path.join(self.directory, f'segment-{index:05d}{extension}')
+
+    async def write(self, records: List[_Record]) -> None:
+        await _run_blocking(self._write, records)
+        self._records_in_segment += len(records)
+
+    def _write(self, records: List[_Record]) -> None:
+        if self._file is None:
+            path = self._segment_path(self.segments) + '.tmp'
+            if self.compress:
+                self._file = gzip.open(path, 'wt', encoding='utf-8')
+            else:
+                self._file = open(path, 'w', encoding='utf-8')
+
+        self._file.write(''.join(
+            json.dumps({'type': kind, 'data': data}, ensure_ascii=False, separators=(',', ':')) + '\n'
+            for kind, data in records
+        ))
+
+    @property
+    def full(self) -> bool:
+        return self._records_in_segment >= self.segment_size
+
+    async def finish_segment(self, checkpoint: Dict[str, Any]) -> None:
+        if self._file is not None:
+            await _run_blocking(self._close_segment)
+            self.segments += 1
+            self._records_in_segment = 0
+
+        checkpoint['segments'] = self.segments
+        await _run_blocking(_write_checkpoint, self.directory, dict(checkpoint))
+
+    def _close_segment(self) -> None:
+        self._file.close()
+        self._file = None
+        os.replace(self._segment_path(self.segments) + '.tmp', self._segment_path(self.segments))
+
+    async def abort(self) -> None:
+        # The partial segment is discarded; a resumed export rewrites it
+        # from the last checkpoint
+        if self._file is not None:
+            file, self._file = self._file, None
+            await _run_blocking(file.close)
+
+
+async def _run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+def _prepare_directory(directory: str) -> Dict[str, Any]:
+    os.makedirs(directory, exist_ok=True)
+    checkpoint = _read_checkpoint(directory) or {'cursor': None, 'records': 0, 'segments': 0, 'done': False}
+    if not checkpoint['done']:
+        for filename in os.listdir(directory):
+            if filename.endswith('.tmp'):
+                os.remove(os.path.join(directory, filename))
+
+    return checkpoint
+
+
+def _read_checkpoint(directory: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(directory, CHECKPOINT_FILENAME), 'r', encoding='utf-8') as fp:
+            return json.load(fp)
+    except FileNotFoundError:
+        return None
+
+
+def _write_checkpoint(directory: str, checkpoint: Dict[str, Any]) -> None:
+    path = os.path.join(directory, CHECKPOINT_FILENAME)
+    with open(path + '.tmp', 'w', encoding='utf-8') as fp:
+        json.dump(checkpoint, fp)
+    os.replace(path + '.tmp', path)
+
+
+class ChannelExporter:
+    """Streams the contents of channels to newline-delimited JSON files.
+
+    Each channel is written to its own directory, named after its ID, as a
+    series of numbered segment files. Every line is an object with a
+    ``type`` (e.g. ``"message"``, ``"topic"`` or ``"topic_reply"``) and the
+    raw API payload as ``data``. Payloads are written as they arrive, so
+    memory usage does not grow with the size of a channel.
+
+    A checkpoint is saved each time a segment is completed. Exporting to a
+    directory that already contains checkpoints resumes each channel from
+    where it was left off, and skips channels that were already finished.
+
+    Chat-like channels (anything :class:`~.abc.Messageable`),
+    :class:`.ForumChannel`\s, :class:`.DocsChannel`\s,
+    :class:`.AnnouncementChannel`\s, :class:`.CalendarChannel`\s and
+    :class:`.ListChannel`\s are supported.
+
+    .. versionadded:: 1.14
+
+    Example ::
+
+        exporter = guilded.ChannelExporter('archive', compress=True)
+        await exporter.export(*server.chat_channels, server.get_channel(forum_id))
+
+    Parameters
+    -----------
+    directory: :class:`str`
+        The directory to write channel directories to. It is created if it
+        does not exist.
+    compress: :class:`bool`
+        Whether to gzip each segment. Defaults to ``False``.
+    segment_size: :class:`int`
+        The number of records after which a new segment is started.
+        Defaults to ``50000``.
+    include_replies: :class:`bool`
+        Whether to export the replies to topics, docs, announcements and
+        calendar events. Defaults to ``True``.
+    include_threads: :class:`bool`
+        Whether to also export the cached threads of each exported channel.
+        Defaults to ``True``.
+    include_private: :class:`bool`
+        Whether to include private messages. Defaults to ``True``.
+    max_concurrency: :class:`int`
+        The maximum number of channels to export at once. Defaults to ``4``.
+    max_reply_concurrency: :class:`int`
+        The maximum number of reply requests to have in flight at once,
+        across every channel being exported. Defaults to ``4``.
+    prefetch: :class:`int`
+        How many pages may be fetched ahead of the page being written for
+        each channel. Defaults to ``1``.
+    on_progress: Optional[Callable[[:class:`ExportProgress`], Any]]
+        A function or coroutine function called with a channel's progress
+        every ``progress_interval`` records and once the channel is done.
+    progress_interval: :class:`int`
+        How many records to write between progress reports.
+        Defaults to ``1000``.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        compress: bool = False,
+        segment_size: int = 50000,
+        include_replies: bool = True,
+        include_threads: bool = True,
+        include_private: bool = True,
+        max_concurrency: int = 4,
+        max_reply_concurrency: int = 4,
+        prefetch: int = 1,
+        on_progress: Optional[Callable[[ExportProgress], Any]] = None,
+        progress_interval: int = 1000,
+    ):
+        self.directory: str = directory
+        self.compress: bool = compress
+        self.segment_size: int = max(segment_size, 1)
+        self.include_replies: bool = include_replies
+        self.include_threads: bool = include_threads
+        self.include_private: bool = include_private
+        self.max_concurrency: int = max(max_concurrency, 1)
+        self.max_reply_concurrency: int = max(max_reply_concurrency, 1)
+        # Shared by every channel so that reply fetches stay within
+        # max_reply_concurrency overall, see _with_replies
+        self._reply_semaphore: Optional[asyncio.Semaphore] = None
+        self.prefetch: int = prefetch
+        self.on_progress: Optional[Callable[[ExportProgress], Any]] = on_progress
+        self.progress_interval: int = max(progress_interval, 1)
+
+    async def export(self, *channels: Union[ServerChannel, Messageable]) -> Dict[str, ExportProgress]:
+        """|coro|
+
+        Export channels, up to :attr:`max_concurrency` at a time.
+
+        Parameters
+        -----------
+        \*channels: Union[:class:`~.abc.ServerChannel`, :class:`~.abc.Messageable`]
+            The channels to export.
+
+        Returns
+        --------
+        Dict[:class:`str`, :class:`ExportProgress`]
+            The final progress of each exported channel, by channel ID.
+
+        Raises
+        -------
+        TypeError
+            A channel's contents cannot be exported.
+        HTTPException
+            Failed to fetch a channel's contents.
+        """
+
+        targets: Dict[str, Any] = {}
+        for channel in channels:
+            self._source_for(channel)
+            targets[_channel_id(channel)] = channel
+            if self.include_threads:
+                for thread in _cached_threads(channel):
+                    targets.setdefault(thread.id, thread)
+
+        if self._reply_semaphore is None:
+            self._reply_semaphore = asyncio.Semaphore(self.max_reply_concurrency)
+
+        await _run_blocking(functools.partial(os.makedirs, self.directory, exist_ok=True))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [
+            asyncio.ensure_future(self._export_channel(channel, semaphore))
+            for channel in targets.values()
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return {progress.channel_id: progress for progress in results}
+
+    async def _export_channel(self, channel, semaphore: asyncio.Semaphore) -> ExportProgress:
+        channel_id = _channel_id(channel)
+        directory = os.path.join(self.directory, channel_id)
+        checkpoint = await _run_blocking(_prepare_directory, directory)
+        progress = ExportProgress(channel_id, records=checkpoint['records'], segments=checkpoint['segments'])
+        if checkpoint['done']:
+            progress.done = True
+            return progress
+
+        writer = _SegmentWriter(
+            directory,
+            compress=self.compress,
+            segment_size=self.segment_size,
+            segments=checkpoint['segments'],
+        )
+
+        async with semaphore:
+            started = time.perf_counter()
+            next_report = progress.records + self.progress_interval
+            try:
+                async for cursor, records in self._source_for(channel)(channel, checkpoint['cursor']):
+                    await writer.write(records)
+                    progress.records += len(records)
+                    checkpoint['cursor'] = cursor
+                    checkpoint['records'] = progress.records
+
+                    if writer.full:
+                        await writer.finish_segment(checkpoint)
+                        progress.segments = writer.segments
+
+                    if progress.records >= next_report:
+                        next_report = progress.records + self.progress_interval
+                        progress.elapsed = time.perf_counter() - started
+                        await self._report(progress)
+
+            except BaseException:
+                await writer.abort()
+                raise
+
+            checkpoint['done'] = True
+            await writer.finish_segment(checkpoint)
+            progress.segments = writer.segments
+            progress.done = True
+            progress.elapsed = time.perf_counter() - started
+
+        log.debug('Exported %s records from channel %s', progress.records, channel_id)
+        await self._report(progress)
+        return progress
+
+    async def _report(self, progress: ExportProgress) -> None:
+        if self.on_progress is not None:
+            await maybe_coroutine(self.on_progress, progress)
+
+    def _source_for(self, channel) -> Callable[[Any, Any], AsyncIterator[_Unit]]:
+        if isinstance(channel, Messageable):
+            return self._messages
+        if isinstance(channel, ForumChannel):
+            return self._topics
+        if isinstance(channel, DocsChannel):
+            return self._docs
+        if isinstance(channel, AnnouncementChannel):
+            return self._announcements
+        if isinstance(channel, CalendarChannel):
+            return self._events
+        if isinstance(channel, ListChannel):
+            return self._list_items
+
+        raise TypeError(f'cannot export the contents of {channel.__class__.__name__}')
+
+    async def _messages(self, channel: Messageable, cursor: Optional[str]) -> AsyncIterator[_Unit]:
+        state = channel._state
+        channel_id = channel._channel_id
+
+        async def fetch_page(before: Optional[str], limit: int):
+            data = await state.get_channel_messages(
+                channel_id,
+                before=before,
+                limit=limit,
+                include_private=self.include_private,
+            )
+            return data.get('messages', [])
+
+        async for message in _paginate(
+            fetch_page,
+            cursor=cursor,
+            next_cursor=_oldest_created_at,
+            limit=None,
+            page_size=100,
+            prefetch=self.prefetch,
+        ):
+            yield message['createdAt'], [('message', message)]
+
+    def _topics(self, channel: ForumChannel, cursor: Optional[str]) -> AsyncIterator[_Unit]:
+        state = channel._state
+
+        async def fetch_page(before: Optional[str], limit: int):
+            data = await state.get_forum_topics(channel.id, before=before, limit=limit)
+            return data['forumTopics']
+
+        def activity(topic) -> str:
+            return topic.get('bumpedAt') or topic['createdAt']
+
+        async def fetch_replies(topic_id: int):
+            data = await state.get_forum_topic_comments(channel.id, topic_id)
+            return data['forumTopicComments']
+
+        topics = _paginate(
+            fetch_page,
+            cursor=cursor,
+            next_cursor=lambda topics: min(map(activity, topics)),
+            limit=None,
+            page_size=100,
+            prefetch=self.prefetch,
+        )
+        return self._with_replies(topics, 'topic', activity, fetch_replies)
+
+    def _docs(self, channel: DocsChannel, cursor: Optional[str]) -> AsyncIterator[_Unit]:
+        state = channel._state
+
+        async def fetch_page(before: Optional[str], limit: int):
+            data = await state.get_docs(channel.id, before=before, limit=limit)
+            return data['docs']
+
+        async def fetch_replies(doc_id: int):
+            data = await state.get_doc_comments(channel.id, doc_id)
+            return data['docComments']
+
+        docs = _paginate(
+            fetch_page,
+            cursor=cursor,
+            next_cursor=_oldest_created_at,
+            limit=None,
+            page_size=100,
+            prefetch=self.prefetch,
+        )
+        return self._with_replies(docs, 'doc', lambda doc: doc['createdAt'], fetch_replies)
+
+    def _announcements(self, channel: AnnouncementChannel, cursor: Optional[str]) -> AsyncIterator[_Unit]:
+        state = channel._state
+
+        async def fetch_page(before: Optional[str], limit: int):
+            data = await state.get_announcements(channel.id, before=before, limit=limit)
+            return data['announcements']
+
+        async def fetch_replies(announcement_id: str):
+            data = await state.get_announcement_comments(channel.id, announcement_id)
+            return data['announcementComments']
+
+        announcements = _paginate(
+            fetch_page,
+            cursor=cursor,
+            next_cursor=_oldest_created_at,
+            limit=None,
+            page_size=100,
+            prefetch=self.prefetch,
+        )
+        return self._with_replies(announcements, 'announcement', lambda announcement: announcement['createdAt'], fetch_replies)
+
+    def _events(self, channel: CalendarChannel, cursor: Optional[str]) -> AsyncIterator[_Unit]:
+        state = channel._state
+
+        async def fetch_page(after: Optional[str], limit: int):
+            data = await state.get_calendar_events(channel.id, after=after, limit=limit)
+            return data['calendarEvents']
+
+        async def fetch_replies(event_id: int):
+            data = await state.get_calendar_event_comments(channel.id, event_id)
+            return data['calendarEventComments']
+
+        events = _paginate(
+            fetch_page,
+            cursor=cursor,
+            next_cursor=lambda events: max(event['startsAt'] for event in events),
+            limit=None,
+            page_size=500,
+            prefetch=self.prefetch,
+        )
+        return self._with_replies(events, 'event', lambda event: event['startsAt'], fetch_replies)
+
+    async def _list_items(self, channel: ListChannel, cursor: Optional[int]) -> AsyncIterator[_Unit]:
+        # List items are not paginated, so the cursor is how many of them
+        # have already been written
+        data = await channel._state.get_list_items(channel.id)
+        start = cursor or 0
+        for index, item in enumerate(data['listItems'][start:], start=start + 1):
+            yield index, [('list_item', item)]
+
+    async def _with_replies(
+        self,
+        items: AsyncIterator[Dict[str, Any]],
+        kind: str,
+        cursor_of: Callable[[Dict[str, Any]], str],
+        fetch_replies: Callable[[Any], Awaitable[List[Dict[str, Any]]]],
+    ) -> AsyncIterator[_Unit]:
+        if not self.include_replies:
+            async for item in items:
+                yield cursor_of(item), [(kind, item)]
+            return
+
+        # Keep a small window of reply fetches queued ahead of the item
+        # being written so that they don't serialise behind each other. The
+        # semaphore bounds how many of them run at once across all channels.
+        window: Deque[Tuple[Dict[str, Any], asyncio.Future]] = collections.deque()
+        reply_kind = f'{kind}_reply'
+        semaphore = self._reply_semaphore
+
+        async def limited_fetch(item_id: Any) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await fetch_replies(item_id)
+
+        async def drain_one() -> _Unit:
+            item, replies = window.popleft()
+            records: List[_Record] = [(kind, item)]
+            records.extend((reply_kind, reply) for reply in await replies)
+            return cursor_of(item), records
+
+        try:
+            async for item in items:
+                window.append((item, asyncio.ensure_future(limited_fetch(item['id']))))
+                if len(window) > self.max_reply_concurrency:
+                    yield await drain_one()
+
+            while window:
+                yield await drain_one()
+
+        finally:
+            for _, replies in window:
+                replies.cancel()
+
+
+def _channel_id(channel) -> str:
+    return getattr(channel, '_channel_id', None) or channel.id
+
+
+def _cached_threads(channel) -> List[Any]:
+    server = getattr(channel, 'server', None)
+    if server is None:
+        return []
+    return [thread for thread in server.threads if thread.parent_id == channel.id]
@@ -55,17 +55,18 @@ import asyncio
 import collections.abc
 import inspect
 import sys
+import time
 import traceback
 import importlib.util
 import importlib.machinery
 import types
-from typing import Any, Callable, Iterable, Mapping, List, Dict, Optional, Set, Type, Union
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple, Type, Union
 
 import guilded
 from guilded.events import BaseEvent, MessageEvent
 
 from . import errors
-from .core import Command, Group
+from .core import Command, Group, _CaseInsensitiveDict
 from .context import Context
 from .cog import Cog
 from .help import HelpCommand, DefaultHelpCommand
@@ -124,9 +125,50 @@ def when_mentioned_or(*prefixes: str) -> Callable[[BotBase, guilded.Message], Li
         r = when_mentioned(bot, message) + r
         return r
 
+    # Lets the bot pre-filter messages without calling this
+    inner.__static_prefixes__ = prefixes
     return inner
 
 
+class _PrefixMatcher:
+    """Finds the longest prefix in a fixed set of prefixes that a string
+    starts with.
+
+    Prefixes are bucketed by their first character, longest first, so a
+    match only ever compares against prefixes that could possibly apply.
+    """
+
+    __slots__ = ('prefixes', 'first_characters', '_by_first_character', '_match_empty')
+
+    def __init__(self, prefixes: Tuple[str, ...]):
+        for value in prefixes:
+            if not isinstance(value, str):
+                raise TypeError('Iterable command_prefix or list returned from get_prefix must '
+                                f'contain only strings, not {value.__class__.__name__}')
+
+        self.prefixes: Tuple[str, ...] = prefixes
+        self._match_empty: bool = '' in prefixes
+        self._by_first_character: Dict[str, Tuple[str, ...]] = {}
+
+        buckets: Dict[str, List[str]] = {}
+        for value in set(prefixes):
+            if value:
+                buckets.setdefault(value[0], []).append(value)
+        for character, values in buckets.items():
+            self._by_first_character[character] = tuple(sorted(values, key=len, reverse=True))
+
+        self.first_characters: FrozenSet[str] = frozenset(self._by_first_character)
+
+    def match(self, content: str) -> Optional[str]:
+        for value in self._by_first_character.get(content[:1], ()):
+            if content.startswith(value):
+                return value
+
+        if self._match_empty:
+            return ''
+        return None
+
+
 class _DefaultRepr:
     def __repr__(self):
         return '<default-help-command>'
@@ -147,13 +189,24 @@ class BotBase:
         self.description = inspect.cleandoc(description) if description else ''
         self.__extensions: Dict[str, types.ModuleType] = {}
         self.__cogs: Dict[str, Cog] = {}
-        self._commands = {}
+        # Both indexes are kept up to date by add_command and remove_command
+        # so that resolving an invoker is a single dictionary lookup
+        self.case_insensitive: bool = options.pop('case_insensitive', False)
+        self._commands: Dict[str, Command] = _CaseInsensitiveDict() if self.case_insensitive else {}
+        self.all_commands: Dict[str, Command] = _CaseInsensitiveDict() if self.case_insensitive else {}
         self._checks: List[Check] = []
         self._check_once = []
         self._before_invoke = None
         self._after_invoke = None
         self._help_command = None
         self.strip_after_prefix = options.pop('strip_after_prefix', False)
+        self.prefix_cache_ttl: Optional[float] = options.pop('prefix_cache_ttl', None)
+        # Server ID -> (expiry, prefix) for callable command prefixes
+        self._prefix_cache: Dict[str, Tuple[float, Union[List[str], str]]] = {}
+        self._prefix_matchers: Dict[Tuple[str, ...], _PrefixMatcher] = {}
+        self.messages_examined: int = 0
+        self.messages_prefiltered: int = 0
+        self.commands_invoked: int = 0
         self.owner_id: Optional[str] = options.get('owner_id')
         self.owner_ids: Set[str] = options.get('owner_ids')
         if self.owner_ids is None:
@@ -183,14 +236,7 @@ class BotBase:
 
     @property
     def _commands_by_alias(self):
-        aliases = {}
-        for command in self.commands:
-            aliases = {**{alias: command for alias in command.aliases}, **aliases}
-        return aliases
-
-    @property
-    def all_commands(self):
-        return {**self._commands, **self._commands_by_alias}
+        return {name: command for name, command in self.all_commands.items() if name not in self._commands}
 
     def dispatch(self, event: Union[str, BaseEvent], *args, **kwargs):
         super().dispatch(event, *args, **kwargs)
@@ -219,11 +265,20 @@ class BotBase:
             This command has a duplicate name or alias to one that is already
             registered.
         """
-        if command.name in self._commands.keys():
-            raise errors.CommandRegistrationError(f'A command with the name {command.name} is already registered.')
-        elif command.name in self._commands_by_alias.keys():
-            raise errors.CommandRegistrationError(f'A command with the alias {command.name} is already registered.')
+        if command.name in self.all_commands:
+            raise errors.CommandRegistrationError(command.name)
+
         self._commands[command.name] = command
+        self.all_commands[command.name] = command
+        for alias in command.aliases:
+            existing = self.all_commands.get(alias)
+            if existing is command:
+                # repeats the command's name or an earlier alias
+                continue
+            if existing is not None:
+                self.remove_command(command.name)
+                raise errors.CommandRegistrationError(alias, alias_conflict=True)
+            self.all_commands[alias] = command
 
     def remove_command(self, name: str) -> Optional[Command]:
         """Remove a :class:`.Command` from the internal list of commands.
@@ -241,17 +296,26 @@ class BotBase:
             The command that was removed. If the name is not valid then
             ``None`` is returned instead.
         """
-        command = self._commands.pop(name, self._commands_by_alias.get(name))
+        command = self.all_commands.pop(name, None)
 
         # does not exist
         if command is None:
             return None
 
-        if name in command.aliases:
+        if name not in self._commands:
             # remove only this alias
-            command.aliases.remove(name)
+            if name in command.aliases:
+                command.aliases.remove(name)
             return command
 
+        self._commands.pop(name, None)
+        for alias in command.aliases:
+            cmd = self.all_commands.pop(alias, None)
+            # an alias that conflicted when this command was added belongs
+            # to the pre-existing command, which must keep it
+            if cmd is not None and cmd is not command:
+                self.all_commands[alias] = cmd
+
         return command
 
     def get_command(self, name: str) -> Optional[Command]:
@@ -444,6 +508,12 @@ class BotBase:
         prefix = ret = self.command_prefix
 
         if callable(prefix):
+            server_id = message.server_id
+            if self.prefix_cache_ttl is not None and server_id is not None:
+                cached = self._prefix_cache.get(server_id)
+                if cached is not None and cached[0] > time.monotonic():
+                    return cached[1]
+
             ret = await guilded.utils.maybe_coroutine(prefix, self, message)
 
         if not isinstance(ret, str):
@@ -460,8 +530,44 @@ class BotBase:
                     f'returning either of these, not {ret.__class__.__name__}'
                 )
 
+        if callable(prefix) and self.prefix_cache_ttl is not None and message.server_id is not None:
+            self._prefix_cache[message.server_id] = (time.monotonic() + self.prefix_cache_ttl, ret)
+
         return ret
 
+    def invalidate_prefix(self, server: Optional[guilded.Server] = None, /) -> None:
+        """Discard cached command prefixes so that the next message calls
+        :attr:`.command_prefix` again.
+
+        This only has an effect when ``prefix_cache_ttl`` was passed to the
+        bot. Call it after changing a server's prefix in your own storage.
+
+        .. versionadded:: 1.14
+
+        Parameters
+        -----------
+        server: Optional[:class:`.Server`]
+            The server whose cached prefix to discard. This may be an
+            :class:`.Object`. If not provided, every cached prefix is
+            discarded.
+        """
+        if server is None:
+            self._prefix_cache.clear()
+        else:
+            self._prefix_cache.pop(server.id, None)
+
+    def _get_prefix_matcher(self, prefix: Union[Iterable[str], str]) -> _PrefixMatcher:
+        key = (prefix,) if isinstance(prefix, str) else tuple(prefix)
+        matcher = self._prefix_matchers.get(key)
+        if matcher is None:
+            matcher = _PrefixMatcher(key)
+            if len(self._prefix_matchers) >= 1024:
+                # Per-server prefix sets are rarely more varied than this;
+                # dropping the oldest keeps a misbehaving callable bounded
+                del self._prefix_matchers[next(iter(self._prefix_matchers))]
+            self._prefix_matchers[key] = matcher
+        return matcher
+
     async def get_context(self, message: guilded.ChatMessage, /, *, cls = Context) -> Context:
         view = StringView(str(message.content))
         ctx = cls(prefix=None, view=view, bot=self, message=message)
@@ -470,33 +576,20 @@ class BotBase:
             return ctx
 
         prefix = await self.get_prefix(message)
-        invoked_prefix = prefix
-
-        if isinstance(prefix, str):
-            if not view.skip_string(prefix):
-                return ctx
-        else:
-            try:
-                # if the context class' __init__ consumes something from the view this
-                # will be wrong. That seems unreasonable though.
-                if message.content.startswith(tuple(prefix)):
-                    invoked_prefix = guilded.utils.find(view.skip_string, prefix)
-                else:
-                    return ctx
-
-            except TypeError:
-                if not isinstance(prefix, list):
-                    raise TypeError('get_prefix must return either a string or a list of string, '
-                                    f'not {prefix.__class__.__name__}')
-
-                # It's possible a bad command_prefix got us here.
-                for value in prefix:
-                    if not isinstance(value, str):
-                        raise TypeError('Iterable command_prefix or list returned from get_prefix must '
-                                        f'contain only strings, not {value.__class__.__name__}')
+        try:
+            matcher = self._get_prefix_matcher(prefix)
+        except TypeError:
+            if not isinstance(prefix, collections.abc.Iterable):
+                raise TypeError('get_prefix must return either a string or a list of string, '
+                                f'not {prefix.__class__.__name__}')
+            raise
 
-                # Getting here shouldn't happen
-                raise
+        # if the context class' __init__ consumes something from the view this
+        # will be wrong. That seems unreasonable though.
+        invoked_prefix = matcher.match(view.buffer)
+        if invoked_prefix is None:
+            return ctx
+        view.skip_string(invoked_prefix)
 
         if self.strip_after_prefix:
             view.skip_ws()
@@ -507,8 +600,52 @@ class BotBase:
         ctx.command = self.all_commands.get(invoker)
         return ctx
 
+    def _known_prefixes(self, message: guilded.ChatMessage) -> Optional[Union[Iterable[str], str]]:
+        """Return the prefixes that :meth:`get_prefix` would return for this
+        message if they can be known without calling it, otherwise ``None``."""
+        prefix = self.command_prefix
+        if not callable(prefix):
+            return prefix
+
+        if prefix is when_mentioned:
+            return when_mentioned(self, message)
+
+        static = getattr(prefix, '__static_prefixes__', None)
+        if static is not None:
+            return (*when_mentioned(self, message), *static)
+
+        if self.prefix_cache_ttl is not None and message.server_id is not None:
+            cached = self._prefix_cache.get(message.server_id)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+        return None
+
+    def _could_be_command(self, message: guilded.ChatMessage) -> bool:
+        # Overridden hooks could accept anything, so they are always honoured
+        cls = type(self)
+        if cls.get_prefix is not BotBase.get_prefix or cls.get_context is not BotBase.get_context:
+            return True
+
+        prefix = self._known_prefixes(message)
+        if prefix is None:
+            return True
+
+        try:
+            matcher = self._get_prefix_matcher(prefix)
+        except TypeError:
+            # Let get_context raise the proper error
+            return True
+
+        content = str(message.content)
+        # Most chatter is rejected on its first character alone
+        if not matcher._match_empty and content[:1] not in matcher.first_characters:
+            return False
+        return matcher.match(content) is not None
+
     async def invoke(self, ctx: Context) -> None:
         if ctx.command is not None:
+            self.commands_invoked += 1
             self.dispatch('command', ctx)
             try:
                 if await self.can_run(ctx, call_once=True):
@@ -539,7 +676,9 @@ class BotBase:
         to :meth:`.get_context` followed by a call to :meth:`.invoke`.
 
         This also checks if the message's author is a bot and doesn't call
-        :meth:`.get_context` or :meth:`.invoke` if so.
+        :meth:`.get_context` or :meth:`.invoke` if so. The same goes for
+        messages that cannot start with one of the bot's prefixes, when those
+        prefixes are known without calling :attr:`.command_prefix`.
 
         Parameters
         -----------
@@ -553,6 +692,11 @@ class BotBase:
             # webhook or bot
             return
 
+        self.messages_examined += 1
+        if not self._could_be_command(message):
+            self.messages_prefiltered += 1
+            return
+
         ctx = await self.get_context(message)
         await self.invoke(ctx)
 
@@ -922,6 +1066,10 @@ class Bot(BotBase, guilded.Client):
         The ID of the bot's internal server.
     command_prefix: Union[:class:`list`, :class:`str`]
         The command prefix or list of command prefixes to listen for.
+
+        .. versionchanged:: 1.14
+            When several prefixes match a message, the longest one is used
+            rather than the first one in the list.
     description: Optional[:class:`str`]
         A description of this bot. Will show up in the default help command,
         when it is created.
@@ -933,6 +1081,17 @@ class Bot(BotBase, guilded.Client):
         The users' IDs who own this bot. Used for the
         :meth:`~guilded.ext.commands.is_owner` decorator. Must not be specified
         with ``owner_id``.
+    case_insensitive: :class:`bool`
+        Whether top-level commands should be looked up case insensitively.
+        Defaults to ``False``.
+
+        .. versionadded:: 1.14
+    prefix_cache_ttl: Optional[:class:`float`]
+        How many seconds to cache the result of a callable ``command_prefix``
+        for each server. Use :meth:`.invalidate_prefix` to discard a cached
+        prefix early. Defaults to ``None``, which disables caching.
+
+        .. versionadded:: 1.14
     max_messages: Optional[:class:`int`]
         The maximum number of messages to store in the internal message cache.
         This defaults to ``1000``. Passing in ``None`` disables the message cache.
@@ -945,8 +1104,30 @@ class Bot(BotBase, guilded.Client):
     ------------
     command_prefix: Union[:class:`list`, :class:`str`]
         The command prefix or list of command prefixes to listen for.
+
+        .. versionchanged:: 1.14
+            When several prefixes match a message, the longest one is used
+            rather than the first one in the list.
     commands: :class:`list`
         A list of all the :class:`Command` s registered to this bot.
+    all_commands: Dict[:class:`str`, :class:`Command`]
+        A mapping of every registered command name and alias to its command.
+    messages_examined: :class:`int`
+        The number of messages from users that :meth:`.process_commands`
+        has processed.
+
+        .. versionadded:: 1.14
+    messages_prefiltered: :class:`int`
+        The number of those messages that were rejected without building a
+        :class:`.Context` because they could not start with a prefix.
+
+        .. versionadded:: 1.14
+    commands_invoked: :class:`int`
+        The number of times a command has been invoked.
+
+        .. versionadded:: 1.14
+    case_insensitive: :class:`bool`
+        Whether top-level commands are looked up case insensitively.
     description: Optional[:class:`str`]
         A description of this bot.
     owner_id: Optional[:class:`str`]
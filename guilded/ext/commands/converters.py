@@ -251,7 +251,9 @@ class MemberConverter(GenericIDConverter[guilded.Member]):
     def find_member_named(self, server: guilded.Server, argument: str):
         # Guilded doesn't really have a query-members-through-gateway ability,
         # so instead we just search the internal cache.
-        return _utils_find(lambda m: m.name == argument or m.nick == argument, server.members)
+        if server is None:
+            return None
+        return server.get_member_named(argument)
 
     async def convert(self, ctx: Context, argument: str) -> guilded.Member:
         bot = ctx.bot
@@ -300,7 +302,7 @@ class UserConverter(GenericIDConverter[guilded.User]):
     """
 
     def find_user_named(self, bot: Bot, argument: str):
-        return _utils_find(lambda m: m.name == argument, bot.users)
+        return bot.get_user_named(argument)
 
     async def convert(self, ctx: Context, argument: str) -> guilded.User:
         bot = ctx.bot
@@ -919,9 +921,23 @@ CONVERTER_MAPPING: Dict[Type[Any], Any] = {
 }
 
 
-async def _actual_conversion(ctx: Context, converter, argument: str, param: inspect.Parameter):
+# How _actual_conversion calls a converter
+_CONVERT_BOOL = 0
+_CONVERT_CLASSMETHOD = 1
+_CONVERT_CLASS = 2
+_CONVERT_INSTANCE = 3
+_CONVERT_CALLABLE = 4
+
+# Converter class -> (how to call it, what to call). Converter is a runtime
+# checkable protocol, so classifying one is expensive enough to be worth
+# doing only once per annotation rather than per argument. Instances are
+# not cached since they may be created on the fly.
+_resolved_converters: Dict[type, Tuple[int, Any]] = {}
+
+
+def _resolve_converter(converter: Any) -> Tuple[int, Any]:
     if converter is bool:
-        return _convert_to_bool(argument)
+        return _CONVERT_BOOL, converter
 
     try:
         module = converter.__module__
@@ -931,18 +947,39 @@ async def _actual_conversion(ctx: Context, converter, argument: str, param: insp
         if module is not None and (module.startswith('guilded.') and not module.endswith('converter')):
             converter = CONVERTER_MAPPING.get(converter, converter)
 
-    try:
-        if inspect.isclass(converter) and issubclass(converter, Converter):
-            if inspect.ismethod(converter.convert):
+    if inspect.isclass(converter) and issubclass(converter, Converter):
+        if inspect.ismethod(converter.convert):
+            return _CONVERT_CLASSMETHOD, converter
+        return _CONVERT_CLASS, converter
+    elif isinstance(converter, Converter):
+        return _CONVERT_INSTANCE, converter
+
+    return _CONVERT_CALLABLE, converter
+
+
+async def _actual_conversion(ctx: Context, converter, argument: str, param: inspect.Parameter):
+    resolved = _resolved_converters.get(converter) if isinstance(converter, type) else None
+    if resolved is None:
+        resolved = _resolve_converter(converter)
+        if isinstance(converter, type):
+            _resolved_converters[converter] = resolved
+    kind, converter = resolved
+
+    if kind == _CONVERT_BOOL:
+        return _convert_to_bool(argument)
+
+    if kind != _CONVERT_CALLABLE:
+        try:
+            if kind == _CONVERT_CLASSMETHOD:
                 return await converter.convert(ctx, argument)
-            else:
+            elif kind == _CONVERT_CLASS:
                 return await converter().convert(ctx, argument)
-        elif isinstance(converter, Converter):
-            return await converter.convert(ctx, argument)
-    except CommandError:
-        raise
-    except Exception as exc:
-        raise ConversionError(converter, exc) from exc
+            else:
+                return await converter.convert(ctx, argument)
+        except CommandError:
+            raise
+        except Exception as exc:
+            raise ConversionError(converter, exc) from exc
 
     try:
         return converter(argument)
@@ -52,8 +52,10 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 
-from typing import Any, Callable, Deque, Dict, Optional, Union, Generic, TypeVar, TYPE_CHECKING
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union, Generic, TypeVar, TYPE_CHECKING
 from guilded.enums import Enum
+import heapq
+import itertools
 import time
 import asyncio
 from collections import deque
@@ -240,12 +242,19 @@ class CooldownMapping(Generic[T_contra]):
             raise TypeError('Cooldown type must be a BucketType or callable')
 
         self._cache: Dict[Any, Cooldown] = {}
+        # (expiry, tiebreaker, key) for every cached bucket. An entry's
+        # expiry may be stale since buckets are used after being queued, so
+        # it is only a lower bound that is checked again once reached.
+        self._expiry: List[Tuple[float, int, Any]] = []
+        self._counter = itertools.count()
         self._cooldown: Optional[Cooldown] = original
         self._type: Callable[[T_contra], Any] = type
 
     def copy(self) -> CooldownMapping[T_contra]:
         ret = CooldownMapping(self._cooldown, self._type)
         ret._cache = self._cache.copy()
+        ret._expiry = self._expiry.copy()
+        ret._counter = itertools.count(next(self._counter))
         return ret
 
     @property
@@ -266,11 +275,23 @@ class CooldownMapping(Generic[T_contra]):
     def _verify_cache_integrity(self, current: Optional[float] = None) -> None:
         # we want to delete all cache objects that haven't been used
         # in a cooldown window. e.g. if we have a  command that has a
-        # cooldown of 60s and it has not been used in 60s then that key should be deleted
+        # cooldown of 60s and it has not been used in 60s then that key should be deleted.
+        # Only buckets whose queued expiry has passed are looked at, so this
+        # is amortised O(log n) rather than a scan of every bucket.
         current = current or time.time()
-        dead_keys = [k for k, v in self._cache.items() if current > v._last + v.per]
-        for k in dead_keys:
-            del self._cache[k]
+        expiry = self._expiry
+        while expiry and expiry[0][0] < current:
+            _, _, key = heapq.heappop(expiry)
+            bucket = self._cache.get(key)
+            if bucket is None:
+                continue
+
+            expires_at = bucket._last + bucket.per
+            if current > expires_at:
+                del self._cache[key]
+            else:
+                # Used since it was queued; check again once it may be dead
+                heapq.heappush(expiry, (expires_at, next(self._counter), key))
 
     def create_bucket(self, message: T_contra) -> Cooldown:
         return self._cooldown.copy()  # type: ignore
@@ -285,6 +306,7 @@ class CooldownMapping(Generic[T_contra]):
             bucket = self.create_bucket(message)
             if bucket is not None:
                 self._cache[key] = bucket
+                heapq.heappush(self._expiry, ((current or time.time()) + bucket.per, next(self._counter), key))
         else:
             bucket = self._cache[key]
 
@@ -309,6 +331,8 @@ class DynamicCooldownMapping(CooldownMapping[T_contra]):
     def copy(self) -> DynamicCooldownMapping[T_contra]:
         ret = DynamicCooldownMapping(self._factory, self._type)
         ret._cache = self._cache.copy()
+        ret._expiry = self._expiry.copy()
+        ret._counter = itertools.count(next(self._counter))
         return ret
 
     @property
@@ -346,32 +370,47 @@ class _Semaphore:
         return self.value == 0
 
     def is_active(self) -> bool:
-        return len(self._waiters) > 0
+        return any(not future.done() for future in self._waiters)
 
     def wake_up(self) -> None:
         while self._waiters:
             future = self._waiters.popleft()
             if not future.done():
+                # The slot is handed to the woken waiter right away so that
+                # nothing can take it (or discard this semaphore) before
+                # that waiter gets to run again
+                self.value -= 1
                 future.set_result(None)
                 return
 
     async def acquire(self, *, wait: bool = False) -> bool:
-        if not wait and self.value <= 0:
+        if self.value > 0:
+            self.value -= 1
+            return True
+
+        if not wait:
             # signal that we're not acquiring
             return False
 
-        while self.value <= 0:
-            future = self.loop.create_future()
-            self._waiters.append(future)
-            try:
-                await future
-            except:
+        future = self.loop.create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except:
+            if future.done() and not future.cancelled():
+                # We were handed the slot but cancelled before we could use
+                # it, so pass it on
+                self.release()
+            else:
                 future.cancel()
-                if self.value > 0 and not future.cancelled():
-                    self.wake_up()
-                raise
+                # Don't leave a dead waiter behind to keep this semaphore
+                # looking active
+                try:
+                    self._waiters.remove(future)
+                except ValueError:
+                    pass
+            raise
 
-        self.value -= 1
         return True
 
     def release(self) -> None:
@@ -411,7 +450,13 @@ class MaxConcurrency:
         except KeyError:
             self._mapping[key] = sem = _Semaphore(self.number)
 
-        acquired = await sem.acquire(wait=self.wait)
+        try:
+            acquired = await sem.acquire(wait=self.wait)
+        except BaseException:
+            # A cancelled waiter may have been the only reason to keep it
+            self._discard_if_idle(key, sem)
+            raise
+
         if not acquired:
             raise MaxConcurrencyReached(self.number, self.per)
 
@@ -428,5 +473,8 @@ class MaxConcurrency:
         else:
             sem.release()
 
-        if sem.value >= self.number and not sem.is_active():
+        self._discard_if_idle(key, sem)
+
+    def _discard_if_idle(self, key: Any, sem: _Semaphore) -> None:
+        if sem.value >= self.number and not sem.is_active() and self._mapping.get(key) is sem:
             del self._mapping[key]
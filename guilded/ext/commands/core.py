@@ -170,6 +170,64 @@ class _AttachmentIterator:
         return self.index >= len(self.data)
 
 
+_POSITIONAL_OR_KEYWORD = inspect.Parameter.POSITIONAL_OR_KEYWORD
+_POSITIONAL_ONLY = inspect.Parameter.POSITIONAL_ONLY
+_KEYWORD_ONLY = inspect.Parameter.KEYWORD_ONLY
+_VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
+
+
+def _is_typing_optional(annotation: Union[T, Optional[T]]) -> bool:
+    return getattr(annotation, '__origin__', None) is Union and type(None) in annotation.__args__  # type: ignore
+
+
+# How a Greedy[...] parameter consumes its arguments
+_GREEDY_ATTACHMENTS = 1
+_GREEDY_POSITIONAL = 2
+_GREEDY_VAR_POSITIONAL = 3
+
+
+class _ParameterPlan:
+    """Everything about a parameter that :meth:`Command.transform` needs,
+    resolved once rather than on every invocation."""
+
+    __slots__ = (
+        'name',
+        'param',
+        'kind',
+        'converter',
+        'raw_converter',
+        'required',
+        'optional',
+        'optional_attachment',
+        'greedy',
+    )
+
+    def __init__(self, param: inspect.Parameter):
+        self.name: str = param.name
+        self.param: inspect.Parameter = param
+        self.kind = param.kind
+        self.required: bool = param.default is param.empty
+        self.raw_converter: Any = get_converter(param)
+        self.optional: bool = _is_typing_optional(param.annotation)
+        self.optional_attachment: bool = self.optional and param.annotation.__args__[0] is guilded.Attachment
+
+        converter = self.raw_converter
+        self.greedy: Optional[int] = None
+        if isinstance(converter, Greedy):
+            if converter.converter is guilded.Attachment:
+                self.greedy = _GREEDY_ATTACHMENTS
+            elif param.kind in (param.POSITIONAL_OR_KEYWORD, param.POSITIONAL_ONLY):
+                self.greedy = _GREEDY_POSITIONAL
+            elif param.kind == param.VAR_POSITIONAL:
+                self.greedy = _GREEDY_VAR_POSITIONAL
+            # if we're here, then it's a KEYWORD_ONLY param type
+            # since this is mostly useless, we'll helpfully transform Greedy[X]
+            # into just X and do the parsing that way.
+            converter = converter.converter
+
+        self.converter: Any = converter
+
+
 class Command(_BaseCommand):
     _before_invoke = None
     _after_invoke = None
@@ -272,6 +330,8 @@ class Command(_BaseCommand):
     def callback(self, function):
         self._callback = function
         self.module = function.__module__
+        # (has cog, plan), compiled on first use since the cog is not known yet
+        self._parse_plan: Optional[typing.Tuple[bool, typing.Tuple[_ParameterPlan, ...]]] = None
 
         signature = inspect.signature(function)
         self.params = signature.parameters.copy()
@@ -471,7 +531,7 @@ class Command(_BaseCommand):
             return await self.callback(*args, **kwargs)
 
     def _is_typing_optional(self, annotation: Union[T, Optional[T]]) -> bool:
-        return getattr(annotation, '__origin__', None) is Union and type(None) in annotation.__args__  # type: ignore
+        return _is_typing_optional(annotation)
 
     async def _transform_greedy_pos(self, ctx: Context, param: inspect.Parameter, required: bool, converter: Any) -> Any:
         view = ctx.view
@@ -507,30 +567,24 @@ class Command(_BaseCommand):
             return value
 
     async def transform(self, ctx: Context, param: inspect.Parameter, attachments: _AttachmentIterator):
-        required = param.default is param.empty
-        converter = get_converter(param)
-        consume_rest_is_special = (
-            param.kind == param.KEYWORD_ONLY and not self.rest_is_raw
-        )
+        return await self._transform(ctx, _ParameterPlan(param), attachments)
+
+    async def _transform(self, ctx: Context, plan: _ParameterPlan, attachments: _AttachmentIterator):
+        param = plan.param
+        converter = plan.converter
         view = ctx.view
         view.skip_ws()
 
         # The greedy converter is simple -- it keeps going until it fails in which case,
         # it undos the view ready for the next parameter to use instead
-        if isinstance(converter, Greedy):
+        greedy = plan.greedy
+        if greedy is not None:
             # Special case to consume the entire attachments list in the case of Greedy[Attachment]
-            if converter.converter is guilded.Attachment:
+            if greedy == _GREEDY_ATTACHMENTS:
                 return list(attachments)
-
-            if param.kind in (param.POSITIONAL_OR_KEYWORD, param.POSITIONAL_ONLY):
-                return await self._transform_greedy_pos(ctx, param, required, converter.converter)
-            elif param.kind == param.VAR_POSITIONAL:
-                return await self._transform_greedy_var_pos(ctx, param, converter.converter)
-            else:
-                # if we're here, then it's a KEYWORD_ONLY param type
-                # since this is mostly useless, we'll helpfully transform Greedy[X]
-                # into just X and do the parsing that way.
-                converter = converter.converter
+            if greedy == _GREEDY_POSITIONAL:
+                return await self._transform_greedy_pos(ctx, param, plan.required, converter)
+            return await self._transform_greedy_var_pos(ctx, param, converter)
 
         if converter is guilded.Attachment:
             try:
@@ -538,24 +592,24 @@ class Command(_BaseCommand):
             except StopIteration:
                 raise MissingRequiredAttachment(param)
 
-        if self._is_typing_optional(param.annotation) and param.annotation.__args__[0] is guilded.Attachment:
+        if plan.optional_attachment:
             if attachments.is_empty():
                 # I have no idea who would be doing Optional[Attachment] = 1
                 # but for those cases then 1 should be returned instead of None
-                return None if param.default is param.empty else param.default
+                return None if plan.required else param.default
             return next(attachments)
 
         if view.eof:
-            if param.kind == param.VAR_POSITIONAL:
+            if plan.kind == param.VAR_POSITIONAL:
                 raise RuntimeError()  # break the loop
-            if required:
-                if self._is_typing_optional(param.annotation):
+            if plan.required:
+                if plan.optional:
                     return None
                 raise MissingRequiredArgument(param)
             return param.default
 
         previous = view.index
-        if consume_rest_is_special:
+        if plan.kind == param.KEYWORD_ONLY and not self.rest_is_raw:
             argument = view.read_rest().strip()
         else:
             argument = view.get_quoted_word()
@@ -563,17 +617,14 @@ class Command(_BaseCommand):
 
         return await run_converters(ctx, converter, argument, param)
 
-    async def _parse_arguments(self, ctx: Context):
-        ctx.args = [ctx] if self.cog is None else [self.cog, ctx]
-        ctx.kwargs = {}
-        args = ctx.args
-        kwargs = ctx.kwargs
-        attachments = _AttachmentIterator(ctx.message.attachments)
-
-        view = ctx.view
-        iterator = iter(self.params.items())
+    def _get_parse_plan(self) -> typing.Tuple[_ParameterPlan, ...]:
+        has_cog = self.cog is not None
+        cached = self._parse_plan
+        if cached is not None and cached[0] is has_cog:
+            return cached[1]
 
-        if self.cog is not None:
+        iterator = iter(self.params.values())
+        if has_cog:
             # we have 'self' as the first parameter so just advance
             # the iterator and resume parsing
             try:
@@ -589,27 +640,46 @@ class Command(_BaseCommand):
             fmt = 'Callback for {0.name} command is missing "ctx" parameter.'
             raise guilded.ClientException(fmt.format(self))
 
-        for name, param in iterator:
-            if param.kind in (param.POSITIONAL_OR_KEYWORD, param.POSITIONAL_ONLY):
-                transformed = await self.transform(ctx, param, attachments)
+        plan = []
+        for param in iterator:
+            plan.append(_ParameterPlan(param))
+            if param.kind == param.KEYWORD_ONLY:
+                # Nothing after a consume-rest parameter is ever parsed
+                break
+
+        self._parse_plan = (has_cog, tuple(plan))
+        return self._parse_plan[1]
+
+    async def _parse_arguments(self, ctx: Context):
+        plan = self._get_parse_plan()
+        ctx.args = [ctx] if self.cog is None else [self.cog, ctx]
+        ctx.kwargs = {}
+        args = ctx.args
+        kwargs = ctx.kwargs
+        attachments = _AttachmentIterator(ctx.message.attachments)
+
+        view = ctx.view
+        for step in plan:
+            kind = step.kind
+            if kind is _POSITIONAL_OR_KEYWORD or kind is _POSITIONAL_ONLY:
+                transformed = await self._transform(ctx, step, attachments)
                 args.append(transformed)
 
-            elif param.kind == param.KEYWORD_ONLY:
+            elif kind is _KEYWORD_ONLY:
                 # kwarg only param denotes "consume rest" semantics
                 if self.rest_is_raw:
-                    converter = get_converter(param)
                     argument = view.read_rest()
-                    kwargs[name] = await run_converters(ctx, converter, argument, param)
+                    kwargs[step.name] = await run_converters(ctx, step.raw_converter, argument, step.param)
                 else:
-                    kwargs[name] = await self.transform(ctx, param, attachments)
+                    kwargs[step.name] = await self._transform(ctx, step, attachments)
                 break
 
-            elif param.kind == param.VAR_POSITIONAL:
+            elif kind is _VAR_POSITIONAL:
                 if view.eof and self.require_var_positional:
-                    raise MissingRequiredArgument(param)
+                    raise MissingRequiredArgument(step.param)
                 while not view.eof:
                     try:
-                        transformed = await self.transform(ctx, param, attachments)
+                        transformed = await self._transform(ctx, step, attachments)
                         args.append(transformed)
                     except RuntimeError:
                         break
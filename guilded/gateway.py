@@ -236,7 +236,9 @@ class GuildedWebSocket:
             should_fill = False
             try:
                 server = await self.client.getch_server(d['serverId'])
-                should_fill = len(server.members) == 0
+                # Don't repeatedly fill servers whose members are all
+                # excluded by the member cache policy
+                should_fill = len(server.members) == 0 and not server._members_filled
             except HTTPException as exc:
                 # This shouldn't happen
                 log.warn(
@@ -278,7 +280,8 @@ class GuildedWebSocket:
             # Edge case for being provided a server
             # despite no longer being a member of it
             if server and t != 'BotServerMembershipDeleted':
-                if should_fill:
+                server._last_activity = time.monotonic()
+                if should_fill and self.client.http._member_cache_policy.enabled:
                     await server.fill_members()
 
                 self.client.http.add_to_server_cache(server)
@@ -485,7 +488,7 @@ class WebSocketEventParsers:
                 'serverId': server.id,
                 **data['member'],
             })
-            server._members[member.id] = member
+            self._state.add_to_member_cache(member)
             self.client.dispatch('member_join', member)
 
     async def parse_server_member_removed(self, data: gw.ServerMemberRemovedEvent):
@@ -506,7 +509,7 @@ class WebSocketEventParsers:
                 if not data.get('isKick') and not data.get('isBan'):
                     self.client.dispatch('member_leave', member)
 
-                server._members.pop(data['userId'], None)
+                self._state.remove_from_member_cache(server.id, data['userId'])
 
     async def parse_server_member_banned(self, data: gw.ServerMemberBanEvent):
         if self._exp_style:
@@ -549,6 +552,14 @@ class WebSocketEventParsers:
 
     async def parse_server_roles_updated(self, data: gw.ServerRolesUpdatedEvent):
         if self._exp_style:
+            if data.get('rolesById'):
+                server = self.client.get_server(data['serverId'])
+                if server is not None:
+                    server._prune_role_member_ids({
+                        int(role_id) for role_id in data['rolesById'] if role_id.isdigit()
+                    })
+                    server._resolved_permissions.clear()
+
             if data.get('memberRoleIds'):
                 event = ev.BulkMemberRolesUpdateEvent(self._state, data)
                 self.client.dispatch(event)
@@ -591,6 +602,10 @@ class WebSocketEventParsers:
                         role = Role(state=self._state, data=updated)
                         server._roles[role.id] = role
 
+                server._prune_role_member_ids(server._roles)
+
+                server._resolved_permissions.clear()
+
     async def parse_server_member_social_link_created(self, data: gw.ServerMemberSocialLinkEvent):
         if self._exp_style:
             event = ev.MemberSocialLinkCreateEvent(self._state, data)
@@ -832,7 +847,7 @@ class WebSocketEventParsers:
         else:
             server = self.client.get_server(data['serverId'])
             channel = self._state.create_channel(data=data['channel'], server=server)
-            channel.server._channels.pop(channel.id, None)
+            self._state.remove_from_server_channel_cache(data['serverId'], channel.id)
             self.client.dispatch('server_channel_delete', channel)
 
     async def parse_channel_archived(self, data: gw.ServerChannelEvent):
@@ -922,110 +937,194 @@ class WebSocketEventParsers:
             self.client.dispatch(event)
 
     async def parse_channel_role_permission_created(self, data: gw.ChannelRolePermissionEvent):
+        server = self.client.get_server(data['serverId'])
+        if server is not None:
+            server._update_override(
+                channel_id=data['channelRolePermission']['channelId'],
+                role_id=data['channelRolePermission']['roleId'],
+                permissions=data['channelRolePermission']['permissions'],
+            )
+
         if self._exp_style:
             event = ev.ChannelRoleOverrideCreateEvent(self._state, data)
             self.client.dispatch(event)
         else:
-            server = self.client.get_server(data['serverId'])
             override = ChannelRoleOverride(data=data['channelRolePermission'], server=server)
             self.client.dispatch('channel_role_override_create', override)
 
     async def parse_channel_role_permission_updated(self, data: gw.ChannelRolePermissionEvent):
+        server = self.client.get_server(data['serverId'])
+        if server is not None:
+            server._update_override(
+                channel_id=data['channelRolePermission']['channelId'],
+                role_id=data['channelRolePermission']['roleId'],
+                permissions=data['channelRolePermission']['permissions'],
+            )
+
         if self._exp_style:
             event = ev.ChannelRoleOverrideUpdateEvent(self._state, data)
             self.client.dispatch(event)
         else:
-            server = self.client.get_server(data['serverId'])
             override = ChannelRoleOverride(data=data['channelRolePermission'], server=server)
             self.client.dispatch('raw_channel_role_override_update', override)
 
     async def parse_channel_role_permission_deleted(self, data: gw.ChannelRolePermissionEvent):
+        server = self.client.get_server(data['serverId'])
+        if server is not None:
+            server._update_override(
+                channel_id=data['channelRolePermission']['channelId'],
+                role_id=data['channelRolePermission']['roleId'],
+                permissions=None,
+            )
+
         if self._exp_style:
             event = ev.ChannelRoleOverrideDeleteEvent(self._state, data)
             self.client.dispatch(event)
         else:
-            server = self.client.get_server(data['serverId'])
             override = ChannelRoleOverride(data=data['channelRolePermission'], server=server)
             self.client.dispatch('channel_role_override_delete', override)
 
     async def parse_channel_user_permission_created(self, data: gw.ChannelUserPermissionEvent):
+        server = self.client.get_server(data['serverId'])
+        if server is not None:
+            server._update_override(
+                channel_id=data['channelUserPermission']['channelId'],
+                user_id=data['channelUserPermission']['userId'],
+                permissions=data['channelUserPermission']['permissions'],
+            )
+
         if self._exp_style:
             event = ev.ChannelUserOverrideCreateEvent(self._state, data)
             self.client.dispatch(event)
         else:
-            server = self.client.get_server(data['serverId'])
             override = ChannelUserOverride(data=data['channelUserPermission'], server=server)
             self.client.dispatch('channel_user_override_create', override)
 
     async def parse_channel_user_permission_updated(self, data: gw.ChannelUserPermissionEvent):
+        server = self.client.get_server(data['serverId'])
+        if server is not None:
+            server._update_override(
+                channel_id=data['channelUserPermission']['channelId'],
+                user_id=data['channelUserPermission']['userId'],
+                permissions=data['channelUserPermission']['permissions'],
+            )
+
         if self._exp_style:
             event = ev.ChannelUserOverrideUpdateEvent(self._state, data)
             self.client.dispatch(event)
         else:
-            server = self.client.get_server(data['serverId'])
             override = ChannelUserOverride(data=data['channelUserPermission'], server=server)
             self.client.dispatch('raw_channel_user_override_update', override)
 
     async def parse_channel_user_permission_deleted(self, data: gw.ChannelUserPermissionEvent):
+        server = self.client.get_server(data['serverId'])
+        if server is not None:
+            server._update_override(
+                channel_id=data['channelUserPermission']['channelId'],
+                user_id=data['channelUserPermission']['userId'],
+                permissions=None,
+            )
+
         if self._exp_style:
             event = ev.ChannelUserOverrideDeleteEvent(self._state, data)
             self.client.dispatch(event)
         else:
-            server = self.client.get_server(data['serverId'])
             override = ChannelUserOverride(data=data['channelUserPermission'], server=server)
             self.client.dispatch('channel_user_override_delete', override)
 
     async def parse_channel_category_role_permission_created(self, data: gw.ChannelCategoryRolePermissionEvent):
+        server = self.client.get_server(data['serverId'])
+        if server is not None:
+            server._update_override(
+                category_id=data['channelCategoryRolePermission']['categoryId'],
+                role_id=data['channelCategoryRolePermission']['roleId'],
+                permissions=data['channelCategoryRolePermission']['permissions'],
+            )
+
         if self._exp_style:
             event = ev.CategoryRoleOverrideCreateEvent(self._state, data)
             self.client.dispatch(event)
         else:
-            server = self.client.get_server(data['serverId'])
             override = CategoryRoleOverride(data=data['channelCategoryRolePermission'], server=server)
             self.client.dispatch('category_role_override_create', override)
 
     async def parse_channel_category_role_permission_updated(self, data: gw.ChannelCategoryRolePermissionEvent):
+        server = self.client.get_server(data['serverId'])
+        if server is not None:
+            server._update_override(
+                category_id=data['channelCategoryRolePermission']['categoryId'],
+                role_id=data['channelCategoryRolePermission']['roleId'],
+                permissions=data['channelCategoryRolePermission']['permissions'],
+            )
+
         if self._exp_style:
             event = ev.CategoryRoleOverrideUpdateEvent(self._state, data)
             self.client.dispatch(event)
         else:
-            server = self.client.get_server(data['serverId'])
             override = CategoryRoleOverride(data=data['channelCategoryRolePermission'], server=server)
             self.client.dispatch('raw_category_role_override_update', override)
 
     async def parse_channel_category_role_permission_deleted(self, data: gw.ChannelCategoryRolePermissionEvent):
+        server = self.client.get_server(data['serverId'])
+        if server is not None:
+            server._update_override(
+                category_id=data['channelCategoryRolePermission']['categoryId'],
+                role_id=data['channelCategoryRolePermission']['roleId'],
+                permissions=None,
+            )
+
         if self._exp_style:
             event = ev.CategoryRoleOverrideDeleteEvent(self._state, data)
             self.client.dispatch(event)
         else:
-            server = self.client.get_server(data['serverId'])
             override = CategoryRoleOverride(data=data['channelCategoryRolePermission'], server=server)
             self.client.dispatch('category_role_override_delete', override)
 
     async def parse_channel_category_user_permission_created(self, data: gw.ChannelCategoryUserPermissionEvent):
+        server = self.client.get_server(data['serverId'])
+        if server is not None:
+            server._update_override(
+                category_id=data['channelCategoryUserPermission']['categoryId'],
+                user_id=data['channelCategoryUserPermission']['userId'],
+                permissions=data['channelCategoryUserPermission']['permissions'],
+            )
+
         if self._exp_style:
             event = ev.CategoryUserOverrideCreateEvent(self._state, data)
             self.client.dispatch(event)
         else:
-            server = self.client.get_server(data['serverId'])
             override = CategoryUserOverride(data=data['channelCategoryUserPermission'], server=server)
             self.client.dispatch('category_user_override_create', override)
 
     async def parse_channel_category_user_permission_updated(self, data: gw.ChannelCategoryUserPermissionEvent):
+        server = self.client.get_server(data['serverId'])
+        if server is not None:
+            server._update_override(
+                category_id=data['channelCategoryUserPermission']['categoryId'],
+                user_id=data['channelCategoryUserPermission']['userId'],
+                permissions=data['channelCategoryUserPermission']['permissions'],
+            )
+
         if self._exp_style:
             event = ev.CategoryUserOverrideUpdateEvent(self._state, data)
             self.client.dispatch(event)
         else:
-            server = self.client.get_server(data['serverId'])
             override = CategoryUserOverride(data=data['channelCategoryUserPermission'], server=server)
             self.client.dispatch('raw_category_user_override_update', override)
 
     async def parse_channel_category_user_permission_deleted(self, data: gw.ChannelCategoryUserPermissionEvent):
+        server = self.client.get_server(data['serverId'])
+        if server is not None:
+            server._update_override(
+                category_id=data['channelCategoryUserPermission']['categoryId'],
+                user_id=data['channelCategoryUserPermission']['userId'],
+                permissions=None,
+            )
+
         if self._exp_style:
             event = ev.CategoryUserOverrideDeleteEvent(self._state, data)
             self.client.dispatch(event)
         else:
-            server = self.client.get_server(data['serverId'])
             override = CategoryUserOverride(data=data['channelCategoryUserPermission'], server=server)
             self.client.dispatch('category_user_override_delete', override)
 
@@ -59,10 +59,11 @@ from collections.abc import Iterable
 import datetime
 import json
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Sequence, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from . import __version__, channel
 from .abc import ServerChannel
+from .cache import CachePolicy, MemberCachePolicy, ServerCacheStats, _CacheStore, _NameIndex, _ServerStub
 from .embed import Embed
 from .enums import try_enum, ChannelType
 from .errors import BadRequest, Forbidden, GuildedServerError, HTTPException, ImATeapot, NotFound
@@ -219,12 +220,37 @@ class Route:
 
         self.url = self.BASE + path
 
+    @property
+    def bucket(self) -> str:
+        """The key that this route's rate limit is tracked under.
+
+        Object IDs after the first (the major parameter, e.g. the channel)
+        are masked so that, for example, deleting different messages in
+        one channel shares a single budget.
+        """
+        segments = self.path.split('?', 1)[0].split('/')
+        for index in range(4, len(segments), 2):
+            segments[index] = '{}'
+        return f'{self.method} {self.BASE}{"/".join(segments)}'
+
 
 class HTTPClientBase:
     GIL_ID = 'Ann6LewA'
-    def __init__(self, *, max_messages: int = 1000, features: Optional[ClientFeatures] = None):
+    def __init__(
+        self,
+        *,
+        max_messages: int = 1000,
+        features: Optional[ClientFeatures] = None,
+        member_cache_policy: Optional[MemberCachePolicy] = None,
+        user_cache_policy: Optional[CachePolicy] = None,
+        dm_channel_cache_policy: Optional[CachePolicy] = None,
+        name_index: bool = False,
+    ):
         self.session: Optional[aiohttp.ClientSession] = None
         self._max_messages = max_messages
+        self._member_cache_policy: MemberCachePolicy = member_cache_policy or MemberCachePolicy.all()
+        self._user_cache_policy: CachePolicy = user_cache_policy or CachePolicy.all()
+        self._dm_channel_cache_policy: CachePolicy = dm_channel_cache_policy or CachePolicy.all()
         self._experimental_event_style = features.experimental_event_style if features else False
         self._auto_sign = features.auto_sign if features else True
 
@@ -232,13 +258,36 @@ class HTTPClientBase:
         self.user: Optional[ClientUser] = None
         self.my_id: Optional[str] = None
         self.cdn_qs: Optional[str] = None
-
-        self._users = {}
+        # A gateway cursor restored from a cache snapshot, used for the
+        # first connection only
+        self._resume_cursor: Optional[str] = None
+        # Requests made by Mentions.fill that are still in flight, shared
+        # between concurrent fills
+        self._mention_fetches: Dict[Tuple[Any, ...], asyncio.Future] = {}
+
+        self._users = self._user_cache_policy._create_store(on_evict=self._on_user_evicted)
+        # Casefolded name indexes, if enabled. Each server keeps its own
+        # index of member names and nicknames.
+        self._name_index: bool = name_index
+        self._user_names: Optional[_NameIndex] = _NameIndex() if name_index else None
         self._servers = {}
-        self._messages = {}
+        # Messages are evicted in the order they were received
+        self._messages = _CacheStore(max_size=max_messages, lru=False)
+
+        # Global indexes over every server's channels and emotes. These are
+        # maintained alongside each server's own cache so that ID lookups do
+        # not have to walk every server.
+        self._all_server_channels: Dict[str, ServerChannel] = {}
+        self._emotes: Dict[int, Emote] = {}
 
         self._threads = {}
-        self._dm_channels = {}
+        self._dm_channels = self._dm_channel_cache_policy._create_store()
+
+        # Idle servers that have been demoted to a stub, see demote_server
+        self._demoted_servers: Dict[str, _ServerStub] = {}
+        self._rehydrations: int = 0
+        self._last_rehydration_latency: Optional[float] = None
+        self._total_rehydration_latency: float = 0.0
 
     async def close(self) -> None:
         if self.session:
@@ -271,14 +320,6 @@ class HTTPClientBase:
         if self._get_server(server_id):
             return self._get_server(server_id).get_category(category_id)
 
-    @property
-    def _all_server_channels(self) -> Dict[str, ServerChannel]:
-        all_channels = {}
-        for server in self._servers.values():
-            all_channels = {**all_channels, **server._channels}
-
-        return all_channels
-
     def _get_global_server_channel(self, channel_id: str) -> Optional[ServerChannel]:
         return self._all_server_channels.get(channel_id)
 
@@ -294,14 +335,6 @@ class HTTPClientBase:
         if self._get_server(server_id):
             return self._get_server(server_id).get_role(role_id)
 
-    @property
-    def _emotes(self) -> Dict[int, Emote]:
-        emotes = {}
-        for server in self._servers.values():
-            emotes = {**emotes, **server._emotes}
-
-        return emotes
-
     def _get_emote(self, id) -> Optional[Emote]:
         return self._emotes.get(id)
 
@@ -309,41 +342,145 @@ class HTTPClientBase:
         if self._max_messages is None:
             return
         self._messages[message.id] = message
-        while len(self._messages) > self._max_messages:
-            del self._messages[list(self._messages.keys())[0]]
+
+    def _index_server(self, server: Server) -> None:
+        self._all_server_channels.update(server._channels)
+        self._emotes.update(server._emotes)
+
+    def _unindex_server(self, server: Server) -> None:
+        for channel_id in server._channels:
+            self._all_server_channels.pop(channel_id, None)
+        for emote_id in server._emotes:
+            self._emotes.pop(emote_id, None)
 
     def add_to_server_cache(self, server: Server):
+        previous = self._servers.get(server.id)
+        if previous is server:
+            return
+
+        if previous is not None:
+            self._unindex_server(previous)
         self._servers[server.id] = server
+        self._demoted_servers.pop(server.id, None)
+        self._index_server(server)
 
     def remove_from_server_cache(self, server_id: str):
-        self._servers.pop(server_id, None)
+        server = self._servers.pop(server_id, None)
+        if server is not None:
+            self._unindex_server(server)
+        self._demoted_servers.pop(server_id, None)
+
+    def demote_server(self, server_id: str) -> None:
+        """Drop a server's full state from the cache, keeping only a stub
+        so that it can be rehydrated later."""
+        server = self._servers.pop(server_id, None)
+        if server is None:
+            return
+
+        self._unindex_server(server)
+        self._demoted_servers[server_id] = _ServerStub(server)
+        log.debug('Demoted idle server %s', server_id)
+
+    def _is_demoted(self, server_id: str) -> bool:
+        return server_id in self._demoted_servers
+
+    def _record_rehydration(self, latency: float) -> None:
+        self._rehydrations += 1
+        self._last_rehydration_latency = latency
+        self._total_rehydration_latency += latency
+
+    @property
+    def server_cache_stats(self) -> ServerCacheStats:
+        return ServerCacheStats(
+            resident=len(self._servers),
+            demoted=len(self._demoted_servers),
+            rehydrations=self._rehydrations,
+            last_rehydration_latency=self._last_rehydration_latency,
+            total_rehydration_latency=self._total_rehydration_latency,
+        )
+
+    @property
+    def _cache_sweep_interval(self) -> Optional[float]:
+        # How often _sweep_caches should run, if any cache expires items
+        periods = [
+            period
+            for period in (
+                self._user_cache_policy.ttl,
+                self._dm_channel_cache_policy.ttl,
+                self._member_cache_policy.expire_after,
+                self._member_cache_policy.active_within,
+            )
+            if period is not None
+        ]
+        if not periods:
+            return None
+        # Check a few times per period, but not excessively often
+        return min(max(min(periods) / 4, 1.0), 60.0)
+
+    def _sweep_caches(self) -> None:
+        """Evict expired users, DM channels and members, and the members of
+        servers that are no longer active under the member cache policy,
+        even if nothing has read from those caches since they expired."""
+        for store in (self._users, self._dm_channels):
+            if isinstance(store, _CacheStore):
+                store._expire()
+
+        policy = self._member_cache_policy
+        for server in self._servers.values():
+            if isinstance(server._members, _CacheStore):
+                server._members._expire()
+
+            if not policy._is_active(server):
+                for member_id in [member_id for member_id in dict.keys(server._members) if member_id != self.my_id]:
+                    server._remove_member(member_id)
 
     def add_to_member_cache(self, member: Member):
         server = member.server or self._get_server(member.server_id)
         if server:
-            server._members[member.id] = member
+            if self._member_cache_policy._should_cache(member, server):
+                server._add_member(member)
+            else:
+                # The member may have been cached before it stopped
+                # satisfying the policy, e.g. after losing a role
+                server._remove_member(member.id)
 
     def remove_from_member_cache(self, server_id: str, member_id: str):
         if self._get_server(server_id):
-            self._get_server(server_id)._members.pop(member_id, None)
+            self._get_server(server_id)._remove_member(member_id)
 
     def add_to_role_cache(self, role: Role):
         server = role.server
         if server:
+            previous = server._roles.get(role.id)
             server._roles[role.id] = role
+            if previous is None or previous._permissions != role._permissions:
+                server._invalidate_role_permissions(role)
 
     def remove_from_role_cache(self, server_id: str, role_id: int):
-        if self._get_server(server_id):
-            self._get_server(server_id)._roles.pop(role_id, None)
+        server = self._get_server(server_id)
+        if server:
+            role = server._roles.pop(role_id, None)
+            if role is not None:
+                server._invalidate_role_permissions(role)
+            server._role_member_ids.pop(role_id, None)
 
     def add_to_server_channel_cache(self, channel):
         server = channel.server or self._get_server(channel.server_id)
         if server:
+            previous = server._channels.get(channel.id)
             server._channels[channel.id] = channel
+            if self._servers.get(server.id) is server:
+                self._all_server_channels[channel.id] = channel
+            if previous is not None and previous.category_id != channel.category_id:
+                server._invalidate_channel_permissions((channel.id,))
 
     def remove_from_server_channel_cache(self, server_id, channel_id):
-        if self._get_server(server_id):
-            self._get_server(server_id)._channels.pop(channel_id, None)
+        server = self._get_server(server_id)
+        if server:
+            server._channels.pop(channel_id, None)
+            server._channel_overrides.pop(channel_id, None)
+            server._invalidate_channel_permissions((channel_id,))
+            self._all_server_channels.pop(channel_id, None)
 
     def add_to_category_cache(self, category: Category):
         server = category.server or self._get_server(category.server_id)
@@ -351,27 +488,45 @@ class HTTPClientBase:
             server._categories[category.id] = category
 
     def remove_from_category_cache(self, server_id: str, category_id: int):
-        if self._get_server(server_id):
-            self._get_server(server_id)._categories.pop(category_id, None)
+        server = self._get_server(server_id)
+        if server:
+            server._categories.pop(category_id, None)
+            server._category_overrides.pop(category_id, None)
+            server._invalidate_category_permissions(category_id)
 
     def add_to_dm_channel_cache(self, channel):
-        self._dm_channels[channel.id] = channel
+        if self._dm_channel_cache_policy.enabled:
+            self._dm_channels[channel.id] = channel
 
     def remove_from_dm_channel_cache(self, channel_id):
         self._dm_channels.pop(channel_id, None)
 
     def add_to_user_cache(self, user):
-        self._users[user.id] = user
+        if self._user_cache_policy.enabled or user.id == self.my_id:
+            self._users[user.id] = user
+            if self._user_names is not None:
+                self._user_names.add(user.id, (user.name,))
 
     def remove_from_user_cache(self, user_id):
         self._users.pop(user_id, None)
+        if self._user_names is not None:
+            self._user_names.remove(user_id)
+
+    def _on_user_evicted(self, user_id, user):
+        if self._user_names is not None:
+            self._user_names.remove(user_id)
 
-    def valid_ISO8601(self, timestamp: datetime.datetime) -> str:
+    def valid_ISO8601(self, timestamp: Union[datetime.datetime, str]) -> str:
         """Manually construct a datetime's ISO8601 representation so that
         Guilded will accept it. Guilded rejects isoformat()'s 6-digit
-        microseconds and UTC offset (+00:00)."""
+        microseconds and UTC offset (+00:00).
+
+        Strings are assumed to already be in Guilded's format (e.g. a
+        timestamp taken from a payload) and are passed through untouched."""
+        if isinstance(timestamp, str):
+            return timestamp
         # Valid example: 2021-10-15T23:58:44.537Z
-        return timestamp.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+        return timestamp.strftime('%Y-%m-%dT%H:%M:%S.') + f'{timestamp.microsecond // 1000:03d}Z'
 
     @property
     def cdn_qs_expires(self) -> Optional[datetime.datetime]:
@@ -527,11 +682,29 @@ class HTTPClientBase:
 
 
 class HTTPClient(HTTPClientBase):
-    def __init__(self, *, max_messages=1000, features=None):
-        super().__init__(max_messages=max_messages, features=features)
+    def __init__(
+        self,
+        *,
+        max_messages=1000,
+        features=None,
+        member_cache_policy=None,
+        user_cache_policy=None,
+        dm_channel_cache_policy=None,
+        name_index=False,
+    ):
+        super().__init__(
+            max_messages=max_messages,
+            features=features,
+            member_cache_policy=member_cache_policy,
+            user_cache_policy=user_cache_policy,
+            dm_channel_cache_policy=dm_channel_cache_policy,
+            name_index=name_index,
+        )
         self.client_features = features
 
         self.token: Optional[str] = None
+        # Route bucket -> loop time at which it may be used again
+        self._bucket_resets: Dict[str, float] = {}
 
         user_agent = 'guilded.py/{0} (https://github.com/shayypy/guilded.py) Python/{1[0]}.{1[1]} aiohttp/{2}'
         self.user_agent: str = user_agent.format(__version__, sys.version_info, aiohttp.__version__)
@@ -581,7 +754,19 @@ class HTTPClient(HTTPClientBase):
 
         response: Optional[aiohttp.ClientResponse] = None
         data: Optional[Union[Dict[str, Any], str]] = None
+        bucket = route.bucket
+        loop = asyncio.get_running_loop()
         for tries in range(5):
+            # Wait out a rate limit that another request on this route has
+            # already hit, instead of each concurrent request hitting it too
+            reset = self._bucket_resets.get(bucket)
+            if reset is not None:
+                delay = reset - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                elif self._bucket_resets.get(bucket) == reset:
+                    del self._bucket_resets[bucket]
+
             try:
                 response = await self.session.request(method, url, **kwargs)
             except OSError as exc:
@@ -597,12 +782,14 @@ class HTTPClient(HTTPClientBase):
             if authenticated_as and authenticated_as != self.my_id and authenticated_as != 'None':
                 log.debug('Response provided a new user ID. Previous: %s, New: %s', self.my_id, authenticated_as)
                 last_user = self._users.pop(self.my_id, None)
+                if self._user_names is not None:
+                    self._user_names.remove(self.my_id)
                 self.my_id = authenticated_as
 
                 # Update the ClientUser
                 if last_user:
                     last_user.id = self.my_id
-                    self._users[self.my_id] = last_user
+                    self.add_to_user_cache(last_user)
 
             cdn_token = response.headers.get('x-cdn-token')
             if cdn_token and self._auto_sign and cdn_token != self.cdn_qs and cdn_token != 'None':
@@ -631,6 +818,9 @@ class HTTPClient(HTTPClientBase):
                     route.path,
                     retry_after,
                 )
+                reset = loop.time() + retry_after
+                if reset > self._bucket_resets.get(bucket, 0):
+                    self._bucket_resets[bucket] = reset
                 await asyncio.sleep(retry_after)
                 log.debug('Done sleeping for the rate limit. Retrying...')
 
@@ -675,6 +865,10 @@ class HTTPClient(HTTPClientBase):
         if self.ws and self.ws._last_message_id:
             # We have connected before, resume and catch up with missed messages
             headers['guilded-last-message-id'] = self.ws._last_message_id
+        elif self._resume_cursor:
+            # We have a cursor from a cache snapshot of a previous session
+            headers['guilded-last-message-id'] = self._resume_cursor
+        self._resume_cursor = None
 
         if self.client_features and self.client_features.official_markdown:
             headers['x-guilded-bot-api-use-official-markdown'] = "true"
@@ -0,0 +1,176 @@
+"""
+MIT License
+
+Copyright (c) 2020-present shay (shayypy)
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+------------------------------------------------------------------------------
+
+This project includes code from https://github.com/Rapptz/discord.py, which is
+available under the MIT license:
+
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generator, Generic, List, Optional, TypeVar
+
+__all__ = ()
+
+T = TypeVar('T')
+C = TypeVar('C')
+
+# A page fetcher receives the current cursor and the number of items to
+# request, and returns the raw items of that page.
+PageFetcher = Callable[[Optional[C], int], Awaitable[List[Any]]]
+
+
+class _PaginatedIterator(Generic[T]):
+    """An :term:`asynchronous iterator` that may also be awaited directly,
+    in which case every remaining item is collected into a list.
+
+    This keeps ``await channel.history()`` working for code written before
+    the method became an iterator.
+    """
+
+    __slots__ = ('_iterator',)
+
+    def __init__(self, iterator: AsyncIterator[T]):
+        self._iterator = iterator
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self._iterator
+
+    async def __anext__(self) -> T:
+        return await self._iterator.__anext__()
+
+    def __await__(self) -> Generator[Any, None, List[T]]:
+        return self.flatten().__await__()
+
+    async def flatten(self) -> List[T]:
+        """|coro|
+
+        Exhaust the iterator and return its items as a list.
+        """
+        return [item async for item in self._iterator]
+
+
+async def _paginate(
+    fetch_page: PageFetcher,
+    *,
+    cursor: Optional[C],
+    next_cursor: Callable[[List[Any]], Optional[C]],
+    limit: Optional[int],
+    page_size: int,
+    prefetch: int = 1,
+) -> AsyncIterator[Any]:
+    """Yield the raw items of successive pages.
+
+    Pages are requested by a background task that runs at most ``prefetch``
+    pages ahead of the consumer, so the next round trip overlaps with the
+    processing of the current page. Pagination stops once ``limit`` items
+    have been produced, when a page comes back short, or when
+    ``next_cursor`` returns ``None``.
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(prefetch, 1))
+
+    async def produce() -> None:
+        remaining = limit
+        current = cursor
+        try:
+            while True:
+                page_limit = page_size if remaining is None else min(page_size, remaining)
+                items = await fetch_page(current, page_limit)
+                if remaining is not None:
+                    items = items[:remaining]
+                    remaining -= len(items)
+
+                await queue.put(items)
+                if len(items) < page_limit or remaining == 0:
+                    break
+
+                current = next_cursor(items)
+                if current is None:
+                    break
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            await queue.put(exc)
+            return
+
+        await queue.put(None)
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page = await queue.get()
+            if page is None:
+                return
+            if isinstance(page, Exception):
+                raise page
+
+            for item in page:
+                yield item
+
+    finally:
+        task.cancel()
+
+
+def _paginate_models(payloads: AsyncIterator[Any], factory: Callable[[Any], T]) -> _PaginatedIterator[T]:
+    """Wrap a stream of raw items so that each is built into a model."""
+
+    async def models() -> AsyncIterator[T]:
+        async for data in payloads:
+            yield factory(data)
+
+    return _PaginatedIterator(models())
+
+
+def _oldest_created_at(items: List[Dict[str, Any]]) -> str:
+    # Guilded's timestamps share a fixed-width format, so the oldest can be
+    # picked without parsing them. The raw string is also a more precise
+    # cursor than a round trip through datetime would be.
+    return min(item['createdAt'] for item in items)
@@ -55,7 +55,7 @@ import asyncio
 import datetime
 import logging
 import re
-from typing import TYPE_CHECKING, Any, Dict, Optional, List, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, Optional, List, Sequence, Tuple, Union
 
 from .colour import Colour
 from .embed import Embed
@@ -162,11 +162,16 @@ class Mentions:
         *,
         ignore_cache: bool = False,
         ignore_errors: bool = False,
+        max_concurrency: int = 8,
     ) -> None:
         """|coro|
 
         Fetch & fill the internal cache with the targets referenced.
 
+        Objects are fetched concurrently. If fetching every uncached user or
+        role individually would be slower than downloading the server's
+        entire member or role list, the list is downloaded instead.
+
         Parameters
         -----------
         ignore_cache: :class:`bool`
@@ -175,6 +180,11 @@ class Mentions:
         ignore_errors: :class:`bool`
             Whether to ignore :exc:`HTTPException`\s that occur while fetching.
             Defaults to ``False`` if not specified.
+        max_concurrency: :class:`int`
+            The maximum number of requests to have in flight at once.
+            Defaults to ``8``.
+
+            .. versionadded:: 1.14
         """
         # Bots cannot fetch any role information so they are not handled here.
 
@@ -182,91 +192,147 @@ class Mentions:
         # or deleted accounts - I am unsure whether Guilded includes these
         # cases in their `Mentions` model.
 
-        # Just fetch the whole member list instead of fetching >=5 members individually.
-        uncached_user_count = len(self._users) - len(self.users)
-        if (
-            self._server and (
-                uncached_user_count >= 5
-                or (len(self._users) >= 5 and ignore_cache)
-            )
-        ):
+        state = self._state
+        server = self._server
+        semaphore = asyncio.Semaphore(max_concurrency)
+        coros = []
+
+        user_ids = [user_data['id'] for user_data in self._users]
+        if not ignore_cache:
+            user_ids = [
+                user_id for user_id in user_ids
+                if not (
+                    (server and state._get_server_member(server.id, user_id))
+                    or state._get_user(user_id)
+                )
+            ]
+
+        if user_ids:
             # `fill_members` here would cause potentially unwanted/unexpected
             # cache usage, especially in large servers.
-            members = await self._server.fetch_members()
-            user_ids = [user['id'] for user in self._users]
-            for member in members:
-                if member.id in user_ids:
-                    self._state.add_to_member_cache(member)
+            if server and _prefer_bulk_fetch(len(user_ids), server._member_count or len(server._members), max_concurrency):
+                coros.append(self._fill_from_member_list(user_ids))
+            else:
+                coros.extend(self._fill_user(user_id, semaphore) for user_id in user_ids)
+
+        if server:
+            role_ids = [role_data['id'] for role_data in self._roles]
+            if not ignore_cache:
+                role_ids = [role_id for role_id in role_ids if not server.get_role(role_id)]
+
+            if role_ids:
+                # `fill_roles` here would cause potentially unwanted/unexpected
+                # cache usage, especially in large servers.
+                if _prefer_bulk_fetch(len(role_ids), len(server._roles), max_concurrency):
+                    coros.append(self._fill_from_role_list(role_ids))
+                else:
+                    coros.extend(self._fill_role(role_id, semaphore) for role_id in role_ids)
+
+            for channel_data in self._channels:
+                channel_id = channel_data['id']
+                if ignore_cache or not state._get_server_channel_or_thread(server.id, channel_id):
+                    coros.append(self._fill_channel(channel_id, semaphore))
+
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                if isinstance(result, HTTPException) and ignore_errors:
+                    continue
+                raise result
+
+    def _fetch_once(self, key: Tuple[str, ...], factory: Callable[[], Coroutine[Any, Any, Any]]) -> asyncio.Future:
+        # Share one request between every fill that needs the same object
+        fetches = self._state._mention_fetches
+        future = fetches.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            fetches[key] = future
+            future.add_done_callback(lambda _: fetches.pop(key, None))
+        return asyncio.shield(future)
+
+    async def _fill_user(self, user_id: str, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            if self._server:
+                server = self._server
+                member = await self._fetch_once(('member', server.id, user_id), lambda: server.fetch_member(user_id))
+                self._state.add_to_member_cache(member)
+            else:
+                data = await self._fetch_once(('user', user_id), lambda: self._state.get_user(user_id))
+                self._state.add_to_user_cache(self._state.create_user(data=data['user']))
+
+    async def _fill_role(self, role_id: int, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            server = self._server
+            role = await self._fetch_once(('role', server.id, role_id), lambda: server.fetch_role(role_id))
+            self._state.add_to_role_cache(role)
+
+    async def _fill_channel(self, channel_id: str, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            server = self._server
+            channel = await self._fetch_once(('channel', server.id, channel_id), lambda: server.fetch_channel(channel_id))
+            self._state.add_to_server_channel_cache(channel)
+
+    async def _fill_from_member_list(self, user_ids: List[str]) -> None:
+        server = self._server
+        members = await self._fetch_once(('members', server.id), server.fetch_members)
+        user_ids = set(user_ids)
+        for member in members:
+            if member.id in user_ids:
+                self._state.add_to_member_cache(member)
+
+    async def _fill_from_role_list(self, role_ids: List[int]) -> None:
+        server = self._server
+        roles = await self._fetch_once(('roles', server.id), server.fetch_roles)
+        role_ids = set(role_ids)
+        for role in roles:
+            if role.id in role_ids:
+                self._state.add_to_role_cache(role)
+
+
+# Roughly how many list entries cost as much to download and parse as one
+# extra request round trip
+_ITEMS_PER_ROUND_TRIP = 1000
+
+
+def _prefer_bulk_fetch(count: int, total: int, concurrency: int) -> bool:
+    """Whether fetching a whole list of ``total`` items is expected to be
+    cheaper than fetching ``count`` of them individually, ``concurrency``
+    at a time."""
+    if count < 5:
+        return False
+
+    individual_cost = -(-count // max(concurrency, 1))
+    bulk_cost = 1 + total / _ITEMS_PER_ROUND_TRIP
+    return bulk_cost < individual_cost
 
-        else:
-            for user_data in self._users:
-                cached_user = self._state._get_user(user_data['id'])
-                if self._server:
-                    cached_user = self._state._get_server_member(self._server.id, user_data['id']) or cached_user
-
-                if ignore_cache or not cached_user:
-                    if self._server:
-                        try:
-                            user = await self._server.fetch_member(user_data['id'])
-                        except HTTPException:
-                            if not ignore_errors:
-                                raise
-                        else:
-                            self._state.add_to_member_cache(user)
-                    else:
-                        try:
-                            user = await self._state.get_user(user_data['id'])
-                        except HTTPException:
-                            if not ignore_errors:
-                                raise
-                        else:
-                            self._state.add_to_user_cache(user)
-
-        # Just fetch the whole role list instead of fetching >=5 roles individually.
-        uncached_role_count = len(self._roles) - len(self.roles)
-        if (
-            self._server and (
-                uncached_role_count >= 5
-                or (len(self._roles) >= 5 and ignore_cache)
-            )
-        ):
-            # `fill_roles` here would cause potentially unwanted/unexpected
-            # cache usage, especially in large servers.
-            roles = await self._server.fetch_roles()
-            role_ids = [role['id'] for role in self._roles]
-            for role in roles:
-                if role.id in role_ids:
-                    self._state.add_to_role_cache(role)
 
-        else:
-            for role_data in self._roles:
-                cached_role = self._state._get_server_role(self._server.id, role_data['id'])
-                if self._server and (ignore_cache or not cached_role):
-                    try:
-                        role = await self._server.fetch_role(role_data['id'])
-                    except HTTPException:
-                        if not ignore_errors:
-                            raise
-                    else:
-                        self._state.add_to_role_cache(role)
+ATTACHMENT_REGEX = re.compile(r'!\[(?P<caption>.+)?\]\((?P<url>(?:(?:https:\/\/(?:s3-us-west-2\.amazonaws\.com\/www\.guilded\.gg|img\.guildedcdn\.com|img2\.guildedcdn\.com|www\.guilded\.gg|cdn\.gilcdn\.com|cdn\.gldcdn\.com)\/(?:ContentMediaGenericFiles|ContentMedia|WebhookPrimaryMedia)\/[a-zA-Z0-9]+-Full)|(?:https:\/\/media\d+\.giphy\.com\/media\/[^ \n]+)|(?:https:\/\/media\.tenor\.com\/[^ \n]+))\.(?P<extension>webp|jpeg|jpg|png|gif|apng|webm|mp4)(?:\?.+)?)\)')
 
-        for channel_data in self._channels:
-            if not self._server:
-                # This should never happen
-                break
+# The markdown that each mark in a rich text document is rendered with
+_MARK_WRAPPERS: Dict[str, str] = {
+    'bold': '**',
+    'italic': '*',
+    'underline': '__',
+    'strikethrough': '~~',
+    'spoiler': '||',
+}
 
-            cached_channel = self._state._get_server_channel_or_thread(self._server.id, channel_data['id'])
-            if ignore_cache or not cached_channel:
-                try:
-                    channel = await self._server.fetch_channel(channel_data['id'])
-                except HTTPException:
-                    if not ignore_errors:
-                        raise
-                else:
-                    self._state.add_to_server_channel_cache(channel)
+_mark_wrapper_cache: Dict[Tuple[str, ...], Tuple[str, str]] = {}
 
 
-ATTACHMENT_REGEX = re.compile(r'!\[(?P<caption>.+)?\]\((?P<url>(?:(?:https:\/\/(?:s3-us-west-2\.amazonaws\.com\/www\.guilded\.gg|img\.guildedcdn\.com|img2\.guildedcdn\.com|www\.guilded\.gg|cdn\.gilcdn\.com|cdn\.gldcdn\.com)\/(?:ContentMediaGenericFiles|ContentMedia|WebhookPrimaryMedia)\/[a-zA-Z0-9]+-Full)|(?:https:\/\/media\d+\.giphy\.com\/media\/[^ \n]+)|(?:https:\/\/media\.tenor\.com\/[^ \n]+))\.(?P<extension>webp|jpeg|jpg|png|gif|apng|webm|mp4)(?:\?.+)?)\)')
+def _mark_wrappers(marks: Tuple[str, ...]) -> Tuple[str, str]:
+    # Returns the (prefix, suffix) pair to surround text with for a sequence
+    # of marks, where the first mark is the innermost
+    try:
+        return _mark_wrapper_cache[marks]
+    except KeyError:
+        pass
+
+    wrappers = [_MARK_WRAPPERS[mark] for mark in marks if mark in _MARK_WRAPPERS]
+    pair = (''.join(reversed(wrappers)), ''.join(wrappers))
+    _mark_wrapper_cache[marks] = pair
+    return pair
+
 
 class HasContentMixin:
     def __init__(self):
@@ -373,127 +439,76 @@ class HasContentMixin:
             return self._mentions.here
         return self._mentions_here
 
-    def _get_full_content(self, data: Dict[str, Any]) -> str:
+    def _get_full_content(self, data: Dict[str, Any], *, collect_mentions: bool = True) -> str:
         try:
             nodes = data['document']['nodes']
         except KeyError:
             # empty message
             return ''
 
-        content = ''
+        content = self._render_nodes(nodes)
+        if collect_mentions:
+            self._collect_mentions(nodes)
+        return content
+
+    def _render_nodes(self, nodes: List[Dict[str, Any]]) -> str:
+        parts: List[str] = []
+        append = parts.append
+
         for node in nodes:
             node_type = node['type']
             if node_type == 'paragraph':
                 for element in node['nodes']:
-                    if element['object'] == 'text':
+                    element_object = element['object']
+                    if element_object == 'text':
                         for leaf in element['leaves']:
-                            if not leaf['marks']:
-                                content += leaf['text']
+                            marks = leaf['marks']
+                            if not marks:
+                                append(leaf['text'])
                             else:
-                                to_mark = '{unmarked_content}'
-                                marks = leaf['marks']
-                                for mark in marks:
-                                    if mark['type'] == 'bold':
-                                        to_mark = '**' + to_mark + '**'
-                                    elif mark['type'] == 'italic':
-                                        to_mark = '*' + to_mark + '*'
-                                    elif mark['type'] == 'underline':
-                                        to_mark = '__' + to_mark + '__'
-                                    elif mark['type'] == 'strikethrough':
-                                        to_mark = '~~' + to_mark + '~~'
-                                    elif mark['type'] == 'spoiler':
-                                        to_mark = '||' + to_mark + '||'
-                                    else:
-                                        pass
-                                content += to_mark.format(
-                                    unmarked_content=str(leaf['text'])
-                                )
-                    if element['object'] == 'inline':
-                        if element['type'] == 'mention':
+                                prefix, suffix = _mark_wrappers(tuple(mark['type'] for mark in marks))
+                                append(prefix)
+                                append(str(leaf['text']))
+                                append(suffix)
+
+                    elif element_object == 'inline':
+                        element_type = element['type']
+                        if element_type == 'mention':
                             mentioned = element['data']['mention']
-                            if mentioned['type'] == 'role':
-                                self._raw_role_mentions.append(int(mentioned['id']))
-                                content += f'<@{mentioned["id"]}>'
-                            elif mentioned['type'] == 'person':
-                                content += f'<@{mentioned["id"]}>'
-
-                                self._raw_user_mentions.append(mentioned['id'])
-                                if self.server_id:
-                                    user = self._state._get_server_member(self.server_id, mentioned['id'])
-                                else:
-                                    user = self._state._get_user(mentioned['id'])
-
-                                if user:
-                                    self._user_mentions.append(user)
-                                else:
-                                    name = mentioned.get('name')
-                                    if mentioned.get('nickname') is True and mentioned.get('matcher') is not None:
-                                        name = name.strip('@').strip(name).strip('@')
-                                        if not name.strip():
-                                            # matcher might be empty, oops - no username is available
-                                            name = None
-                                    if self.server_id:
-                                        self._user_mentions.append(self._state.create_member(
-                                            server=self.server,
-                                            data={
-                                                'id': mentioned.get('id'),
-                                                'name': name,
-                                                'profilePicture': mentioned.get('avatar'),
-                                                'colour': Colour.from_str(mentioned.get('color', '#000')),
-                                                'nickname': mentioned.get('name') if mentioned.get('nickname') is True else None,
-                                                'type': 'bot' if self.created_by_bot else 'user',
-                                            }
-                                        ))
-                                    else:
-                                        self._user_mentions.append(self._state.create_user(data={
-                                            'id': mentioned.get('id'),
-                                            'name': name,
-                                            'profilePicture': mentioned.get('avatar'),
-                                            'type': 'bot' if self.created_by_bot else 'user',
-                                        }))
-
+                            if mentioned['type'] in ('role', 'person'):
+                                append(f'<@{mentioned["id"]}>')
                             elif mentioned['type'] in ('everyone', 'here'):
                                 # grab the actual display content of the node instead of using a static string
                                 try:
-                                    content += element['nodes'][0]['leaves'][0]['text']
+                                    append(element['nodes'][0]['leaves'][0]['text'])
                                 except KeyError:
                                     # give up trying to be fancy and use a static string
-                                    content += f'@{mentioned["type"]}'
+                                    append(f'@{mentioned["type"]}')
 
-                                if mentioned['type'] == 'everyone':
-                                    self._mentions_everyone = True
-                                elif mentioned['type'] == 'here':
-                                    self._mentions_here = True
+                        elif element_type == 'reaction':
+                            append(str(element['nodes'][0]['leaves'][0]['text']))
 
-                        elif element['type'] == 'reaction':
-                            rtext = element['nodes'][0]['leaves'][0]['text']
-                            content += str(rtext)
-
-                        elif element['type'] == 'link':
+                        elif element_type == 'link':
                             link_text = element['nodes'][0]['leaves'][0]['text']
                             link_href = element['data']['href']
                             if link_href != link_text:
-                                content += f'[{link_text}]({link_href})'
+                                append(f'[{link_text}]({link_href})')
                             else:
-                                content += link_href
+                                append(link_href)
 
-                        elif element['type'] == 'channel':
+                        elif element_type == 'channel':
                             channel = element['data']['channel']
                             if channel.get('id'):
-                                self._raw_channel_mentions.append(channel["id"])
-                                content += f'<#{channel["id"]}>'
-                                channel = self._state._get_server_channel(self.server_id, channel['id'])
-                                if channel:
-                                    self._channel_mentions.append(channel)
+                                append(f'<#{channel["id"]}>')
 
-                content += '\n'
+                append('\n')
 
             elif node_type == 'markdown-plain-text':
                 try:
-                    content += node['nodes'][0]['leaves'][0]['text']
+                    append(node['nodes'][0]['leaves'][0]['text'])
                 except KeyError:
                     # probably an "inline" non-text node - their leaves are another node deeper
-                    content += node['nodes'][0]['nodes'][0]['leaves'][0]['text']
+                    append(node['nodes'][0]['nodes'][0]['leaves'][0]['text'])
 
                     if 'reaction' in node['nodes'][0].get('data', {}):
                         emote_id = node['nodes'][0]['data']['reaction']['id']
@@ -514,16 +529,79 @@ class HasContentMixin:
                         quote_content.append(text)
 
                 if quote_content:
-                    content += '\n> {}\n'.format('\n> '.join(quote_content))
+                    append('\n> {}\n'.format('\n> '.join(quote_content)))
 
             elif node_type in {'image', 'video', 'fileUpload'}:
                 attachment = Attachment(state=self._state, data=node)
                 self.attachments.append(attachment)
 
-        content = content.rstrip('\n')
         # strip ending of newlines in case a paragraph node ended without
         # another paragraph node
-        return content
+        return ''.join(parts).rstrip('\n')
+
+    def _collect_mentions(self, nodes: List[Dict[str, Any]]) -> None:
+        for node in nodes:
+            if node['type'] != 'paragraph':
+                continue
+
+            for element in node['nodes']:
+                if element['object'] != 'inline':
+                    continue
+
+                if element['type'] == 'mention':
+                    mentioned = element['data']['mention']
+                    if mentioned['type'] == 'role':
+                        self._raw_role_mentions.append(int(mentioned['id']))
+                    elif mentioned['type'] == 'person':
+                        self._raw_user_mentions.append(mentioned['id'])
+                        self._user_mentions.append(self._resolve_user_mention(mentioned))
+                    elif mentioned['type'] == 'everyone':
+                        self._mentions_everyone = True
+                    elif mentioned['type'] == 'here':
+                        self._mentions_here = True
+
+                elif element['type'] == 'channel':
+                    channel = element['data']['channel']
+                    if channel.get('id'):
+                        self._raw_channel_mentions.append(channel['id'])
+                        channel = self._state._get_server_channel(self.server_id, channel['id'])
+                        if channel:
+                            self._channel_mentions.append(channel)
+
+    def _resolve_user_mention(self, mentioned: Dict[str, Any]) -> Union[Member, User]:
+        if self.server_id:
+            user = self._state._get_server_member(self.server_id, mentioned['id'])
+        else:
+            user = self._state._get_user(mentioned['id'])
+
+        if user:
+            return user
+
+        name = mentioned.get('name')
+        if mentioned.get('nickname') is True and mentioned.get('matcher') is not None:
+            name = name.strip('@').strip(name).strip('@')
+            if not name.strip():
+                # matcher might be empty, oops - no username is available
+                name = None
+        if self.server_id:
+            return self._state.create_member(
+                server=self.server,
+                data={
+                    'id': mentioned.get('id'),
+                    'name': name,
+                    'profilePicture': mentioned.get('avatar'),
+                    'colour': Colour.from_str(mentioned.get('color', '#000')),
+                    'nickname': mentioned.get('name') if mentioned.get('nickname') is True else None,
+                    'type': 'bot' if self.created_by_bot else 'user',
+                }
+            )
+        else:
+            return self._state.create_user(data={
+                'id': mentioned.get('id'),
+                'name': name,
+                'profilePicture': mentioned.get('avatar'),
+                'type': 'bot' if self.created_by_bot else 'user',
+            })
 
     def _create_mentions(self, data: Optional[Dict[str, Any]]) -> Mentions:
         # This will always be called after setting _state and _server/server_id so this should be safe
@@ -617,15 +695,22 @@ class ChatMessage(Hashable, HasContentMixin):
         'type',
         'webhook_id',
         'author_id',
-        'created_at',
-        'updated_at',
+        '_raw_created_at',
+        '_created_at',
+        '_raw_updated_at',
+        '_updated_at',
         'deleted_at',
         'replied_to_ids',
         'silent',
         'private',
         'pinned',
-        'content',
-        'embeds',
+        '_raw_content',
+        '_raw_mentions',
+        '_raw_embeds',
+        '_content',
+        '_embeds',
+        '_attachments',
+        '_parsed_mentions',
         'hidden_preview_urls',
     )
 
@@ -652,17 +737,29 @@ class ChatMessage(Hashable, HasContentMixin):
         self._webhook_avatar_url: Optional[str] = None
         self.hidden_preview_urls: List[str] = data.get('hiddenLinkPreviewUrls') or []
 
-        self.created_at: datetime.datetime = ISO8601(data.get('createdAt'))
-        self.updated_at: Optional[datetime.datetime] = ISO8601(data.get('updatedAt') or data.get('editedAt'))
+        # Timestamps, content, mentions, embeds and attachments are parsed
+        # from the payload on first access since most handlers never look
+        # at all of them
+        self._raw_created_at: Optional[str] = data.get('createdAt')
+        self._created_at: Optional[datetime.datetime] = MISSING
+        self._raw_updated_at: Optional[str] = data.get('updatedAt') or data.get('editedAt')
+        self._updated_at: Optional[datetime.datetime] = MISSING
         self.deleted_at: Optional[datetime.datetime] = ISO8601(data.get('deletedAt'))
 
         self.silent: bool = data.get('isSilent') or False
         self.private: bool = data.get('isPrivate') or False
         self.pinned: bool = data.get('isPinned') or False
 
+        self._raw_content: Optional[Union[str, Dict[str, Any]]] = data.get('content')
+        self._raw_mentions: Optional[Dict[str, Any]] = data.get('mentions')
+        self._raw_embeds: Optional[List[Dict[str, Any]]] = data.get('embeds')
+        self._content: str = MISSING
+        self._embeds: List[Embed] = MISSING
+        self._attachments: List[Attachment] = MISSING
+        self._parsed_mentions: Optional[Mentions] = None
+
         if isinstance(data.get('content'), dict):
             # Webhook execution responses
-            self.content: str = self._get_full_content(data['content'])
             hidden_embed_urls: Optional[Dict[str, bool]] = data['content'].get('document', {}).get('data', {}).get('hiddenEmbedUrls')
             if hidden_embed_urls:
                 self.hidden_preview_urls = [key for [key, value] in hidden_embed_urls.items() if value]
@@ -672,13 +769,97 @@ class ChatMessage(Hashable, HasContentMixin):
                 self._webhook_username = profile.get('name')
                 self._webhook_avatar_url = profile.get('profilePicture')
 
+    def _materialize_content(self) -> None:
+        raw_content = self._raw_content
+        # Values assigned through the setters before the content was first
+        # read take precedence over the ones parsed from the payload
+        embeds, attachments = self._embeds, self._attachments
+        self._embeds = []
+        self._attachments = []
+
+        if isinstance(raw_content, dict):
+            # Webhook execution responses
+            self._content = self._get_full_content(raw_content)
         else:
-            self.content: str = data.get('content') or ''
-            self._mentions = self._create_mentions(data.get('mentions'))
-            self.embeds: List[Embed] = [
-                Embed.from_dict(embed) for embed in (data.get('embeds') or [])
+            self._content = raw_content or ''
+            self._parsed_mentions = self._create_mentions(self._raw_mentions)
+            self._embeds = [
+                Embed.from_dict(embed) for embed in (self._raw_embeds or [])
             ]
-            self._extract_attachments(self.content)
+            self._extract_attachments(self._content)
+
+        if embeds is not MISSING:
+            self._embeds = embeds
+        if attachments is not MISSING:
+            self._attachments = attachments
+
+        self._raw_content = None
+        self._raw_mentions = None
+        self._raw_embeds = None
+
+    @property
+    def content(self) -> str:
+        if self._content is MISSING:
+            self._materialize_content()
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        if self._content is MISSING:
+            self._materialize_content()
+        self._content = value
+
+    @property
+    def embeds(self) -> List[Embed]:
+        if self._embeds is MISSING:
+            self._materialize_content()
+        return self._embeds
+
+    @embeds.setter
+    def embeds(self, value: List[Embed]) -> None:
+        self._embeds = value
+
+    @property
+    def attachments(self) -> List[Attachment]:
+        if self._attachments is MISSING:
+            self._materialize_content()
+        return self._attachments
+
+    @attachments.setter
+    def attachments(self, value: List[Attachment]) -> None:
+        self._attachments = value
+
+    @property
+    def _mentions(self) -> Mentions:
+        if self._content is MISSING:
+            self._materialize_content()
+        if self._parsed_mentions is None:
+            # Webhook execution responses collect their mentions while
+            # rendering the content
+            raise AttributeError('_mentions')
+        return self._parsed_mentions
+
+    @property
+    def created_at(self) -> datetime.datetime:
+        if self._created_at is MISSING:
+            self._created_at = ISO8601(self._raw_created_at)
+            self._raw_created_at = None
+        return self._created_at
+
+    @created_at.setter
+    def created_at(self, value: datetime.datetime) -> None:
+        self._created_at = value
+
+    @property
+    def updated_at(self) -> Optional[datetime.datetime]:
+        if self._updated_at is MISSING:
+            self._updated_at = ISO8601(self._raw_updated_at)
+            self._raw_updated_at = None
+        return self._updated_at
+
+    @updated_at.setter
+    def updated_at(self, value: Optional[datetime.datetime]) -> None:
+        self._updated_at = value
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__} id={self.id!r} author={self.author!r} channel={self.channel!r}>'
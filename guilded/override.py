@@ -23,9 +23,9 @@ SOFTWARE.
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
 
-from .permissions import REVERSE_VALID_NAME_MAP, PermissionOverride
+from .permissions import REVERSE_VALID_NAME_MAP, PermissionOverride, _flags_from_values
 from .utils import ISO8601
 
 if TYPE_CHECKING:
@@ -239,3 +239,57 @@ class CategoryUserOverride(_CategoryPermissionOverride):
 
     def __repr__(self) -> str:
         return f'<CategoryRoleOverride override={self.override!r} category_id={self.category_id!r} user_id={self.user_id!r}>'
+
+
+def _override_flags(permissions: Dict[str, Optional[bool]]) -> Tuple[int, int]:
+    allow = _flags_from_values(key for key, value in permissions.items() if value is True)
+    deny = _flags_from_values(key for key, value in permissions.items() if value is False)
+    return allow, deny
+
+
+class _PermissionOverrides:
+    """The role and user overrides of a single channel or category, stored
+    as (allow, deny) bitmask pairs so that they can be applied cheaply."""
+
+    __slots__: Tuple[str, ...] = (
+        'roles',
+        'users',
+    )
+
+    def __init__(self):
+        self.roles: Dict[int, Tuple[int, int]] = {}
+        self.users: Dict[str, Tuple[int, int]] = {}
+
+    @classmethod
+    def _from_data(cls, role_data: List[Dict], user_data: List[Dict]):
+        self = cls()
+        for data in role_data:
+            self.set_role(data['roleId'], data['permissions'])
+        for data in user_data:
+            self.set_user(data['userId'], data['permissions'])
+        return self
+
+    def set_role(self, role_id: int, permissions: Dict[str, Optional[bool]]) -> None:
+        self.roles[role_id] = _override_flags(permissions)
+
+    def set_user(self, user_id: str, permissions: Dict[str, Optional[bool]]) -> None:
+        self.users[user_id] = _override_flags(permissions)
+
+    def apply(self, value: int, role_ids: Iterable[int], user_id: str) -> int:
+        # ``role_ids`` must be ordered from lowest to highest priority so
+        # that higher roles take precedence. User overrides always win.
+        for role_id in role_ids:
+            try:
+                allow, deny = self.roles[role_id]
+            except KeyError:
+                continue
+            value = (value & ~deny) | allow
+
+        try:
+            allow, deny = self.users[user_id]
+        except KeyError:
+            pass
+        else:
+            value = (value & ~deny) | allow
+
+        return value
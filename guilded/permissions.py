@@ -50,7 +50,7 @@ DEALINGS IN THE SOFTWARE.
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, ClassVar, Dict, Iterator, Optional, Set, Tuple
+from typing import TYPE_CHECKING, ClassVar, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -83,105 +83,207 @@ class Permissions:
 
             Checks if two permissions are not equal.
 
+        .. describe:: x | y
+
+            Returns the permissions that are in either ``x`` or ``y``.
+
+            .. versionadded:: 1.14
+
+        .. describe:: x & y
+
+            Returns the permissions that are in both ``x`` and ``y``.
+
+            .. versionadded:: 1.14
+
+        .. describe:: x ^ y
+
+            Returns the permissions that are in only one of ``x`` or ``y``.
+
+            .. versionadded:: 1.14
+
+        .. describe:: x - y
+
+            Returns the permissions in ``x`` that are not in ``y``.
+
+            .. versionadded:: 1.14
+
+        .. describe:: x <= y
+
+            Checks if every permission in ``x`` is also in ``y``.
+
+            .. versionadded:: 1.14
+
+        .. describe:: x >= y
+
+            Checks if every permission in ``y`` is also in ``x``.
+
+            .. versionadded:: 1.14
+
+        .. describe:: hash(x)
+
+            Returns the permissions' hash.
+
+            .. versionadded:: 1.14
+
     Attributes
     -----------
-    values: List[:class:`str`]
-        The raw array of permission values.
+    value: :class:`int`
+        The raw bitmask of permission values. The bits are assigned by the
+        library and are not the same across versions, so this should not
+        be persisted.
+
+        .. versionadded:: 1.14
+    """
+
+    __slots__: Tuple[str, ...] = (
+        'value',
+    )
+
+    def __init__(self, *values: str):
+        self.value: int = _flags_from_values(values)
+
+    @classmethod
+    def _from_value(cls, value: int) -> Self:
+        self = cls.__new__(cls)
+        self.value = value
+        return self
+
+    @property
+    def values(self) -> List[str]:
+        """List[:class:`str`]: The raw array of permission values.
+
         This list is not guaranteed to be in any particular order.
         You should use the properties available on this class instead of this
         attribute.
-    """
 
-    def __init__(self, *values: str):
-        self.values = list(values)
+        .. versionchanged:: 1.14
+            This is now built from :attr:`value` on each access, so
+            modifying the returned list no longer changes the permissions.
+        """
+        return _values_from_flags(self.value)
 
     def __eq__(self, other) -> bool:
-        return isinstance(other, Permissions) and set(self.values) == set(other.values)
+        return isinstance(other, Permissions) and self.value == other.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
 
     def __repr__(self) -> str:
-        return f'<Permissions values={len(self.values)}>'
+        return f'<Permissions values={bin(self.value).count("1")}>'
+
+    def __or__(self, other: Permissions) -> Permissions:
+        if not isinstance(other, Permissions):
+            return NotImplemented
+        return Permissions._from_value(self.value | other.value)
+
+    def __and__(self, other: Permissions) -> Permissions:
+        if not isinstance(other, Permissions):
+            return NotImplemented
+        return Permissions._from_value(self.value & other.value)
+
+    def __xor__(self, other: Permissions) -> Permissions:
+        if not isinstance(other, Permissions):
+            return NotImplemented
+        return Permissions._from_value(self.value ^ other.value)
+
+    def __sub__(self, other: Permissions) -> Permissions:
+        if not isinstance(other, Permissions):
+            return NotImplemented
+        return Permissions._from_value(self.value & ~other.value)
+
+    def __le__(self, other: Permissions) -> bool:
+        if not isinstance(other, Permissions):
+            return NotImplemented
+        return (self.value & other.value) == self.value
+
+    def __ge__(self, other: Permissions) -> bool:
+        if not isinstance(other, Permissions):
+            return NotImplemented
+        return (self.value & other.value) == other.value
 
     @classmethod
     def all(cls):
         """A factory method that creates a :class:`Permissions` with all
-        permissions set to ``True``."""
-        values = []
-        for category_values in VALUES_BY_CATEGORY.values():
-            values += category_values
+        permissions set to ``True``.
 
-        return cls(*values)
+        .. versionchanged:: 1.14
+            The flags of this and the category factories below are computed
+            once at import, but each call still returns a new instance since
+            :class:`Permissions` is mutable.
+        """
+        return cls._from_value(_ALL_FLAGS)
 
     @classmethod
     def none(cls):
         """A factory method that creates a :class:`Permissions` with all
         permissions set to ``False``."""
-        return cls()
+        return cls._from_value(0)
 
     @classmethod
     def general(cls):
         """A factory method that creates a :class:`Permissions` with all
         "General" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['general'])
+        return cls._from_value(_CATEGORY_FLAGS['general'])
 
     @classmethod
     def recruitment(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Recruitment" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['recruitment'])
+        return cls._from_value(_CATEGORY_FLAGS['recruitment'])
 
     @classmethod
     def announcements(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Announcement" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['announcements'])
+        return cls._from_value(_CATEGORY_FLAGS['announcements'])
 
     @classmethod
     def chat(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Chat" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['chat'])
+        return cls._from_value(_CATEGORY_FLAGS['chat'])
 
     @classmethod
     def calendar(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Calendar" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['calendar'])
+        return cls._from_value(_CATEGORY_FLAGS['calendar'])
 
     @classmethod
     def forums(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Forum" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['forums'])
+        return cls._from_value(_CATEGORY_FLAGS['forums'])
 
     @classmethod
     def docs(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Docs" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['docs'])
+        return cls._from_value(_CATEGORY_FLAGS['docs'])
 
     @classmethod
     def media(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Media" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['media'])
+        return cls._from_value(_CATEGORY_FLAGS['media'])
 
     @classmethod
     def voice(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Voice" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['voice'])
+        return cls._from_value(_CATEGORY_FLAGS['voice'])
 
     @classmethod
     def competitive(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Competitive" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['competitive'])
+        return cls._from_value(_CATEGORY_FLAGS['competitive'])
 
     @classmethod
     def customization(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Customization" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['customization'])
+        return cls._from_value(_CATEGORY_FLAGS['customization'])
 
     customisation = customization
 
@@ -189,49 +291,49 @@ class Permissions:
     def forms(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Forms" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['forms'])
+        return cls._from_value(_CATEGORY_FLAGS['form'])
 
     @classmethod
     def lists(cls):
         """A factory method that creates a :class:`Permissions` with all
         "List" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['lists'])
+        return cls._from_value(_CATEGORY_FLAGS['lists'])
 
     @classmethod
     def brackets(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Bracket" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['brackets'])
+        return cls._from_value(_CATEGORY_FLAGS['brackets'])
 
     @classmethod
     def scheduling(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Scheduling" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['scheduling'])
+        return cls._from_value(_CATEGORY_FLAGS['scheduling'])
 
     @classmethod
     def bots(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Bot" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['bots'])
+        return cls._from_value(_CATEGORY_FLAGS['bots'])
 
     @classmethod
     def xp(cls):
         """A factory method that creates a :class:`Permissions` with all
         "XP" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['xp'])
+        return cls._from_value(_CATEGORY_FLAGS['xp'])
 
     @classmethod
     def streams(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Stream" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['streams'])
+        return cls._from_value(_CATEGORY_FLAGS['streams'])
 
     @classmethod
     def socket_events(cls):
         """A factory method that creates a :class:`Permissions` with all
         "Socket event" permissions set to ``True``."""
-        return cls(*VALUES_BY_CATEGORY['socket_events'])
+        return cls._from_value(_CATEGORY_FLAGS['socket_events'])
 
     @property
     def administrator(self) -> bool:
@@ -241,14 +343,18 @@ class Permissions:
         permission, and thus this property being ``True`` does not necessarily
         mean that a user will have all the same abilities as a Discord user
         with the administrator permission.
+
+        .. versionchanged:: 1.14
+            Permission values that the library does not know about no longer
+            prevent this from being ``True``.
         """
-        return self == Permissions.all()
+        return (self.value & _ALL_FLAGS) == _ALL_FLAGS
 
     @property
     def update_server(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can update the server's
         settings."""
-        return 'CanUpdateServer' in self.values
+        return bool(self.value & _FLAGS['CanUpdateServer'])
 
     @property
     def manage_server(self) -> bool:
@@ -264,13 +370,13 @@ class Permissions:
     def manage_roles(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can update the server's
         roles."""
-        return 'CanManageRoles' in self.values
+        return bool(self.value & _FLAGS['CanManageRoles'])
 
     @property
     def invite_members(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can directly invite
         members to the server."""
-        return 'CanInviteMembers' in self.values
+        return bool(self.value & _FLAGS['CanInviteMembers'])
 
     @property
     def create_instant_invite(self) -> bool:
@@ -281,7 +387,7 @@ class Permissions:
     def kick_members(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can kick *or ban* members
         from the server."""
-        return 'CanKickMembers' in self.values
+        return bool(self.value & _FLAGS['CanKickMembers'])
 
     @property
     def ban_members(self) -> bool:
@@ -292,89 +398,89 @@ class Permissions:
     def manage_groups(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create, edit, or
         delete groups."""
-        return 'CanManageGroups' in self.values
+        return bool(self.value & _FLAGS['CanManageGroups'])
 
     @property
     def manage_channels(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create, edit, or
         delete channels."""
-        return 'CanManageChannels' in self.values
+        return bool(self.value & _FLAGS['CanManageChannels'])
 
     @property
     def manage_webhooks(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create, edit, or
         delete webhooks."""
-        return 'CanManageWebhooks' in self.values
+        return bool(self.value & _FLAGS['CanManageWebhooks'])
 
     @property
     def mention_everyone(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can use ``@everyone`` and
         ``@here`` mentions."""
-        return 'CanMentionEveryone' in self.values
+        return bool(self.value & _FLAGS['CanMentionEveryone'])
 
     @property
     def moderator_view(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can access "moderator
         view" to see private replies."""
-        return 'CanModerateChannels' in self.values
+        return bool(self.value & _FLAGS['CanModerateChannels'])
 
     @property
     def slowmode_exempt(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user is exempt from slowmode
         restrictions."""
-        return 'CanBypassSlowMode' in self.values
+        return bool(self.value & _FLAGS['CanBypassSlowMode'])
 
     @property
     def read_applications(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can view server and game
         applications."""
-        return 'CanReadApplications' in self.values
+        return bool(self.value & _FLAGS['CanReadApplications'])
 
     @property
     def approve_applications(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can approve server and
         game applications."""
-        return 'CanApproveApplications' in self.values
+        return bool(self.value & _FLAGS['CanApproveApplications'])
 
     @property
     def edit_application_form(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can edit server and game
         applications, and toggle accepting applications."""
-        return 'CanEditApplicationForm' in self.values
+        return bool(self.value & _FLAGS['CanEditApplicationForm'])
 
     @property
     def indicate_lfm_interest(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can indicate interest in
         a player instead of an upvote."""
-        return 'CanIndicateLfmInterest' in self.values
+        return bool(self.value & _FLAGS['CanIndicateLfmInterest'])
 
     @property
     def modify_lfm_status(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can modify the "Find
         Player" status for the server listing card."""
-        return 'CanModifyLfmStatus' in self.values
+        return bool(self.value & _FLAGS['CanModifyLfmStatus'])
 
     @property
     def read_announcements(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can view announcements."""
-        return 'CanReadAnnouncements' in self.values
+        return bool(self.value & _FLAGS['CanReadAnnouncements'])
 
     @property
     def create_announcements(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create and delete
         announcements."""
-        return 'CanCreateAnnouncements' in self.values
+        return bool(self.value & _FLAGS['CanCreateAnnouncements'])
 
     @property
     def manage_announcements(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can delete announcements
         by other members or pin any announcement."""
-        return 'CanManageAnnouncements' in self.values
+        return bool(self.value & _FLAGS['CanManageAnnouncements'])
 
     @property
     def read_messages(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can read chat messages."""
-        return 'CanReadChats' in self.values
+        return bool(self.value & _FLAGS['CanReadChats'])
 
     @property
     def view_channel(self) -> bool:
@@ -384,18 +490,18 @@ class Permissions:
     @property
     def send_messages(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can send chat messages."""
-        return 'CanCreateChats' in self.values
+        return bool(self.value & _FLAGS['CanCreateChats'])
 
     @property
     def upload_media(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can upload images and
         videos to chat messages."""
-        return 'CanUploadChatMedia' in self.values
+        return bool(self.value & _FLAGS['CanUploadChatMedia'])
 
     @property
     def create_threads(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create threads."""
-        return 'CanCreateThreads' in self.values
+        return bool(self.value & _FLAGS['CanCreateThreads'])
 
     @property
     def create_public_threads(self) -> bool:
@@ -410,99 +516,99 @@ class Permissions:
     @property
     def send_messages_in_threads(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can reply to threads."""
-        return 'CanCreateThreadMessages' in self.values or 'CanReplyToChatThreads' in self.values
+        return bool(self.value & _FLAGS['CanCreateThreadMessages']) or bool(self.value & _FLAGS['CanReplyToChatThreads'])
 
     @property
     def send_private_replies(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can privately reply to
         messages."""
-        return 'CanCreatePrivateMessages' in self.values
+        return bool(self.value & _FLAGS['CanCreatePrivateMessages'])
 
     @property
     def manage_messages(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can delete messages by
         other members or pin any message."""
-        return 'CanManageChats' in self.values
+        return bool(self.value & _FLAGS['CanManageChats'])
 
     @property
     def manage_threads(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can archive and restore
         threads."""
-        return 'CanManageThreads' in self.values
+        return bool(self.value & _FLAGS['CanManageThreads'])
 
     @property
     def create_chat_forms(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create forms."""
-        return 'CanCreateChatForms' in self.values
+        return bool(self.value & _FLAGS['CanCreateChatForms'])
 
     @property
     def view_events(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can view calendar
         events."""
-        return 'CanReadEvents' in self.values
+        return bool(self.value & _FLAGS['CanReadEvents'])
 
     @property
     def create_events(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create calendar
         events."""
-        return 'CanCreateEvents' in self.values
+        return bool(self.value & _FLAGS['CanCreateEvents'])
 
     @property
     def manage_events(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can update calendar
         events created by other members and move them to other channels."""
-        return 'CanEditEvents' in self.values
+        return bool(self.value & _FLAGS['CanEditEvents'])
 
     @property
     def remove_events(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can remove calendar
         events created by other members."""
-        return 'CanDeleteEvents' in self.values
+        return bool(self.value & _FLAGS['CanDeleteEvents'])
 
     @property
     def edit_rsvps(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can edit the RSVP status
         for members in a calendar event."""
-        return 'CanEditEventRsvps' in self.values
+        return bool(self.value & _FLAGS['CanEditEventRsvps'])
 
     @property
     def read_forums(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can read forums."""
-        return 'CanReadForums' in self.values
+        return bool(self.value & _FLAGS['CanReadForums'])
 
     @property
     def create_topics(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create forum
         topics."""
-        return 'CanCreateTopics' in self.values
+        return bool(self.value & _FLAGS['CanCreateTopics'])
 
     @property
     def create_topic_replies(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create forum topic
         replies."""
-        return 'CanCreateTopicReplies' in self.values
+        return bool(self.value & _FLAGS['CanCreateTopicReplies'])
 
     @property
     def manage_topics(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can remove forum topics
         and replies created by other members, or move them to other
         channels."""
-        return 'CanDeleteTopics' in self.values
+        return bool(self.value & _FLAGS['CanDeleteTopics'])
 
     @property
     def sticky_topics(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can sticky forum topics."""
-        return 'CanStickyTopics' in self.values
+        return bool(self.value & _FLAGS['CanStickyTopics'])
 
     @property
     def lock_topics(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can lock forum topics."""
-        return 'CanLockTopics' in self.values
+        return bool(self.value & _FLAGS['CanLockTopics'])
 
     @property
     def view_docs(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can view docs."""
-        return 'CanReadDocs' in self.values
+        return bool(self.value & _FLAGS['CanReadDocs'])
 
     @property
     def read_docs(self) -> bool:
@@ -512,24 +618,24 @@ class Permissions:
     @property
     def create_docs(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create docs."""
-        return 'CanCreateDocs' in self.values
+        return bool(self.value & _FLAGS['CanCreateDocs'])
 
     @property
     def manage_docs(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can update docs created
         by other members and move them to other channels."""
-        return 'CanEditDocs' in self.values
+        return bool(self.value & _FLAGS['CanEditDocs'])
 
     @property
     def remove_docs(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can remove docs created
         by other members."""
-        return 'CanDeleteDocs' in self.values
+        return bool(self.value & _FLAGS['CanDeleteDocs'])
 
     @property
     def see_media(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can see media."""
-        return 'CanReadMedia' in self.values
+        return bool(self.value & _FLAGS['CanReadMedia'])
 
     @property
     def read_media(self) -> bool:
@@ -539,30 +645,30 @@ class Permissions:
     @property
     def create_media(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create media."""
-        return 'CanAddMedia' in self.values
+        return bool(self.value & _FLAGS['CanAddMedia'])
 
     @property
     def manage_media(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can update media created
         by other members and move them to other channels."""
-        return 'CanEditMedia' in self.values
+        return bool(self.value & _FLAGS['CanEditMedia'])
 
     @property
     def remove_media(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can remove media created
         by other members."""
-        return 'CanRemoveMedia' in self.values
+        return bool(self.value & _FLAGS['CanRemoveMedia'])
 
     @property
     def hear_voice(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can listen to voice
         chat."""
-        return 'CanListenVoice' in self.values
+        return bool(self.value & _FLAGS['CanListenVoice'])
 
     @property
     def add_voice(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can talk in voice chat."""
-        return 'CanAddVoice' in self.values
+        return bool(self.value & _FLAGS['CanAddVoice'])
 
     @property
     def speak(self) -> bool:
@@ -573,43 +679,43 @@ class Permissions:
     def manage_voice_rooms(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create, rename, and
         delete voice rooms."""
-        return 'CanManageVoiceGroups' in self.values
+        return bool(self.value & _FLAGS['CanManageVoiceGroups'])
 
     @property
     def move_members(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can move members to other
         voice rooms."""
-        return 'CanAssignVoiceGroup' in self.values
+        return bool(self.value & _FLAGS['CanAssignVoiceGroup'])
 
     @property
     def disconnect_members(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can disconnect members
         from voice or stream rooms."""
-        return 'CanDisconnectUsers' in self.values
+        return bool(self.value & _FLAGS['CanDisconnectUsers'])
 
     @property
     def broadcast(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can broadcast their voice
         to voice rooms lower in the hierarchy when speaking in voice chat."""
-        return 'CanBroadcastVoice' in self.values
+        return bool(self.value & _FLAGS['CanBroadcastVoice'])
 
     @property
     def whisper(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can direct their voice to
         specific members."""
-        return 'CanDirectVoice' in self.values
+        return bool(self.value & _FLAGS['CanDirectVoice'])
 
     @property
     def priority_speaker(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can prioritize their
         voice when speaking in voice chat."""
-        return 'CanPrioritizeVoice' in self.values
+        return bool(self.value & _FLAGS['CanPrioritizeVoice'])
 
     @property
     def use_voice_activity(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can use the voice
         activity input mode for voice chats."""
-        return 'CanUseVoiceActivity' in self.values
+        return bool(self.value & _FLAGS['CanUseVoiceActivity'])
 
     @property
     def use_voice_activation(self) -> bool:
@@ -620,31 +726,31 @@ class Permissions:
     def mute_members(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can mute members in voice
         chat."""
-        return 'CanMuteMembers' in self.values
+        return bool(self.value & _FLAGS['CanMuteMembers'])
 
     @property
     def deafen_members(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can deafen members in
         voice chat."""
-        return 'CanDeafenMembers' in self.values
+        return bool(self.value & _FLAGS['CanDeafenMembers'])
 
     @property
     def send_voice_messages(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can send chat messages to
         voice channels."""
-        return 'CanSendVoiceMessages' in self.values
+        return bool(self.value & _FLAGS['CanSendVoiceMessages'])
 
     @property
     def create_scrims(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create matchmaking
         scrims."""
-        return 'CanCreateScrims' in self.values
+        return bool(self.value & _FLAGS['CanCreateScrims'])
 
     @property
     def create_tournaments(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create and manage
         tournaments."""
-        return 'CanManageTournaments' in self.values
+        return bool(self.value & _FLAGS['CanManageTournaments'])
 
     @property
     def manage_tournaments(self) -> bool:
@@ -655,13 +761,13 @@ class Permissions:
     def register_for_tournaments(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can register the server
         for tournaments."""
-        return 'CanRegisterForTournaments' in self.values
+        return bool(self.value & _FLAGS['CanRegisterForTournaments'])
 
     @property
     def manage_emojis(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create and manage
         server emojis."""
-        return 'CanManageEmotes' in self.values
+        return bool(self.value & _FLAGS['CanManageEmotes'])
 
     @property
     def manage_emotes(self) -> bool:
@@ -672,25 +778,25 @@ class Permissions:
     def change_nickname(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can change their own
         nickname."""
-        return 'CanChangeNickname' in self.values
+        return bool(self.value & _FLAGS['CanChangeNickname'])
 
     @property
     def manage_nicknames(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can change the nicknames
         of other members."""
-        return 'CanManageNicknames' in self.values
+        return bool(self.value & _FLAGS['CanManageNicknames'])
 
     @property
     def view_form_responses(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can view all form
         responses."""
-        return 'CanViewFormResponses' in self.values
+        return bool(self.value & _FLAGS['CanViewFormResponses'])
 
     @property
     def view_poll_responses(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can view all poll
         results."""
-        return 'CanViewPollResponses' in self.values
+        return bool(self.value & _FLAGS['CanViewPollResponses'])
 
     @property
     def view_poll_results(self) -> bool:
@@ -700,7 +806,7 @@ class Permissions:
     @property
     def view_list_items(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can view list items."""
-        return 'CanReadListItems' in self.values
+        return bool(self.value & _FLAGS['CanReadListItems'])
 
     @property
     def read_list_items(self) -> bool:
@@ -710,36 +816,36 @@ class Permissions:
     @property
     def create_list_items(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create list items."""
-        return 'CanCreateListItems' in self.values
+        return bool(self.value & _FLAGS['CanCreateListItems'])
 
     @property
     def manage_list_items(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can update list items
         created by other members and move them to other channels."""
-        return 'CanUpdateListItems' in self.values
+        return bool(self.value & _FLAGS['CanUpdateListItems'])
 
     @property
     def remove_list_items(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can remove list items
         created by other members."""
-        return 'CanDeleteListItems' in self.values
+        return bool(self.value & _FLAGS['CanDeleteListItems'])
 
     @property
     def complete_list_items(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can complete list items
         created by other members."""
-        return 'CanCompleteListItems' in self.values
+        return bool(self.value & _FLAGS['CanCompleteListItems'])
 
     @property
     def reorder_list_items(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can reorder list items."""
-        return 'CanReorderListItems' in self.values
+        return bool(self.value & _FLAGS['CanReorderListItems'])
 
     @property
     def view_brackets(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can view tournament
         brackets."""
-        return 'CanViewBracket' in self.values
+        return bool(self.value & _FLAGS['CanViewBracket'])
 
     @property
     def read_brackets(self) -> bool:
@@ -750,13 +856,13 @@ class Permissions:
     def report_scores(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can report match scores
         on behalf of the server."""
-        return 'CanReportScores' in self.values
+        return bool(self.value & _FLAGS['CanReportScores'])
 
     @property
     def view_schedules(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can view members'
         schedules."""
-        return 'CanReadSchedules' in self.values
+        return bool(self.value & _FLAGS['CanReadSchedules'])
 
     @property
     def read_schedules(self) -> bool:
@@ -767,42 +873,42 @@ class Permissions:
     def create_schedules(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can let the server know
         their available schedule."""
-        return 'CanCreateSchedule' in self.values
+        return bool(self.value & _FLAGS['CanCreateSchedule'])
 
     @property
     def remove_schedules(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can remove availabilities
         created by other members."""
-        return 'CanDeleteSchedule' in self.values
+        return bool(self.value & _FLAGS['CanDeleteSchedule'])
 
     @property
     def manage_bots(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can create and edit
         flowbots."""
-        return 'CanManageBots' in self.values
+        return bool(self.value & _FLAGS['CanManageBots'])
 
     @property
     def manage_server_xp(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can manage XP for
         members."""
-        return 'CanManageServerXp' in self.values
+        return bool(self.value & _FLAGS['CanManageServerXp'])
 
     @property
     def view_streams(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can view streams."""
-        return 'CanReadStreams' in self.values
+        return bool(self.value & _FLAGS['CanReadStreams'])
 
     @property
     def join_stream_voice(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can listen in stream
         channels."""
-        return 'CanJoinStreamVoice' in self.values
+        return bool(self.value & _FLAGS['CanJoinStreamVoice'])
 
     @property
     def add_stream(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can stream as well as
         speak in stream channels."""
-        return 'CanCreateStreams' in self.values
+        return bool(self.value & _FLAGS['CanCreateStreams'])
 
     @property
     def stream(self) -> bool:
@@ -813,25 +919,25 @@ class Permissions:
     def send_stream_messages(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can send messages in
         stream channels."""
-        return 'CanSendStreamMessages' in self.values
+        return bool(self.value & _FLAGS['CanSendStreamMessages'])
 
     @property
     def add_stream_voice(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can speak in stream
         channels."""
-        return 'CanAddStreamVoice' in self.values
+        return bool(self.value & _FLAGS['CanAddStreamVoice'])
 
     @property
     def use_stream_voice_activity(self) -> bool:
         """:class:`bool`: Returns ``True`` if a user can use voice activity in
         stream channels."""
-        return 'CanUseVoiceActivityInStream' in self.values
+        return bool(self.value & _FLAGS['CanUseVoiceActivityInStream'])
 
     @property
     def receive_all_events(self) -> bool:
         """:class:`bool`: Returns ``True`` if a bot can receive all server
         socket events instead of only those that match its prefix."""
-        return 'CanReceiveAllSocketEvents' in self.values
+        return bool(self.value & _FLAGS['CanReceiveAllSocketEvents'])
 
 
 VALUES_BY_CATEGORY = {
@@ -1072,6 +1178,59 @@ VALID_NAME_MAP = {
     'receive_all_events': 'CanReceiveAllSocketEvents',
 }
 
+# Each permission value is assigned a bit. Values that the library does not
+# know about yet (e.g. newly added permissions received from the API) are
+# assigned one on the fly so that they survive a round trip.
+_FLAGS: Dict[str, int] = {}
+_VALUES_BY_FLAG: Dict[int, str] = {}
+
+
+def _register_flag(value: str) -> int:
+    flag = 1 << len(_FLAGS)
+    _FLAGS[value] = flag
+    _VALUES_BY_FLAG[flag] = value
+    return flag
+
+
+def _flags_from_values(values: Iterable[str]) -> int:
+    flags = 0
+    for value in values:
+        try:
+            flags |= _FLAGS[value]
+        except KeyError:
+            flags |= _register_flag(value)
+    return flags
+
+
+def _values_from_flags(flags: int) -> List[str]:
+    values = []
+    while flags:
+        flag = flags & -flags
+        values.append(_VALUES_BY_FLAG[flag])
+        flags ^= flag
+    return values
+
+
+for category_values in VALUES_BY_CATEGORY.values():
+    for value in category_values:
+        if value not in _FLAGS:
+            _register_flag(value)
+
+for value in VALID_NAME_MAP.values():
+    if value not in _FLAGS:
+        _register_flag(value)
+
+_CATEGORY_FLAGS: Dict[str, int] = {
+    category: _flags_from_values(category_values)
+    for category, category_values in VALUES_BY_CATEGORY.items()
+}
+_ALL_FLAGS: int = _flags_from_values(
+    value
+    for category_values in VALUES_BY_CATEGORY.values()
+    for value in category_values
+)
+
+
 # Reverse the map but with no aliases
 REVERSE_VALID_NAME_MAP: Dict[str, str] = {}
 for key, value in VALID_NAME_MAP.items():
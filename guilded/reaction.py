@@ -24,9 +24,13 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, AsyncIterator, Literal, Optional, Set, Union
+import asyncio
+import collections
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Literal, Optional, Set, Union
 
 from .emote import Emote
+from .errors import NotFound
+from .message import _prefer_bulk_fetch
 
 if TYPE_CHECKING:
     from guilded.abc import ServerChannel, User as abc_User
@@ -138,11 +142,14 @@ class Reaction:
         self,
         *,
         limit: Optional[int] = None,
-        after: Optional[abc_User] = None
+        after: Optional[abc_User] = None,
+        max_concurrency: int = 8,
     ) -> AsyncIterator[Union[User, Member]]:
         """An :term:`asynchronous iterator` for the users that have reacted with this emote to this content.
 
-        Results may not be in any expected order.
+        Results may not be in any expected order. Cached users are yielded
+        immediately, while uncached users are fetched concurrently and
+        yielded as they arrive.
 
         Examples
         ---------
@@ -166,6 +173,11 @@ class Reaction:
         after: Optional[:class:`~.abc.User`]
             The user to begin pagination at.
             This may be an :class:`.Object`\.
+        max_concurrency: :class:`int`
+            The maximum number of requests to have in flight at once while
+            fetching uncached users. Defaults to ``8``.
+
+            .. versionadded:: 1.14
 
         Yields
         -------
@@ -182,73 +194,71 @@ class Reaction:
             ``after`` is not a valid option.
         """
 
-        if limit is None:
-            limit = self.count
-
-        after_index = -1
         user_ids = list(self._user_ids)
-
-        while limit > 0:
-            if after is not None:
-                after_index = user_ids.index(after.id)
-
-            user_ids = list(self._user_ids)[(after_index + 1):]
-            server = self.parent.server
-
-            cached_users = []
-            new_user_ids = []
-
-            if server is not None:
-                for uid in user_ids:
-                    user = server.get_member(uid) or self._state._get_user(uid)
-                    if user is None:
-                        new_user_ids.append(uid)
-                    else:
-                        cached_users.append(user)
-
-                if new_user_ids:
-                    data = await self._state.get_detailed_team_members(
-                        server.id,
-                        user_ids=new_user_ids,
-                        ids_for_basic_info=new_user_ids,
-                    )
-                    for uid in data:
-                        new_user_ids.remove(uid)
-
-                    data = list(data.values())
-
+        if after is not None:
+            # Sets keep a stable order while unchanged, so the snapshot above
+            # only has to be searched once
+            user_ids = user_ids[user_ids.index(after.id) + 1:]
+        if limit is not None:
+            user_ids = user_ids[:max(limit, 0)]
+
+        state = self._state
+        server = self.parent.server
+
+        uncached: List[str] = []
+        for user_id in user_ids:
+            user = (server and server.get_member(user_id)) or state._get_user(user_id)
+            if user is None:
+                uncached.append(user_id)
             else:
-                data = []
-                for uid in user_ids:
-                    user = self._state._get_user(uid)
-                    if user is None:
-                        new_user_ids.append(uid)
-                    else:
-                        cached_users.append(user)
-
-            if cached_users:
-                limit -= len(cached_users)
-                after = cached_users[-1]
+                yield user
 
-                for cached_user in cached_users:
-                    yield cached_user
+        if not uncached:
+            return
 
-                continue
+        members: Dict[str, Member] = {}
+        if server is not None and _prefer_bulk_fetch(len(uncached), server._member_count or len(server._members), max_concurrency):
+            members = {member.id: member for member in await server.fetch_members()}
 
-            if data:
-                # server will never be None here
-                limit -= len(data)
-                after = data[-1]['id']
+        queue: asyncio.Queue = asyncio.Queue()
+        pending = collections.deque(uncached)
 
-                for raw_member in data:
-                    member = self._state.create_member(data=raw_member, server=server)
-                    yield member
-
-                continue
-
-            for uid in new_user_ids:
-                raw_user = await self._state.get_user(uid)
-                yield User(state=self._state, data=raw_user)
+        async def worker() -> None:
+            try:
+                while pending:
+                    user_id = pending.popleft()
+                    user = members.get(user_id)
+                    if user is None:
+                        user = await self._fetch_reactor(user_id, bulk_fetched=bool(members))
+                    queue.put_nowait(user)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                queue.put_nowait(exc)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(max(min(max_concurrency, len(uncached)), 1))]
+        try:
+            for _ in range(len(uncached)):
+                user = await queue.get()
+                if isinstance(user, Exception):
+                    raise user
+                yield user
+
+        finally:
+            for task in workers:
+                task.cancel()
+
+    async def _fetch_reactor(self, user_id: str, *, bulk_fetched: bool = False) -> Union[User, Member]:
+        server = self.parent.server
+        if server is not None and not bulk_fetched:
+            try:
+                return await server.fetch_member(user_id)
+            except NotFound:
+                # They have since left the server
+                pass
+
+        data = await self._state.get_user(user_id)
+        return self._state.create_user(data=data['user'])
 
 
 class RawReactionActionEvent:
@@ -24,12 +24,12 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
 
 from .asset import Asset
 from .colour import Colour
 from .mixins import Hashable
-from .utils import ISO8601, MISSING
+from .utils import MISSING, _ISO8601Slot, _intern, _intern_id
 from .permissions import Permissions
 
 if TYPE_CHECKING:
@@ -99,8 +99,8 @@ class Role(Hashable):
         'id',
         'name',
         '_colours',
-        'created_at',
-        'updated_at',
+        '_created_at',
+        '_updated_at',
         '_icon',
         '_permissions',
         'bot_user_id',
@@ -111,17 +111,20 @@ class Role(Hashable):
         'base',
     )
 
+    created_at = _ISO8601Slot('_created_at')
+    updated_at = _ISO8601Slot('_updated_at')
+
     def __init__(self, *, state, data: RolePayload):
         self._state = state
-        self.server_id: str = data.get('serverId')
+        self.server_id: str = _intern(data.get('serverId'))
 
-        self.id: int = data['id']
+        self.id: int = _intern_id(data['id'])
         self.name: str = data.get('name') or ''
         self._colours: List[int] = data.get('colors') or []
-        self._permissions = data.get('permissions') or []
+        self._permissions: Permissions = Permissions(*(data.get('permissions') or []))
 
-        self.created_at = ISO8601(data.get('createdAt'))
-        self.updated_at = ISO8601(data.get('updatedAt'))
+        self._created_at: Optional[str] = data.get('createdAt')
+        self._updated_at: Optional[str] = data.get('updatedAt')
 
         self._icon = data.get('icon')
 
@@ -182,13 +185,45 @@ class Role(Hashable):
 
     @property
     def members(self) -> List[Member]:
-        """List[:class:`.Member`]: The list of members that have this role."""
-        all_members = list(self.server._members.values())
+        """List[:class:`.Member`]: The list of cached members that have this role."""
+        return list(self.iter_members())
+
+    @property
+    def member_count(self) -> int:
+        """:class:`int`: The number of cached members that have this role.
+
+        .. versionadded:: 1.14
+        """
+        server = self.server
+        if self.base:
+            return len(server._members)
+        return len(server._role_member_ids.get(self.id, ()))
+
+    def iter_members(self) -> Iterator[Member]:
+        """Returns an iterator over the cached members that have this role.
+
+        Unlike :attr:`.members`, this does not build a list. The member cache
+        must not be modified while iterating.
+
+        .. versionadded:: 1.14
+
+        Yields
+        -------
+        :class:`.Member`
+            A member that has this role.
+        """
+        server = self.server
         if self.base:
-            return all_members
+            yield from server._members.values()
+            return
 
-        role_id = self.id
-        return [member for member in all_members if role_id in member._role_ids]
+        # Avoid the cache store's ``get`` since it may expire entries, which
+        # would change the index mid-iteration
+        members = server._members
+        for member_id in server._role_member_ids.get(self.id, ()):
+            member = dict.get(members, member_id)
+            if member is not None:
+                yield member
 
     @property
     def icon(self) -> Optional[Asset]:
@@ -233,7 +268,8 @@ class Role(Hashable):
     @property
     def permissions(self) -> Permissions:
         """:class:`.Permissions`: The permissions that the role has."""
-        return Permissions(*self._permissions)
+        # A copy, so that changing it does not affect the cached role
+        return Permissions._from_value(self._permissions.value)
 
     @property
     def position(self) -> int:
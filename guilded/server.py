@@ -51,22 +51,27 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import re
-from typing import TYPE_CHECKING, Dict, Optional, List, Union
+import time
+from typing import TYPE_CHECKING, Any, Container, Dict, Iterable, Optional, List, Set, Tuple, Union
 
 from .abc import ServerChannel, User
 from .asset import Asset
+from .cache import _NameIndex
 from .channel import AnnouncementChannel, ChatChannel, DocsChannel, ForumChannel, ListChannel, MediaChannel, SchedulingChannel, Thread, VoiceChannel
 from .colour import Colour
-from .errors import InvalidData
+from .errors import HTTPException, InvalidData
 from .enums import ChannelVisibility, ServerSubscriptionTierType, ServerType, UserType, try_enum, ChannelType
 from .group import Group
 from .mixins import Hashable
+from .override import _PermissionOverrides
+from .permissions import Permissions
 from .role import Role
 from .subscription import ServerSubscriptionTier
-from .user import Member, MemberBan
-from .utils import ISO8601, MISSING, get
+from .user import Member, MemberBan, _change_member_roles
+from .utils import MISSING, find, get, _ISO8601Slot, _intern, _run_concurrently
 
 if TYPE_CHECKING:
     from .types.server import Server as ServerPayload
@@ -143,10 +148,46 @@ class Server(Hashable):
         Whether the server is verified.
     """
 
+    __slots__ = (
+        '_state',
+        'id',
+        'type',
+        '_categories',
+        '_channels',
+        '_threads',
+        '_groups',
+        '_emotes',
+        '_members',
+        '_role_member_ids',
+        '_member_names',
+        '_roles',
+        '_flowbots',
+        '_channel_overrides',
+        '_category_overrides',
+        '_override_fetches',
+        '_resolved_permissions',
+        '_base_role',
+        '_member_count',
+        '_last_activity',
+        '_members_filled',
+        'owner_id',
+        'name',
+        'slug',
+        '_created_at',
+        'about',
+        'default_channel_id',
+        'verified',
+        'raw_timezone',
+        'avatar',
+        'banner',
+    )
+
+    created_at = _ISO8601Slot('_created_at')
+
     def __init__(self, *, state, data, member_count: Optional[int] = None):
         self._state = state
 
-        self.id: str = data['id']
+        self.id: str = _intern(data['id'])
         self.type: Optional[ServerType]
         if data.get('type'):
             self.type = try_enum(ServerType, data['type'])
@@ -158,17 +199,32 @@ class Server(Hashable):
         self._threads: Dict[str, Thread] = {}
         self._groups: Dict[str, Group] = {}
         self._emotes: Dict[int, Emote] = {}
-        self._members: Dict[str, Member] = {}
+        self._members: Dict[str, Member] = state._member_cache_policy._create_store(on_evict=self._on_member_evicted)
+        # Role ID -> IDs of the cached members that have the role
+        self._role_member_ids: Dict[int, Set[str]] = {}
+        # Casefolded names and nicknames -> IDs of the cached members that have them
+        self._member_names: Optional[_NameIndex] = _NameIndex() if state._name_index else None
         self._roles: Dict[int, Role] = {}
         self._flowbots: Dict[str, FlowBot] = {}
 
+        # Permission overrides fetched for channels and categories, kept up
+        # to date by gateway events, and effective permission values resolved from
+        # them keyed by member ID then channel ID
+        self._channel_overrides: Dict[str, _PermissionOverrides] = {}
+        self._category_overrides: Dict[int, _PermissionOverrides] = {}
+        self._override_fetches: Dict[Tuple[str, Any], asyncio.Future] = {}
+        self._resolved_permissions: Dict[str, Dict[str, int]] = {}
+
         self._base_role: Optional[Role] = None
         self._member_count: Optional[int] = member_count
+        # Monotonic timestamp of the last gateway event received for this server
+        self._last_activity: float = time.monotonic()
+        self._members_filled: bool = False
 
-        self.owner_id: str = data.get('ownerId')
+        self.owner_id: str = _intern(data.get('ownerId'))
         self.name: str = data.get('name')
         self.slug: str = data.get('url')
-        self.created_at: datetime.datetime = ISO8601(data.get('createdAt'))
+        self._created_at: Optional[str] = data.get('createdAt')
         self.about: str = data.get('about') or ''
         self.default_channel_id: Optional[str] = data.get('defaultChannelId')
         self.verified: bool = data.get('isVerified') or False
@@ -176,7 +232,7 @@ class Server(Hashable):
 
         for member in data.get('members') or []:
             member['serverId'] = self.id
-            self._members[member['id']] = self._state.create_member(data=member, server=self)
+            self._state.add_to_member_cache(self._state.create_member(data=member, server=self))
 
         for role_id, role in data.get('rolesById', {}).items():
             if role_id.isdigit():
@@ -205,6 +261,161 @@ class Server(Hashable):
     def __repr__(self) -> str:
         return f'<Server id={self.id!r} name={self.name!r}>'
 
+    def _index_member_roles(self, member: Member, /) -> None:
+        for role_id in member._role_ids:
+            try:
+                self._role_member_ids[role_id].add(member.id)
+            except KeyError:
+                self._role_member_ids[role_id] = {member.id}
+
+    def _unindex_member_roles(self, member: Member, /) -> None:
+        for role_id in member._role_ids:
+            member_ids = self._role_member_ids.get(role_id)
+            if member_ids is not None:
+                member_ids.discard(member.id)
+                if not member_ids:
+                    del self._role_member_ids[role_id]
+
+    def _prune_role_member_ids(self, role_ids: Container[int], /) -> None:
+        # Drops the index entries of roles that no longer exist
+        for role_id in [role_id for role_id in self._role_member_ids if role_id not in role_ids]:
+            del self._role_member_ids[role_id]
+
+    def _add_member(self, member: Member, /) -> None:
+        previous = self._members.pop(member.id, None)
+        if previous is not None:
+            self._unindex_member_roles(previous)
+
+        self._members[member.id] = member
+        self._index_member_roles(member)
+        self._resolved_permissions.pop(member.id, None)
+        if self._member_names is not None:
+            self._member_names.add(member.id, (member.name, member.nick))
+
+    def _remove_member(self, member_id: str, /) -> Optional[Member]:
+        member = self._members.pop(member_id, None)
+        if member is not None:
+            self._unindex_member_roles(member)
+        self._resolved_permissions.pop(member_id, None)
+        if self._member_names is not None:
+            self._member_names.remove(member_id)
+        return member
+
+    def _clear_members(self) -> None:
+        self._members.clear()
+        self._role_member_ids.clear()
+        self._resolved_permissions.clear()
+        if self._member_names is not None:
+            self._member_names.clear()
+
+    def _on_member_evicted(self, member_id: str, member: Member, /) -> None:
+        self._unindex_member_roles(member)
+        self._resolved_permissions.pop(member_id, None)
+        if self._member_names is not None:
+            self._member_names.remove(member_id)
+
+    def _reindex_member_names(self, member: Member, /) -> None:
+        if self._member_names is not None and dict.get(self._members, member.id) is member:
+            self._member_names.add(member.id, (member.name, member.nick))
+
+    def _set_member_roles(self, member: Member, role_ids: Set[int], /) -> None:
+        # Only the cached instance of a member is indexed
+        cached = dict.get(self._members, member.id) is member
+        if cached:
+            self._unindex_member_roles(member)
+
+        member._role_ids = role_ids
+        self._resolved_permissions.pop(member.id, None)
+
+        if cached:
+            self._index_member_roles(member)
+
+    def _invalidate_role_permissions(self, role: Role, /) -> None:
+        if role.base:
+            self._resolved_permissions.clear()
+            return
+
+        for member_id in self._role_member_ids.get(role.id, ()):
+            self._resolved_permissions.pop(member_id, None)
+
+    def _invalidate_channel_permissions(self, channel_ids: Iterable[str], /) -> None:
+        channel_ids = set(channel_ids)
+        for resolved in self._resolved_permissions.values():
+            for channel_id in channel_ids:
+                resolved.pop(channel_id, None)
+
+    def _invalidate_category_permissions(self, category_id: int, /) -> None:
+        self._invalidate_channel_permissions(
+            channel.id for channel in self._channels.values() if channel.category_id == category_id
+        )
+
+    def _update_override(
+        self,
+        *,
+        channel_id: Optional[str] = None,
+        category_id: Optional[int] = None,
+        role_id: Optional[int] = None,
+        user_id: Optional[str] = None,
+        permissions: Optional[Dict[str, Optional[bool]]] = None,
+    ) -> None:
+        # Apply an override change from the gateway to the cached overrides,
+        # if they have been fetched. ``permissions`` is None for deletions.
+        if channel_id is not None:
+            overrides = self._channel_overrides.get(channel_id)
+            self._invalidate_channel_permissions((channel_id,))
+        else:
+            overrides = self._category_overrides.get(category_id)
+            self._invalidate_category_permissions(category_id)
+
+        if overrides is None:
+            return
+
+        if role_id is not None:
+            if permissions is None:
+                overrides.roles.pop(role_id, None)
+            else:
+                overrides.set_role(role_id, permissions)
+        else:
+            if permissions is None:
+                overrides.users.pop(user_id, None)
+            else:
+                overrides.set_user(user_id, permissions)
+
+    async def _fetch_overrides(self, kind: str, id: Any, /) -> _PermissionOverrides:
+        if kind == 'channel':
+            role_data, user_data = await asyncio.gather(
+                self._state.get_channel_role_overrides(self.id, id),
+                self._state.get_channel_user_overrides(self.id, id),
+            )
+            overrides = _PermissionOverrides._from_data(role_data['channelRolePermissions'], user_data['channelUserPermissions'])
+            self._channel_overrides[id] = overrides
+        else:
+            role_data, user_data = await asyncio.gather(
+                self._state.get_category_role_overrides(self.id, id),
+                self._state.get_category_user_overrides(self.id, id),
+            )
+            overrides = _PermissionOverrides._from_data(role_data['channelCategoryRolePermissions'], user_data['channelCategoryUserPermissions'])
+            self._category_overrides[id] = overrides
+
+        return overrides
+
+    async def _get_overrides(self, kind: str, id: Any, /) -> _PermissionOverrides:
+        cache = self._channel_overrides if kind == 'channel' else self._category_overrides
+        try:
+            return cache[id]
+        except KeyError:
+            pass
+
+        # Share a single fetch between concurrent resolutions
+        key = (kind, id)
+        future = self._override_fetches.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_overrides(kind, id))
+            self._override_fetches[key] = future
+            future.add_done_callback(lambda _: self._override_fetches.pop(key, None))
+
+        return await asyncio.shield(future)
+
     def _update(self, data: ServerPayload, /) -> None:
         self.name = data['name']
         self.owner_id = data.get('ownerId', self.owner_id)
@@ -436,6 +647,74 @@ class Server(Hashable):
         """Optional[:class:`.Member`]: Get a member by their ID from the cache."""
         return self._members.get(member_id)
 
+    def get_member_named(self, name: str, /) -> Optional[Member]:
+        """Get a member by their name or nickname from the cache.
+
+        This is case-sensitive. If more than one member matches, any one of
+        them may be returned.
+
+        .. versionadded:: 1.14
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The name or nickname of the member.
+
+        Returns
+        --------
+        Optional[:class:`.Member`]
+            The member with the name or nickname, if any.
+        """
+        if self._member_names is None:
+            return find(lambda m: m.name == name or m.nick == name, self._members.values())
+
+        for member_id in tuple(self._member_names.find(name)):
+            member = self._members.get(member_id)
+            if member is not None and (member.name == name or member.nick == name):
+                return member
+
+        return None
+
+    def search_members(self, query: str, /, *, limit: Optional[int] = None) -> List[Member]:
+        """Get the cached members whose name or nickname starts with ``query``,
+        ignoring case.
+
+        This is fastest when the client was created with ``name_index=True``.
+
+        .. versionadded:: 1.14
+
+        Parameters
+        -----------
+        query: :class:`str`
+            The start of the name or nickname to search for.
+        limit: Optional[:class:`int`]
+            The maximum number of members to return.
+
+        Returns
+        --------
+        List[:class:`.Member`]
+            The matching members.
+        """
+        if self._member_names is None:
+            query = query.casefold()
+            members = []
+            for member in self._members.values():
+                if (
+                    (member.name and member.name.casefold().startswith(query))
+                    or (member.nick and member.nick.casefold().startswith(query))
+                ):
+                    members.append(member)
+                    if limit is not None and len(members) >= limit:
+                        break
+            return members
+
+        members = []
+        for member_id in self._member_names.find_prefix(query, limit=limit):
+            member = self._members.get(member_id)
+            if member is not None:
+                members.append(member)
+        return members
+
     def get_group(self, group_id: str, /) -> Optional[Group]:
         """Optional[:class:`~guilded.Group`]: Get a group by its ID from the cache."""
         return self._groups.get(group_id)
@@ -465,6 +744,79 @@ class Server(Hashable):
         """Optional[:class:`.Role`]: Get a role by its ID from the cache."""
         return self._roles.get(role_id)
 
+    async def resolve_permissions(self, member: Member, channel: ServerChannel, /) -> Permissions:
+        """|coro|
+
+        Resolve the effective permissions that a member has in a channel.
+
+        This starts from :attr:`Member.server_permissions` and applies the
+        role and user overrides of the channel's category and then of the
+        channel itself. Role overrides are applied in order of role priority
+        and user overrides take precedence over role overrides.
+
+        Overrides are fetched the first time a channel or category is
+        resolved and are then kept up to date by gateway events, as are the
+        results of this method, so repeated calls are cheap.
+
+        .. versionadded:: 1.14
+
+        Parameters
+        -----------
+        member: :class:`.Member`
+            The member to resolve permissions for.
+        channel: :class:`~.abc.ServerChannel`
+            The channel to resolve permissions in.
+
+        Raises
+        -------
+        Forbidden
+            You do not have permission to view the channel's overrides.
+        HTTPException
+            Fetching the overrides failed.
+
+        Returns
+        --------
+        :class:`.Permissions`
+            The member's effective permissions in the channel.
+        """
+        if member.is_owner() or member.id == self.owner_id:
+            return Permissions.all()
+
+        resolved = self._resolved_permissions.get(member.id)
+        if resolved is not None:
+            try:
+                return Permissions._from_value(resolved[channel.id])
+            except KeyError:
+                pass
+
+        category_id = channel.category_id
+        if category_id is not None:
+            category_overrides, channel_overrides = await asyncio.gather(
+                self._get_overrides('category', category_id),
+                self._get_overrides('channel', channel.id),
+            )
+        else:
+            category_overrides = None
+            channel_overrides = await self._get_overrides('channel', channel.id)
+
+        value = member.server_permissions.value
+        roles = [self._roles[role_id] for role_id in member._role_ids if role_id in self._roles]
+        if self._base_role is not None and self._base_role.id not in member._role_ids:
+            # Everybody has the base role even if it isn't listed
+            roles.append(self._base_role)
+            value |= self._base_role._permissions.value
+        role_ids = [role.id for role in sorted(roles, key=lambda role: role.priority)]
+
+        if category_overrides is not None:
+            value = category_overrides.apply(value, role_ids, member.id)
+        value = channel_overrides.apply(value, role_ids, member.id)
+
+        # Only cached members are kept up to date by events
+        if dict.get(self._members, member.id) is member:
+            self._resolved_permissions.setdefault(member.id, {})[channel.id] = value
+
+        return Permissions._from_value(value)
+
     async def leave(self):
         """|coro|
 
@@ -1228,20 +1580,32 @@ class Server(Hashable):
         data = await self._state.get_members(self.id)
         data = data['members']
 
-        self._members.clear()
+        self._clear_members()
+        self._members_filled = True
         for member_data in data:
             try:
                 member = self._state.create_member(server=self, data=member_data)
             except:
                 continue
             else:
-                self._members[member.id] = member
+                self._state.add_to_member_cache(member)
 
-    async def bulk_award_member_xp(self, amount: int, *members: Member) -> Dict[str, int]:
+    async def bulk_award_member_xp(
+        self,
+        amount: int,
+        *members: Member,
+        chunk_size: int = 100,
+        max_concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> Dict[str, Union[int, HTTPException]]:
         """|coro|
 
         Bulk award XP to multiple members.
 
+        Members are sent in chunks of ``chunk_size``, with up to
+        ``max_concurrency`` chunks in flight at once. Cached members' XP is
+        updated with the returned totals.
+
         .. note::
 
             This method *modifies* the current values.
@@ -1249,6 +1613,9 @@ class Server(Hashable):
 
         .. versionadded:: 1.11
 
+        .. versionchanged:: 1.14
+            Members are now sent in concurrent chunks.
+
         Parameters
         -----------
         amount: :class:`int`
@@ -1256,23 +1623,59 @@ class Server(Hashable):
             Could be a negative value to remove XP.
         members: Tuple[:class:`.Member`]
             The members to award XP to.
+        chunk_size: :class:`int`
+            The maximum number of members to send per request.
+            Defaults to 100.
+
+            .. versionadded:: 1.14
+        max_concurrency: :class:`int`
+            The maximum number of requests to have in flight at once.
+            Defaults to 4.
+
+            .. versionadded:: 1.14
+        return_exceptions: :class:`bool`
+            Whether to map the members of a chunk that failed to the
+            exception it raised instead of raising it. Defaults to ``False``.
+
+            .. versionadded:: 1.14
 
         Returns
         --------
         :class:`dict`
             A mapping of member ID to the total amount of XP they have after
             the operation.
-        """
 
-        data = await self._state.bulk_award_member_xp(self.id, [m.id for m in members], amount)
-        totals: Dict[str, int] = data['totalsByUserId']
-        return totals
+        Raises
+        -------
+        HTTPException
+            A chunk failed and ``return_exceptions`` is ``False``. Every
+            other chunk is still attempted before this is raised.
+        """
+        return await self._bulk_member_xp(
+            self._state.bulk_award_member_xp,
+            amount,
+            members,
+            chunk_size=chunk_size,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
 
-    async def bulk_set_member_xp(self, total: int, *members: Member) -> Dict[str, int]:
+    async def bulk_set_member_xp(
+        self,
+        total: int,
+        *members: Member,
+        chunk_size: int = 100,
+        max_concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> Dict[str, Union[int, HTTPException]]:
         """|coro|
 
         Bulk set multiple members' total XP.
 
+        Members are sent in chunks of ``chunk_size``, with up to
+        ``max_concurrency`` chunks in flight at once. Cached members' XP is
+        updated with the returned totals.
+
         .. note::
 
             This method *replaces* the current values.
@@ -1280,24 +1683,201 @@ class Server(Hashable):
 
         .. versionadded:: 1.11
 
+        .. versionchanged:: 1.14
+            Members are now sent in concurrent chunks.
+
         Parameters
         -----------
         total: :class:`int`
             The total amount of XP each member should have.
         members: Tuple[:class:`.Member`]
             The members to set XP for.
+        chunk_size: :class:`int`
+            The maximum number of members to send per request.
+            Defaults to 100.
+
+            .. versionadded:: 1.14
+        max_concurrency: :class:`int`
+            The maximum number of requests to have in flight at once.
+            Defaults to 4.
+
+            .. versionadded:: 1.14
+        return_exceptions: :class:`bool`
+            Whether to map the members of a chunk that failed to the
+            exception it raised instead of raising it. Defaults to ``False``.
+
+            .. versionadded:: 1.14
 
         Returns
         --------
         :class:`dict`
             A mapping of member ID to the total amount of XP they have after
             the operation.
+
+        Raises
+        -------
+        HTTPException
+            A chunk failed and ``return_exceptions`` is ``False``. Every
+            other chunk is still attempted before this is raised.
         """
+        return await self._bulk_member_xp(
+            self._state.bulk_set_member_xp,
+            total,
+            members,
+            chunk_size=chunk_size,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+    async def _bulk_member_xp(
+        self,
+        request,
+        value: int,
+        members: Iterable[Member],
+        *,
+        chunk_size: int,
+        max_concurrency: int,
+        return_exceptions: bool,
+    ) -> Dict[str, Union[int, HTTPException]]:
+        # The passed objects are updated too, since they may not be cached
+        targets: Dict[str, Member] = {member.id: member for member in members}
+        user_ids = list(targets)
+        chunk_size = max(chunk_size, 1)
+        chunks = [user_ids[index:index + chunk_size] for index in range(0, len(user_ids), chunk_size)]
+
+        async def send(chunk: List[str]) -> Dict[str, int]:
+            data = await request(self.id, chunk, value)
+            return data['totalsByUserId']
+
+        outcomes = await _run_concurrently(send, chunks, max_concurrency=max_concurrency)
+
+        totals: Dict[str, Union[int, HTTPException]] = {}
+        failure: Optional[Exception] = None
+        for chunk, outcome in zip(chunks, outcomes):
+            if isinstance(outcome, Exception):
+                if not isinstance(outcome, HTTPException) or not return_exceptions:
+                    failure = failure or outcome
+                    continue
+                totals.update(dict.fromkeys(chunk, outcome))
+                continue
+
+            for user_id, xp in outcome.items():
+                totals[user_id] = xp
+                member = targets.get(user_id)
+                if member is not None:
+                    member._update_xp(xp)
+                cached = self._members.get(user_id)
+                if cached is not None and cached is not member:
+                    cached._update_xp(xp)
+
+        if failure is not None:
+            raise failure
 
-        data = await self._state.bulk_set_member_xp(self.id, [m.id for m in members], total)
-        totals: Dict[str, int] = data['totalsByUserId']
         return totals
 
+    async def bulk_add_roles(
+        self,
+        members: Iterable[Member],
+        roles: Iterable[Role],
+        *,
+        max_concurrency: int = 5,
+        return_exceptions: bool = False,
+    ) -> Dict[str, Dict[int, Optional[HTTPException]]]:
+        """|coro|
+
+        Add every role in ``roles`` to every member in ``members``.
+
+        Requests are made concurrently. Members that are cached as already
+        having a role are skipped for that role without a request, and a
+        failure for one member or role does not stop the others.
+
+        .. versionadded:: 1.14
+
+        Parameters
+        -----------
+        members: Iterable[:class:`.Member`]
+            The members to add the roles to.
+        roles: Iterable[:class:`.Role`]
+            The roles to add.
+        max_concurrency: :class:`int`
+            The maximum number of requests to have in flight at once.
+            Defaults to 5.
+        return_exceptions: :class:`bool`
+            Whether to map changes that failed to the exception that was
+            raised instead of raising it. Defaults to ``False``.
+
+        Returns
+        --------
+        Dict[:class:`str`, Dict[:class:`int`, Optional[:exc:`HTTPException`]]]
+            A mapping of member ID to a mapping of the ID of each role that
+            was attempted to the exception that adding it raised, or ``None``
+            if it was added. Members with nothing to change are left out.
+
+        Raises
+        -------
+        HTTPException
+            A change failed and ``return_exceptions`` is ``False``. Every
+            other change is still attempted before this is raised.
+        """
+        return await _change_member_roles(
+            members,
+            list(roles),
+            add=True,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+    async def bulk_remove_roles(
+        self,
+        members: Iterable[Member],
+        roles: Iterable[Role],
+        *,
+        max_concurrency: int = 5,
+        return_exceptions: bool = False,
+    ) -> Dict[str, Dict[int, Optional[HTTPException]]]:
+        """|coro|
+
+        Remove every role in ``roles`` from every member in ``members``.
+
+        Requests are made concurrently, and a failure for one member or role
+        does not stop the others.
+
+        .. versionadded:: 1.14
+
+        Parameters
+        -----------
+        members: Iterable[:class:`.Member`]
+            The members to remove the roles from.
+        roles: Iterable[:class:`.Role`]
+            The roles to remove.
+        max_concurrency: :class:`int`
+            The maximum number of requests to have in flight at once.
+            Defaults to 5.
+        return_exceptions: :class:`bool`
+            Whether to map changes that failed to the exception that was
+            raised instead of raising it. Defaults to ``False``.
+
+        Returns
+        --------
+        Dict[:class:`str`, Dict[:class:`int`, Optional[:exc:`HTTPException`]]]
+            A mapping of member ID to a mapping of the ID of each role that
+            was attempted to the exception that removing it raised, or
+            ``None`` if it was removed.
+
+        Raises
+        -------
+        HTTPException
+            A change failed and ``return_exceptions`` is ``False``. Every
+            other change is still attempted before this is raised.
+        """
+        return await _change_member_roles(
+            members,
+            list(roles),
+            add=False,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+
     async def create_role(
         self,
         *,
@@ -1458,8 +2038,10 @@ class Server(Hashable):
 
         data = await self._state.get_roles(self.id)
         self._roles.clear()
+        self._resolved_permissions.clear()
         for role_data in data['roles']:
             self._roles[role_data['id']] = Role(state=self._state, data=role_data)
+        self._prune_role_member_ids(self._roles)
 
     async def ban(
         self,
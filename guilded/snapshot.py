@@ -0,0 +1,278 @@
+"""
+MIT License
+
+Copyright (c) 2020-present shay (shayypy)
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+------------------------------------------------------------------------------
+
+This project includes code from https://github.com/Rapptz/discord.py, which is
+available under the MIT license:
+
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import zlib
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .category import Category
+from .emote import Emote
+from .role import Role
+from .server import Server
+
+if TYPE_CHECKING:
+    from .abc import ServerChannel
+    from .asset import Asset
+    from .http import HTTPClientBase
+    from .user import Member
+
+log = logging.getLogger(__name__)
+
+__all__ = ()
+
+# Snapshots are a small header followed by zlib-compressed JSON. The
+# payloads inside mirror the API's own shapes so that they can be fed
+# straight back into the model constructors.
+MAGIC = b'GPYS'
+VERSION = 1
+
+
+def _timestamp(dt: Optional[datetime.datetime]) -> Optional[str]:
+    if dt is None:
+        return None
+    return dt.strftime('%Y-%m-%dT%H:%M:%S.') + f'{dt.microsecond // 1000:03d}Z'
+
+
+def _asset_url(asset: Optional[Asset]) -> Optional[str]:
+    return asset.url if asset is not None else None
+
+
+def _dump_member(member: Member) -> Dict[str, Any]:
+    user = member._user
+    return {
+        'user': {
+            'id': user.id,
+            'type': user._user_type.value,
+            'name': user.name,
+            'avatar': _asset_url(user.avatar),
+            'banner': _asset_url(user.banner),
+            'createdAt': _timestamp(user.created_at),
+        },
+        'roleIds': list(member._role_ids),
+        'nickname': member.nick,
+        'joinedAt': _timestamp(member.joined_at),
+        'xp': member.xp,
+        'isOwner': member._owner,
+    }
+
+
+def _dump_role(role: Role) -> Dict[str, Any]:
+    return {
+        'id': role.id,
+        'serverId': role.server_id,
+        'name': role.name,
+        'colors': list(role._colours),
+        'permissions': role._permissions.values,
+        'icon': role._icon,
+        'createdAt': _timestamp(role.created_at),
+        'updatedAt': _timestamp(role.updated_at),
+        'botUserId': role.bot_user_id,
+        'priority': role.priority,
+        'isMentionable': role.mentionable,
+        'isSelfAssignable': role.self_assignable,
+        'isDisplayedSeparately': role.displayed_separately,
+        'isBase': role.base,
+    }
+
+
+def _dump_channel(channel: ServerChannel) -> Dict[str, Any]:
+    data = {
+        'id': channel.id,
+        'type': channel.type.value if channel.type is not None else None,
+        'name': channel.name,
+        'topic': channel.topic,
+        'visibility': channel.visibility.value if channel.visibility is not None else None,
+        'serverId': channel.server_id,
+        'groupId': channel.group_id,
+        'categoryId': channel.category_id,
+        'createdAt': _timestamp(channel.created_at),
+        'createdBy': channel.created_by_id,
+        'updatedAt': _timestamp(channel.updated_at),
+        'archivedBy': channel.archived_by_id,
+        'archivedAt': _timestamp(channel.archived_at),
+    }
+    if getattr(channel, 'parent_id', None) is not None:
+        # Threads are told apart from chat channels by their parent
+        data['type'] = 'chat'
+        data['parentId'] = channel.parent_id
+        data['rootId'] = channel.root_id
+        data['messageId'] = channel.starter_message_id
+
+    return data
+
+
+def _dump_category(category: Category) -> Dict[str, Any]:
+    return {
+        'id': category.id,
+        'name': category.name,
+        'serverId': category.server_id,
+        'groupId': category.group_id,
+        'createdAt': _timestamp(category.created_at),
+        'updatedAt': _timestamp(category.updated_at),
+        'priority': category.priority,
+    }
+
+
+def _dump_emote(emote: Emote) -> Dict[str, Any]:
+    return {
+        'id': emote.id,
+        'name': emote.name,
+        'serverId': emote.server_id,
+        'createdBy': emote.author_id,
+        'createdAt': _timestamp(emote.created_at),
+        'url': emote.url,
+        'isAnimated': emote._animated,
+        'aliases': list(emote.aliases),
+    }
+
+
+def _dump_server(server: Server) -> Dict[str, Any]:
+    return {
+        'id': server.id,
+        'type': server.type.value if server.type is not None else None,
+        'name': server.name,
+        'ownerId': server.owner_id,
+        'url': server.slug,
+        'createdAt': _timestamp(server.created_at),
+        'about': server.about,
+        'defaultChannelId': server.default_channel_id,
+        'isVerified': server.verified,
+        'timezone': server.raw_timezone,
+        'avatar': _asset_url(server.avatar),
+        'banner': _asset_url(server.banner),
+        'memberCount': server._member_count,
+        'membersFilled': server._members_filled,
+        # Not "members", which Server.__init__ would also try to load
+        'cachedMembers': [_dump_member(member) for member in server._members.values()],
+        'roles': [_dump_role(role) for role in server._roles.values()],
+        'channels': [_dump_channel(channel) for channel in server._channels.values()],
+        'threads': [_dump_channel(thread) for thread in server._threads.values()],
+        'categories': [_dump_category(category) for category in server._categories.values()],
+        'emotes': [_dump_emote(emote) for emote in server._emotes.values()],
+    }
+
+
+def dump_payload(state: HTTPClientBase, *, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """Copy the connection state's server cache into a plain payload.
+
+    This must run on the event loop, but the payload shares no mutable
+    objects with the cache, so it can be encoded in another thread.
+    """
+    return {
+        'cursor': cursor,
+        'servers': [_dump_server(server) for server in state._servers.values()],
+    }
+
+
+def encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize and compress a payload from :func:`dump_payload` into
+    snapshot bytes."""
+    body = zlib.compress(json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+    return MAGIC + bytes([VERSION]) + body
+
+
+def _load_server(state: HTTPClientBase, data: Dict[str, Any]) -> Server:
+    server = Server(state=state, data=data, member_count=data.get('memberCount'))
+    server._members_filled = data.get('membersFilled', False)
+
+    for role_data in data['roles']:
+        role = Role(state=state, data=role_data)
+        server._roles[role.id] = role
+        if role.base:
+            server._base_role = role
+
+    for category_data in data['categories']:
+        server._categories[category_data['id']] = Category(state=state, data=category_data, server=server)
+
+    for channel_data in data['channels']:
+        channel = state.create_channel(data=channel_data, server=server, createdBy=channel_data.get('createdBy'))
+        server._channels[channel.id] = channel
+
+    for thread_data in data['threads']:
+        thread = state.create_channel(data=thread_data, server=server, createdBy=thread_data.get('createdBy'))
+        server._threads[thread.id] = thread
+
+    for emote_data in data['emotes']:
+        emote = Emote(state=state, data=emote_data, server=server)
+        server._emotes[emote.id] = emote
+
+    for member_data in data['cachedMembers']:
+        member_data['serverId'] = server.id
+        state.add_to_member_cache(state.create_member(data=member_data, server=server))
+
+    return server
+
+
+def load_state(state: HTTPClientBase, snapshot: bytes) -> Tuple[List[Server], Optional[str]]:
+    """Restore servers from snapshot bytes into the connection state.
+
+    Returns the restored servers and the gateway resume cursor that was saved
+    with them, if any.
+
+    Raises :exc:`ValueError` if the snapshot is not recognized.
+    """
+    if snapshot[:4] != MAGIC:
+        raise ValueError('Not a guilded.py cache snapshot.')
+    if snapshot[4] != VERSION:
+        raise ValueError(f'Unsupported cache snapshot version {snapshot[4]}.')
+
+    payload = json.loads(zlib.decompress(snapshot[5:]))
+    servers = []
+    for server_data in payload['servers']:
+        server = _load_server(state, server_data)
+        state.add_to_server_cache(server)
+        servers.append(server)
+
+    return servers, payload.get('cursor')
@@ -55,15 +55,16 @@ import datetime
 import inspect
 import itertools
 from operator import attrgetter
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple, TypeVar, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple, TypeVar, Union
 
 import guilded.abc
 
 from .asset import Asset
 from .enums import SocialLinkType, try_enum
+from .errors import HTTPException
 from .permissions import Permissions
 from .role import Role
-from .utils import MISSING, Object, copy_doc, ISO8601
+from .utils import MISSING, Object, copy_doc, ISO8601, _ISO8601Slot, _intern, _intern_id, _run_concurrently
 
 if TYPE_CHECKING:
     from .types.user import (
@@ -109,6 +110,9 @@ class User(guilded.abc.User, guilded.abc.Messageable):
 
             Returns the user's name.
     """
+
+    __slots__ = ()
+
     def _update(self, data: UserPayload):
         try:
             self.stonks: int = data.pop('stonks')
@@ -228,16 +232,18 @@ class Member(User):
     """
 
     __slots__ = (
-        '_state',
         '_role_ids',
-        '_user'
+        '_user',
         '_server',
+        '_owner',
+        'server_id',
         'nick',
         'xp',
-        'joined_at',
-        'colour',
+        '_joined_at',
     )
 
+    joined_at = _ISO8601Slot('_joined_at')
+
     if TYPE_CHECKING:
         id: str
         name: str
@@ -250,15 +256,15 @@ class Member(User):
     def __init__(self, *, state, data: ServerMemberPayload, **extra):
         self._state = state
         self._user = User(state=state, data=data)
-        state._users[self._user.id] = self._user
+        state.add_to_user_cache(self._user)
 
         self._server = extra.get('server')
-        self.server_id: str = self._server.id if self._server else data.get('serverId') or data.get('teamId')
+        self.server_id: str = self._server.id if self._server else _intern(data.get('serverId') or data.get('teamId'))
 
-        self._role_ids: Set[int] = set(data.get('roleIds') or [])
+        self._role_ids: Set[int] = {_intern_id(role_id) for role_id in data.get('roleIds') or []}
         self._owner: Optional[bool] = data.get('isOwner')
         self.nick: Optional[str] = data.get('nickname')
-        self.joined_at: datetime.datetime = ISO8601(data.get('joinedAt'))
+        self._joined_at: Optional[str] = data.get('joinedAt')
         self.xp: Optional[int] = data.get('xp')
 
     def __repr__(self) -> str:
@@ -305,11 +311,14 @@ class Member(User):
         if self.is_owner():
             return Permissions.all()
 
-        values: List[str] = []
-        for role in self.roles:
-            values += role.permissions.values
+        server = self.server
+        value = 0
+        for role_id in self._role_ids:
+            role = server.get_role(role_id)
+            if role is not None:
+                value |= role._permissions.value
 
-        return Permissions(*set(values))
+        return Permissions._from_value(value)
 
     @property
     def guild_permissions(self) -> Permissions:
@@ -330,7 +339,8 @@ class Member(User):
         self.server_id = member.server_id
 
         self.nick = member.nick
-        self.joined_at = member.joined_at
+        self.xp = member.xp
+        self._joined_at = member._joined_at
         self._owner = member._owner
 
         return self
@@ -343,8 +353,20 @@ class Member(User):
 
         super()._update(data)
 
+        server = self.server
+        if server is not None:
+            server._reindex_member_names(self)
+
     def _update_roles(self, role_ids: List[int]):
-        self._role_ids = {int(role_id) for role_id in role_ids}
+        self._set_role_ids({_intern_id(int(role_id)) for role_id in role_ids})
+
+    def _set_role_ids(self, role_ids: Set[int]):
+        server = self.server
+        if server is None:
+            self._role_ids = role_ids
+        else:
+            # Keep the server's role -> members index in sync
+            server._set_member_roles(self, role_ids)
 
     def _update_xp(self, xp: int):
         self.xp = xp
@@ -486,23 +508,63 @@ class Member(User):
         """
 
         await self._state.assign_role_to_member(self.server.id, self.id, role.id)
-        self._role_ids.add(role.id)
+        self._set_role_ids(self._role_ids | {role.id})
 
-    async def add_roles(self, *roles: Role) -> None:
+    async def add_roles(
+        self,
+        *roles: Role,
+        max_concurrency: int = 5,
+        return_exceptions: bool = False,
+    ) -> Dict[int, Optional[HTTPException]]:
         """|coro|
 
         |dpyattr|
 
         Add roles to this member.
 
+        Roles are added concurrently. Roles that the member is cached as
+        already having are skipped without a request.
+
+        .. versionchanged:: 1.14
+            Roles are now added concurrently, and a failure to add one role
+            no longer prevents the others from being attempted.
+
         Parameters
         -----------
         roles: List[:class:`.Role`]
             The roles to add to the member.
+        max_concurrency: :class:`int`
+            The maximum number of requests to have in flight at once.
+            Defaults to 5.
+
+            .. versionadded:: 1.14
+        return_exceptions: :class:`bool`
+            Whether to map roles that failed to be added to the exception
+            that was raised instead of raising it. Defaults to ``False``.
+
+            .. versionadded:: 1.14
+
+        Returns
+        --------
+        Dict[:class:`int`, Optional[:exc:`HTTPException`]]
+            A mapping of the ID of each role that was attempted to the
+            exception that adding it raised, or ``None`` if it was added.
+
+        Raises
+        -------
+        HTTPException
+            Adding a role failed and ``return_exceptions`` is ``False``.
+            Every other role is still attempted before this is raised.
         """
 
-        for role in roles:
-            await self.add_role(role)
+        results = await _change_member_roles(
+            [self],
+            roles,
+            add=True,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+        return results.get(self.id, {})
 
     async def remove_role(self, role: Role) -> None:
         """|coro|
@@ -516,23 +578,62 @@ class Member(User):
         """
 
         await self._state.remove_role_from_member(self.server.id, self.id, role.id)
-        self._role_ids.discard(role.id)
+        self._set_role_ids(self._role_ids - {role.id})
 
-    async def remove_roles(self, *roles: Role) -> None:
+    async def remove_roles(
+        self,
+        *roles: Role,
+        max_concurrency: int = 5,
+        return_exceptions: bool = False,
+    ) -> Dict[int, Optional[HTTPException]]:
         """|coro|
 
         |dpyattr|
 
         Remove roles from this member.
 
+        Roles are removed concurrently.
+
+        .. versionchanged:: 1.14
+            Roles are now removed concurrently, and a failure to remove one
+            role no longer prevents the others from being attempted.
+
         Parameters
         -----------
         roles: List[:class:`.Role`]
             The roles to remove from the member.
+        max_concurrency: :class:`int`
+            The maximum number of requests to have in flight at once.
+            Defaults to 5.
+
+            .. versionadded:: 1.14
+        return_exceptions: :class:`bool`
+            Whether to map roles that failed to be removed to the exception
+            that was raised instead of raising it. Defaults to ``False``.
+
+            .. versionadded:: 1.14
+
+        Returns
+        --------
+        Dict[:class:`int`, Optional[:exc:`HTTPException`]]
+            A mapping of the ID of each role that was attempted to the
+            exception that removing it raised, or ``None`` if it was removed.
+
+        Raises
+        -------
+        HTTPException
+            Removing a role failed and ``return_exceptions`` is ``False``.
+            Every other role is still attempted before this is raised.
         """
 
-        for role in roles:
-            await self.remove_role(role)
+        results = await _change_member_roles(
+            [self],
+            roles,
+            add=False,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+        return results.get(self.id, {})
 
     async def fetch_role_ids(self) -> List[int]:
         """|coro|
@@ -662,6 +763,52 @@ class Member(User):
         return Permissions(*data['permissions'])
 
 
+async def _change_member_roles(
+    members: Iterable[Member],
+    roles: Iterable[Role],
+    *,
+    add: bool,
+    max_concurrency: int,
+    return_exceptions: bool,
+) -> Dict[str, Dict[int, Optional[HTTPException]]]:
+    # Only additions of roles that the member is cached as having are
+    # skipped. A member's cached roles may be incomplete (e.g. when built
+    # from a partial payload), so removals are always requested.
+    changes: List[Tuple[Member, int]] = []
+    seen: Set[Tuple[str, int]] = set()
+    role_ids = [role.id for role in roles]
+    for member in members:
+        for role_id in role_ids:
+            if (add and role_id in member._role_ids) or (member.id, role_id) in seen:
+                continue
+            seen.add((member.id, role_id))
+            changes.append((member, role_id))
+
+    async def apply(change: Tuple[Member, int]) -> None:
+        member, role_id = change
+        if add:
+            await member._state.assign_role_to_member(member.server.id, member.id, role_id)
+            member._set_role_ids(member._role_ids | {role_id})
+        else:
+            await member._state.remove_role_from_member(member.server.id, member.id, role_id)
+            member._set_role_ids(member._role_ids - {role_id})
+
+    outcomes = await _run_concurrently(apply, changes, max_concurrency=max_concurrency)
+
+    results: Dict[str, Dict[int, Optional[HTTPException]]] = {}
+    failure: Optional[Exception] = None
+    for (member, role_id), outcome in zip(changes, outcomes):
+        if outcome is not None and (not isinstance(outcome, HTTPException) or not return_exceptions):
+            failure = failure or outcome
+            continue
+        results.setdefault(member.id, {})[role_id] = outcome
+
+    if failure is not None:
+        raise failure
+
+    return results
+
+
 class MemberBan:
     """Represents a ban created in a :class:`.Server`.
 
@@ -800,6 +947,8 @@ class SocialLink:
 class ClientUser(guilded.abc.User):
     """Represents the current logged-in user."""
 
+    __slots__ = ()
+
     def __init__(self, *, state, data: UserPayload):
         super().__init__(state=state, data=data)
 
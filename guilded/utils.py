@@ -55,7 +55,8 @@ from inspect import isawaitable as _isawaitable, signature as _signature
 from operator import attrgetter
 from .mixins import Hashable
 import re
-from typing import Any, AsyncIterable, Callable, Coroutine, Iterable, Optional, TypeVar, Union
+import sys
+from typing import Any, AsyncIterable, Callable, Coroutine, Dict, Iterable, List, Optional, TypeVar, Union
 import unicodedata
 from uuid import uuid1, UUID
 
@@ -91,6 +92,14 @@ def ISO8601(string: str):
     if string is None:
         return None
 
+    # Fast path for the shape that Guilded almost always sends:
+    # YYYY-MM-DDTHH:MM:SS.fffZ or YYYY-MM-DDTHH:MM:SSZ
+    if len(string) in (20, 24) and string[-1] == 'Z':
+        try:
+            return datetime.datetime.fromisoformat(string[:-1])
+        except ValueError:
+            pass
+
     try:
         return datetime.datetime.strptime(string, '%Y-%m-%dT%H:%M:%S.%fZ')
     except:
@@ -108,6 +117,29 @@ def ISO8601(string: str):
         raise TypeError(f'{string} is not a valid ISO8601 datetime.')
 
 
+class _ISO8601Slot:
+    """A descriptor for slotted models that keeps a timestamp as its raw
+    ISO8601 string in ``slot`` and only parses it on first access."""
+
+    __slots__ = ('slot',)
+
+    def __init__(self, slot: str):
+        self.slot: str = slot
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+
+        value = getattr(instance, self.slot)
+        if isinstance(value, str):
+            value = ISO8601(value)
+            setattr(instance, self.slot, value)
+        return value
+
+    def __set__(self, instance: Any, value: Optional[Union[str, datetime.datetime]]) -> None:
+        setattr(instance, self.slot, value)
+
+
 def hyperlink(link: str, *, title: str = None) -> str:
     """A helper function to make links clickable when sent into chat.
 
@@ -324,6 +356,30 @@ async def async_all(gen, *, check=_isawaitable):
     return True
 
 
+async def _run_concurrently(
+    func: Callable[[T], Coro[Any]],
+    items: Iterable[T],
+    *,
+    max_concurrency: int,
+) -> List[Any]:
+    """Call ``func`` on every item with at most ``max_concurrency`` calls in
+    flight, returning each call's result or the :exc:`Exception` it raised,
+    in the order of ``items``."""
+    items = list(items)
+    results: List[Any] = [None] * len(items)
+    indices = iter(range(len(items)))
+
+    async def worker() -> None:
+        for index in indices:
+            try:
+                results[index] = await func(items[index])
+            except Exception as exc:
+                results[index] = exc
+
+    await asyncio.gather(*(worker() for _ in range(max(min(max_concurrency, len(items)), 1))))
+    return results
+
+
 _IS_ASCII = re.compile(r'^[\x00-\x7f]+$')
 
 def _string_width(string: str, *, _IS_ASCII=_IS_ASCII) -> int:
@@ -337,6 +393,33 @@ def _string_width(string: str, *, _IS_ASCII=_IS_ASCII) -> int:
     return sum(2 if func(char) in UNICODE_WIDE_CHAR_TYPE else 1 for char in string)
 
 
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Interns an ID string so that the many objects referencing the same
+    server, group or user share one copy of it."""
+    if value is None:
+        return None
+    return sys.intern(value)
+
+
+_MAX_INTERNED_IDS = 1 << 16
+_interned_ids: Dict[int, int] = {}
+
+def _intern_id(value: int) -> int:
+    """The :func:`_intern` equivalent for integer IDs, such as role IDs,
+    which are repeated across every member that has the role."""
+    try:
+        return _interned_ids[value]
+    except KeyError:
+        pass
+
+    if len(_interned_ids) >= _MAX_INTERNED_IDS:
+        # Interning only saves memory, so start over rather than keep every
+        # ID ever seen alive for the life of the process
+        _interned_ids.clear()
+    _interned_ids[value] = value
+    return value
+
+
 def copy_doc(original: Callable) -> Callable[[T], T]:
     def decorator(overridden: T) -> T:
         overridden.__doc__ = original.__doc__
@@ -305,6 +305,10 @@ class _WebhookState:
             return self._parent._get_message(message_id)
         return None
 
+    def add_to_user_cache(self, user: User) -> None:
+        if self._parent is not None:
+            self._parent.add_to_user_cache(user)
+
     def store_user(self, data):
         if self._parent is not None:
             return self._parent.store_user(data)
@@ -0,0 +1,136 @@
+import pytest
+
+from guilded.ext import commands
+
+
+async def callback(ctx):
+    pass
+
+
+def make_command(name, *aliases):
+    return commands.Command(callback, name=name, aliases=list(aliases))
+
+
+def make_bot(**options):
+    return commands.Bot(command_prefix='!', help_command=None, **options)
+
+
+def test_add_and_get_command_with_aliases():
+    bot = make_bot()
+    ping = make_command('ping', 'p', 'pong')
+    bot.add_command(ping)
+
+    assert bot.get_command('ping') is ping
+    assert bot.get_command('p') is ping
+    assert bot.commands == [ping]
+    assert bot._commands_by_alias == {'p': ping, 'pong': ping}
+
+
+def test_name_conflict_raises():
+    bot = make_bot()
+    bot.add_command(make_command('ping'))
+    with pytest.raises(commands.CommandRegistrationError):
+        bot.add_command(make_command('ping'))
+
+
+def test_alias_conflict_rolls_back_and_keeps_existing_alias():
+    bot = make_bot()
+    first = make_command('first', 'shared')
+    bot.add_command(first)
+
+    second = make_command('second', 'other', 'shared')
+    with pytest.raises(commands.CommandRegistrationError) as info:
+        bot.add_command(second)
+    assert info.value.alias_conflict
+
+    # The failed command is gone entirely, and the alias it collided with
+    # still belongs to the command that registered it first
+    assert bot.get_command('second') is None
+    assert bot.get_command('other') is None
+    assert bot.get_command('shared') is first
+    assert bot.commands == [first]
+
+
+def test_aliases_repeating_the_command_are_ignored():
+    bot = make_bot()
+    echo = make_command('echo', 'echo', 'e', 'e')
+    bot.add_command(echo)
+
+    assert bot.get_command('echo') is echo
+    assert bot.get_command('e') is echo
+    assert bot._commands_by_alias == {'e': echo}
+
+    assert bot.remove_command('echo') is echo
+    assert bot.get_command('e') is None
+    assert bot.all_commands == {}
+
+
+def test_remove_command_restores_another_commands_alias():
+    bot = make_bot()
+    first = make_command('first', 'shared')
+    bot.add_command(first)
+
+    # Registered directly, as the alias conflict check would refuse it
+    second = make_command('second', 'shared')
+    bot._commands['second'] = second
+    bot.all_commands['second'] = second
+
+    assert bot.remove_command('second') is second
+    assert bot.get_command('shared') is first
+
+
+def test_remove_command_removes_aliases():
+    bot = make_bot()
+    ping = make_command('ping', 'p')
+    bot.add_command(ping)
+
+    assert bot.remove_command('ping') is ping
+    assert bot.get_command('ping') is None
+    assert bot.get_command('p') is None
+    assert bot.all_commands == {}
+    assert bot.remove_command('ping') is None
+
+
+def test_remove_alias_only():
+    bot = make_bot()
+    ping = make_command('ping', 'p', 'pong')
+    bot.add_command(ping)
+
+    assert bot.remove_command('p') is ping
+    assert bot.get_command('p') is None
+    assert bot.get_command('ping') is ping
+    assert bot.get_command('pong') is ping
+    assert ping.aliases == ['pong']
+
+
+def test_case_insensitive_lookup_and_conflicts():
+    bot = make_bot(case_insensitive=True)
+    ping = make_command('Ping', 'P')
+    bot.add_command(ping)
+
+    assert bot.get_command('ping') is ping
+    assert bot.get_command('PING') is ping
+    assert bot.get_command('p') is ping
+
+    with pytest.raises(commands.CommandRegistrationError):
+        bot.add_command(make_command('PING'))
+    with pytest.raises(commands.CommandRegistrationError):
+        bot.add_command(make_command('other', 'p'))
+
+    assert bot.remove_command('pInG') is ping
+    assert bot.get_command('p') is None
+
+
+def test_case_sensitive_by_default():
+    bot = make_bot()
+    bot.add_command(make_command('ping'))
+    bot.add_command(make_command('Ping'))
+
+    assert bot.get_command('PING') is None
+    assert len(bot.commands) == 2
+
+
+def test_indexes_are_per_instance():
+    first, second = make_bot(), make_bot()
+    first.add_command(make_command('ping'))
+    assert second.get_command('ping') is None
@@ -0,0 +1,177 @@
+import asyncio
+
+import pytest
+
+import guilded
+from guilded.ext import commands
+
+
+def make_bot(command_prefix, **options):
+    bot = commands.Bot(command_prefix=command_prefix, help_command=None, **options)
+    state = bot.http
+    state.add_to_user_cache(state.create_user(data={'id': 'author', 'name': 'author', 'type': 'user'}))
+    return bot
+
+
+def make_message(bot, content, *, server_id='server01'):
+    data = {
+        'id': 'message-id',
+        'type': 'default',
+        'channelId': 'channel-id',
+        'serverId': server_id,
+        'content': content,
+        'createdBy': 'author',
+        'createdAt': '2022-01-01T00:00:00.000Z',
+    }
+    return guilded.ChatMessage(state=bot.http, channel=None, data=data)
+
+
+def get_context(bot, content, **kwargs):
+    return asyncio.run(bot.get_context(make_message(bot, content, **kwargs)))
+
+
+def process(bot, *contents):
+    async def main():
+        await bot._async_setup_hook()
+        for content in contents:
+            await bot.process_commands(make_message(bot, content))
+
+    asyncio.run(main())
+
+
+def add_recorder(bot, name='ping'):
+    calls = []
+
+    @bot.command(name=name)
+    async def command(ctx):
+        calls.append(ctx.prefix)
+
+    return calls
+
+
+def test_longest_matching_prefix_wins():
+    bot = make_bot(['!', '!!', '?'])
+    add_recorder(bot)
+
+    ctx = get_context(bot, '!!ping')
+    assert ctx.prefix == '!!'
+    assert ctx.invoked_with == 'ping'
+    assert ctx.command is bot.get_command('ping')
+
+    assert get_context(bot, '!ping').prefix == '!'
+    assert get_context(bot, 'ping').prefix is None
+
+
+def test_empty_prefix_matches_anything():
+    bot = make_bot(['', '!'])
+    add_recorder(bot)
+
+    assert get_context(bot, '!ping').prefix == '!'
+    ctx = get_context(bot, 'ping')
+    assert ctx.prefix == ''
+    assert ctx.command is bot.get_command('ping')
+
+
+def test_prefix_cache_expires_and_can_be_invalidated(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(commands.bot.time, 'monotonic', lambda: now[0])
+    calls = []
+
+    def command_prefix(bot, message):
+        calls.append(message.server_id)
+        return ['!']
+
+    bot = make_bot(command_prefix, prefix_cache_ttl=60)
+    message = make_message(bot, '!ping')
+
+    async def main():
+        return await bot.get_prefix(message)
+
+    assert asyncio.run(main()) == ['!']
+    assert asyncio.run(main()) == ['!']
+    assert len(calls) == 1
+
+    now[0] += 61
+    asyncio.run(main())
+    assert len(calls) == 2
+
+    bot.invalidate_prefix(guilded.Object('server01'))
+    asyncio.run(main())
+    assert len(calls) == 3
+
+    bot.invalidate_prefix()
+    assert bot._prefix_cache == {}
+
+
+def test_prefilter_skips_messages_without_a_prefix():
+    bot = make_bot('!')
+    calls = add_recorder(bot)
+
+    contexts = []
+    original = bot.get_context
+
+    async def get_context(message, **kwargs):
+        contexts.append(message.content)
+        return await original(message, **kwargs)
+
+    bot.get_context = get_context
+    process(bot, 'hello there', '?ping', '!ping', '!unknown')
+
+    assert contexts == ['!ping', '!unknown']
+    assert calls == ['!']
+    assert bot.messages_examined == 4
+    assert bot.messages_prefiltered == 2
+    assert bot.commands_invoked == 1
+
+
+def test_prefilter_uses_when_mentioned_or_prefixes():
+    bot = make_bot(commands.when_mentioned_or('!', '?'))
+    calls = add_recorder(bot)
+    process(bot, 'hello', '?ping')
+
+    assert calls == ['?']
+    assert bot.messages_prefiltered == 1
+
+
+def test_prefilter_defers_to_overridden_hooks():
+    class PrefixBot(commands.Bot):
+        async def get_prefix(self, message):
+            return 'hey '
+
+    class ContextBot(commands.Bot):
+        async def get_context(self, message, **kwargs):
+            self.contexts.append(message.content)
+            return await super().get_context(message, **kwargs)
+
+    for cls in (PrefixBot, ContextBot):
+        bot = cls(command_prefix='!', help_command=None)
+        bot.contexts = []
+        bot.http.add_to_user_cache(bot.http.create_user(data={'id': 'author', 'name': 'author', 'type': 'user'}))
+        calls = add_recorder(bot)
+        process(bot, 'hey ping', 'nothing')
+
+        assert bot.messages_prefiltered == 0
+        if cls is PrefixBot:
+            assert calls == ['hey ']
+        else:
+            assert bot.contexts == ['hey ping', 'nothing']
+
+
+def test_uncached_callable_prefix_is_never_prefiltered():
+    def command_prefix(bot, message):
+        return '!'
+
+    bot = make_bot(command_prefix)
+    process(bot, 'hello')
+    assert bot.messages_prefiltered == 0
+
+    bot = make_bot(command_prefix, prefix_cache_ttl=60)
+    process(bot, 'hello', 'hello again')
+    # The first message fills the cache, which the second is checked against
+    assert bot.messages_prefiltered == 1
+
+
+def test_invalid_prefix_type_still_raises():
+    bot = make_bot([1])
+    with pytest.raises(TypeError):
+        process(bot, '!ping')
@@ -0,0 +1,79 @@
+import types
+
+import pytest
+
+import guilded.cache
+from guilded.cache import CachePolicy, MemberCachePolicy, _CacheStore
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(guilded.cache.time, 'monotonic', clock)
+    return clock
+
+
+def test_expired_items_are_hidden_from_every_read(clock):
+    evicted = []
+    store = _CacheStore(ttl=10, on_evict=lambda key, value: evicted.append(key))
+    for key in range(5):
+        store[key] = str(key)
+
+    clock.now += 5
+    assert store[0] == '0'
+
+    clock.now += 6
+    assert 1 not in store
+    with pytest.raises(KeyError):
+        store[2]
+    assert len(store) == 1
+    assert list(store.values()) == ['0']
+    assert list(store.items()) == [(0, '0')]
+    assert list(store) == [0]
+    assert sorted(evicted) == [1, 2, 3, 4]
+
+
+def test_max_size_evicts_least_recently_used():
+    store = _CacheStore(max_size=2)
+    store['a'] = 1
+    store['b'] = 2
+    store.get('a')
+    store['c'] = 3
+    assert list(store) == ['a', 'c']
+
+
+def test_max_size_without_lru_evicts_oldest():
+    store = _CacheStore(max_size=2, lru=False)
+    store['a'] = 1
+    store['b'] = 2
+    store.get('a')
+    store['a'] = 4
+    store['c'] = 3
+    assert list(store) == ['b', 'c']
+
+
+def test_max_size_zero_is_accepted():
+    policy = CachePolicy(max_size=0)
+    store = policy._create_store()
+    store['a'] = 1
+    assert len(store) == 0
+
+    with pytest.raises(ValueError, match='non-negative'):
+        CachePolicy(max_size=-1)
+
+
+def test_member_policy_active_within(clock):
+    policy = MemberCachePolicy(active_within=60)
+    server = types.SimpleNamespace(_last_activity=clock.now)
+    assert policy._is_active(server)
+
+    clock.now += 61
+    assert not policy._is_active(server)
@@ -0,0 +1,109 @@
+import asyncio
+from typing import Optional
+
+import guilded
+from guilded.ext import commands
+
+IMAGE = '![](https://img.guildedcdn.com/ContentMedia/{}-Full.png)'
+
+
+def make_bot():
+    bot = commands.Bot(command_prefix='!', help_command=None)
+    state = bot.http
+    state.add_to_user_cache(state.create_user(data={'id': 'author', 'name': 'author', 'type': 'user'}))
+    return bot
+
+
+def process(bot, content):
+    data = {
+        'id': 'message-id',
+        'type': 'default',
+        'channelId': 'channel-id',
+        'serverId': 'server01',
+        'content': content,
+        'createdBy': 'author',
+        'createdAt': '2022-01-01T00:00:00.000Z',
+    }
+    errors = []
+
+    async def on_command_error(ctx, error):
+        errors.append(error)
+
+    bot.on_command_error = on_command_error
+
+    async def main():
+        await bot._async_setup_hook()
+        await bot.process_commands(guilded.ChatMessage(state=bot.http, channel=None, data=data))
+
+    asyncio.run(main())
+    assert errors == []
+
+
+def test_plan_is_recomputed_when_command_joins_a_cog():
+    calls = []
+
+    class Numbers(commands.Cog):
+        @commands.command()
+        async def add(self, ctx, first: int, second: int = 1):
+            calls.append((self, first + second))
+
+    # The class attribute is never bound to a cog, so its plan treats
+    # 'self' as the context
+    unbound = Numbers.add
+    assert [step.name for step in unbound._get_parse_plan()] == ['ctx', 'first', 'second']
+
+    bot = make_bot()
+    cog = Numbers()
+    bot.add_cog(cog)
+    command = bot.get_command('add')
+    assert [step.name for step in command._get_parse_plan()] == ['first', 'second']
+
+    process(bot, '!add 2 3')
+    process(bot, '!add 2')
+    assert calls == [(cog, 5), (cog, 3)]
+
+    # A plan built before the command was bound is not reused afterwards
+    unbound._get_parse_plan()
+    unbound.cog = cog
+    assert [step.name for step in unbound._get_parse_plan()] == ['first', 'second']
+
+
+def test_greedy_parameters():
+    bot = make_bot()
+    calls = []
+
+    @bot.command()
+    async def total(ctx, numbers: commands.Greedy[int], label: str, *rest: commands.Greedy[int]):
+        calls.append((numbers, label, rest))
+
+    process(bot, '!total 1 2 3 sum 4 5')
+    assert calls == [([1, 2, 3], 'sum', (4, 5))]
+
+
+def test_greedy_attachments_take_every_attachment():
+    bot = make_bot()
+    calls = []
+
+    @bot.command()
+    async def upload(ctx, files: commands.Greedy[guilded.Attachment], *, caption: str):
+        calls.append(([file.url for file in files], caption))
+
+    # Guilded puts each uploaded image on its own line
+    process(bot, f'!upload {IMAGE.format("one")}\n{IMAGE.format("two")} holiday')
+    assert len(calls[0][0]) == 2
+    assert calls[0][1].endswith('holiday')
+
+
+def test_optional_attachment():
+    bot = make_bot()
+    calls = []
+
+    @bot.command()
+    async def avatar(ctx, image: Optional[guilded.Attachment]):
+        calls.append(image)
+
+    process(bot, '!avatar')
+    process(bot, f'!avatar {IMAGE.format("one")}')
+
+    assert calls[0] is None
+    assert isinstance(calls[1], guilded.Attachment)
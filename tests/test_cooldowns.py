@@ -0,0 +1,136 @@
+import asyncio
+
+from guilded.ext.commands.cooldowns import BucketType, Cooldown, CooldownMapping, MaxConcurrency
+from guilded.ext.commands.errors import MaxConcurrencyReached
+
+
+class FakeMessage:
+    def __init__(self, author_id):
+        self.author = type('Author', (), {'id': author_id})()
+
+
+def test_max_concurrency_holds_across_wake_up():
+    async def main():
+        concurrency = MaxConcurrency(1, per=BucketType.default, wait=True)
+        message = FakeMessage(1)
+        running = 0
+        peak = 0
+
+        async def command(hold):
+            nonlocal running, peak
+            await concurrency.acquire(message)
+            running += 1
+            peak = max(peak, running)
+            try:
+                await hold.wait()
+            finally:
+                running -= 1
+                await concurrency.release(message)
+
+        first_hold, second_hold, third_hold = asyncio.Event(), asyncio.Event(), asyncio.Event()
+        first = asyncio.ensure_future(command(first_hold))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(command(second_hold))
+        await asyncio.sleep(0)
+
+        # Release the holder, then arrive before the woken waiter resumes
+        first_hold.set()
+        await first
+        third = asyncio.ensure_future(command(third_hold))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert peak == 1
+
+        second_hold.set()
+        third_hold.set()
+        await asyncio.gather(second, third)
+
+        assert peak == 1
+        assert concurrency._mapping == {}
+
+    asyncio.run(main())
+
+
+def test_max_concurrency_without_wait_raises():
+    async def main():
+        concurrency = MaxConcurrency(1, per=BucketType.user, wait=False)
+        message = FakeMessage(1)
+        await concurrency.acquire(message)
+        try:
+            await concurrency.acquire(message)
+        except MaxConcurrencyReached:
+            pass
+        else:
+            raise AssertionError('second acquire should have failed')
+
+        await concurrency.release(message)
+        assert concurrency._mapping == {}
+
+    asyncio.run(main())
+
+
+def test_max_concurrency_discards_semaphore_after_cancelled_waiter():
+    async def main():
+        concurrency = MaxConcurrency(1, per=BucketType.user, wait=True)
+        message = FakeMessage(1)
+        await concurrency.acquire(message)
+
+        waiter = asyncio.ensure_future(concurrency.acquire(message))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            pass
+
+        await concurrency.release(message)
+        assert concurrency._mapping == {}
+
+    asyncio.run(main())
+
+
+def test_max_concurrency_passes_on_slot_when_woken_waiter_is_cancelled():
+    async def main():
+        concurrency = MaxConcurrency(1, per=BucketType.user, wait=True)
+        message = FakeMessage(1)
+        await concurrency.acquire(message)
+
+        woken = asyncio.ensure_future(concurrency.acquire(message))
+        await asyncio.sleep(0)
+        await concurrency.release(message)
+        # Woken, but cancelled before it resumes
+        woken.cancel()
+        try:
+            await woken
+        except asyncio.CancelledError:
+            pass
+
+        assert concurrency._mapping == {}
+        await concurrency.acquire(message)
+        await concurrency.release(message)
+        assert concurrency._mapping == {}
+
+    asyncio.run(main())
+
+
+def test_cooldown_mapping_expires_unused_buckets():
+    mapping = CooldownMapping(Cooldown(1, 10), BucketType.user)
+    for author_id in range(1000):
+        mapping.get_bucket(FakeMessage(author_id), 100.0 + author_id * 0.001).update_rate_limit(100.0 + author_id * 0.001)
+
+    assert len(mapping._cache) == 1000
+    mapping.get_bucket(FakeMessage(-1), 200.0)
+    assert list(mapping._cache) == [-1]
+    assert len(mapping._expiry) == 1
+
+
+def test_cooldown_mapping_keeps_reused_buckets():
+    mapping = CooldownMapping(Cooldown(5, 10), BucketType.user)
+    mapping.get_bucket(FakeMessage(1), 1.0).update_rate_limit(1.0)
+    mapping.get_bucket(FakeMessage(1), 9.0).update_rate_limit(9.0)
+
+    mapping.get_bucket(FakeMessage(2), 15.0)
+    assert 1 in mapping._cache
+
+    mapping.get_bucket(FakeMessage(2), 20.0)
+    assert 1 not in mapping._cache
@@ -0,0 +1,181 @@
+import asyncio
+import datetime
+import json
+import os
+
+import pytest
+
+import guilded
+from guilded.export import CHECKPOINT_FILENAME
+
+
+def timestamp(index):
+    return (datetime.datetime(2022, 1, 1) + datetime.timedelta(seconds=index)).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+
+def channel_data(channel_id, type):
+    return {
+        'id': channel_id,
+        'type': type,
+        'serverId': 'server-id',
+        'createdBy': 'author',
+        'name': channel_id,
+        'createdAt': timestamp(0),
+    }
+
+
+def newest_first(items, before, limit):
+    page = sorted(
+        (item for item in items if before is None or item['createdAt'] < before),
+        key=lambda item: item['createdAt'],
+        reverse=True,
+    )
+    return page[:limit]
+
+
+def make_chat(count, *, fail_before=None):
+    state = guilded.Client().http
+    messages = [
+        {
+            'id': f'message-{index}',
+            'type': 'default',
+            'channelId': 'chat',
+            'content': str(index),
+            'createdBy': 'author',
+            'createdAt': timestamp(index),
+        }
+        for index in range(count)
+    ]
+    requests = []
+
+    async def get_channel_messages(channel_id, *, before=None, after=None, limit=None, include_private=False):
+        requests.append(before)
+        if fail_before is not None and before is not None and before < fail_before:
+            raise RuntimeError('connection lost')
+        return {'messages': newest_first(messages, before, limit)}
+
+    state.get_channel_messages = get_channel_messages
+    channel = guilded.ChatChannel(state=state, group=None, data=channel_data('chat', 'chat'))
+    return channel, requests
+
+
+def read_segments(directory):
+    records = []
+    for filename in sorted(os.listdir(directory)):
+        if filename.startswith('segment-') and filename.endswith('.ndjson'):
+            with open(os.path.join(directory, filename), encoding='utf-8') as fp:
+                records.append([json.loads(line) for line in fp])
+    return records
+
+
+def read_checkpoint(directory):
+    with open(os.path.join(directory, CHECKPOINT_FILENAME), encoding='utf-8') as fp:
+        return json.load(fp)
+
+
+def test_segments_roll_over_and_checkpoint(tmp_path):
+    channel, _ = make_chat(250)
+    exporter = guilded.ChannelExporter(str(tmp_path), segment_size=100)
+    results = asyncio.run(exporter.export(channel))
+
+    progress = results['chat']
+    assert progress.done
+    assert (progress.records, progress.segments) == (250, 3)
+
+    directory = tmp_path / 'chat'
+    segments = read_segments(directory)
+    assert [len(segment) for segment in segments] == [100, 100, 50]
+    assert segments[0][0] == {'type': 'message', 'data': segments[0][0]['data']}
+    assert segments[0][0]['data']['id'] == 'message-249'
+    assert segments[-1][-1]['data']['id'] == 'message-0'
+
+    assert read_checkpoint(directory) == {
+        'cursor': timestamp(0),
+        'records': 250,
+        'segments': 3,
+        'done': True,
+    }
+
+
+def test_resume_discards_partial_segment(tmp_path):
+    # Pages are 100 messages each: 249-150, 149-50, then a failure
+    channel, _ = make_chat(250, fail_before=timestamp(100))
+    exporter = guilded.ChannelExporter(str(tmp_path), segment_size=80, prefetch=0)
+    with pytest.raises(RuntimeError):
+        asyncio.run(exporter.export(channel))
+
+    directory = tmp_path / 'chat'
+    checkpoint = read_checkpoint(directory)
+    assert checkpoint == {'cursor': timestamp(90), 'records': 160, 'segments': 2, 'done': False}
+    assert 'segment-00002.ndjson.tmp' in os.listdir(directory)
+
+    channel, requests = make_chat(250)
+    results = asyncio.run(guilded.ChannelExporter(str(tmp_path), segment_size=80).export(channel))
+
+    assert requests[0] == timestamp(90)
+    assert not [filename for filename in os.listdir(directory) if filename.endswith('.tmp')]
+    assert results['chat'].records == 250
+
+    ids = [record['data']['id'] for segment in read_segments(directory) for record in segment]
+    assert ids == [f'message-{index}' for index in reversed(range(250))]
+
+
+def test_finished_channel_is_skipped(tmp_path):
+    channel, _ = make_chat(10)
+    asyncio.run(guilded.ChannelExporter(str(tmp_path)).export(channel))
+
+    channel, requests = make_chat(10)
+    results = asyncio.run(guilded.ChannelExporter(str(tmp_path)).export(channel))
+
+    assert requests == []
+    assert results['chat'].done
+    assert results['chat'].records == 10
+
+
+def test_replies_follow_their_topic(tmp_path):
+    state = guilded.Client().http
+    topics = [
+        {
+            'id': index,
+            'channelId': 'forum',
+            'title': 'topic',
+            'content': 'content',
+            'createdBy': 'author',
+            'createdAt': timestamp(index),
+        }
+        for index in range(12)
+    ]
+
+    async def get_forum_topics(channel_id, *, before=None, limit=None):
+        return {'forumTopics': newest_first(topics, before, limit)}
+
+    async def get_forum_topic_comments(channel_id, topic_id):
+        # Newer topics answer last so that fetches complete out of order
+        await asyncio.sleep(topic_id * 0.002)
+        return {'forumTopicComments': [{'id': topic_id * 10 + index, 'topic': topic_id} for index in range(2)]}
+
+    state.get_forum_topics = get_forum_topics
+    state.get_forum_topic_comments = get_forum_topic_comments
+    forum = guilded.ForumChannel(state=state, group=None, data=channel_data('forum', 'forums'))
+
+    asyncio.run(guilded.ChannelExporter(str(tmp_path), max_reply_concurrency=3).export(forum))
+
+    records = [record for segment in read_segments(tmp_path / 'forum') for record in segment]
+    expected = []
+    for topic_id in reversed(range(12)):
+        expected.append(('topic', topic_id))
+        expected.extend(('topic_reply', topic_id) for _ in range(2))
+    assert [
+        (record['type'], record['data']['id'] if record['type'] == 'topic' else record['data']['topic'])
+        for record in records
+    ] == expected
+
+
+def test_unsupported_channel_raises(tmp_path):
+    state = guilded.Client().http
+    media = guilded.MediaChannel(state=state, group=None, data=channel_data('media', 'media'))
+    with pytest.raises(TypeError):
+        asyncio.run(guilded.ChannelExporter(str(tmp_path)).export(media))
+
+    # Nothing is written before every channel has been checked
+    assert not os.listdir(tmp_path)
@@ -0,0 +1,80 @@
+import asyncio
+
+import guilded
+from guilded.http import Route
+
+
+def test_bucket_masks_ids_after_the_major_parameter():
+    first = Route('DELETE', '/channels/channel-a/messages/message-a')
+    second = Route('DELETE', '/channels/channel-a/messages/message-b')
+    other_channel = Route('DELETE', '/channels/channel-b/messages/message-a')
+
+    assert first.bucket == second.bucket
+    assert first.bucket != other_channel.bucket
+    assert first.bucket == f'DELETE {Route.BASE}/channels/channel-a/messages/{{}}'
+
+
+def test_bucket_separates_methods_and_ignores_query():
+    assert Route('GET', '/channels/a/messages').bucket != Route('POST', '/channels/a/messages').bucket
+    assert Route('GET', '/channels/a/messages?limit=5').bucket == Route('GET', '/channels/a/messages').bucket
+    assert Route('GET', '/servers/a/members/b/roles').bucket == f'GET {Route.BASE}/servers/a/members/{{}}/roles'
+
+
+class FakeResponse:
+    def __init__(self, status, headers):
+        self.status = status
+        self.headers = {'Content-Type': 'application/json', **headers}
+        self.reason = 'Reason'
+
+    async def text(self, **kwargs):
+        return '{}'
+
+
+class FakeSession:
+    def __init__(self, loop, limited_paths):
+        self.loop = loop
+        self.limited_paths = set(limited_paths)
+        self.requests = []
+
+    async def request(self, method, url, **kwargs):
+        self.requests.append((url, round(self.loop.time(), 2)))
+        if url in self.limited_paths:
+            self.limited_paths.discard(url)
+            return FakeResponse(429, {'retry-after': '0.2'})
+        return FakeResponse(200, {})
+
+
+def test_rate_limit_is_shared_across_a_bucket():
+    async def main():
+        loop = asyncio.get_running_loop()
+        state = guilded.Client().http
+        limited = Route('DELETE', '/channels/a/messages/first')
+        session = state.session = FakeSession(loop, [limited.url])
+        start = loop.time()
+
+        async def delete(route, delay):
+            await asyncio.sleep(delay)
+            await state.request(route)
+            return loop.time() - start
+
+        same_bucket = Route('DELETE', '/channels/a/messages/second')
+        other_bucket = Route('DELETE', '/channels/b/messages/first')
+        first, second, other = await asyncio.gather(
+            delete(limited, 0),
+            delete(same_bucket, 0.05),
+            delete(other_bucket, 0.05),
+        )
+
+        # The second request in the bucket waited out the limit instead of
+        # being sent (and rate limited) itself
+        assert second >= 0.2
+        assert other < 0.15
+        assert first >= 0.2
+        assert [url for url, _ in session.requests].count(same_bucket.url) == 1
+        assert len(session.requests) == 4
+
+        # The expired reset is cleaned up on the next request
+        await state.request(same_bucket)
+        assert limited.bucket not in state._bucket_resets
+
+    asyncio.run(main())
@@ -0,0 +1,232 @@
+import asyncio
+import datetime
+
+import pytest
+
+import guilded
+from guilded.errors import Forbidden
+from guilded.reaction import Reaction
+
+
+class FakeResponse:
+    reason = 'Reason'
+
+    def __init__(self, status):
+        self.status = status
+
+
+def timestamp(index):
+    return (datetime.datetime(2022, 1, 1) + datetime.timedelta(seconds=index)).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+
+def channel_data(channel_id, type):
+    return {
+        'id': channel_id,
+        'type': type,
+        'serverId': 'server-id',
+        'createdBy': 'author',
+        'name': channel_id,
+        'createdAt': timestamp(0),
+    }
+
+
+def make_chat(count):
+    state = guilded.Client().http
+    messages = [
+        {
+            'id': f'message-{index}',
+            'type': 'default',
+            'channelId': 'chat',
+            'content': str(index),
+            'createdBy': 'author',
+            'createdAt': timestamp(index),
+        }
+        for index in range(count)
+    ]
+    requests = []
+
+    async def get_channel_messages(channel_id, *, before=None, after=None, limit=None, include_private=False):
+        requests.append((before, limit))
+        page = sorted(
+            (message for message in messages if before is None or message['createdAt'] < before),
+            key=lambda message: message['createdAt'],
+            reverse=True,
+        )
+        return {'messages': page[:limit]}
+
+    state.get_channel_messages = get_channel_messages
+    return guilded.ChatChannel(state=state, group=None, data=channel_data('chat', 'chat')), requests
+
+
+def test_history_pages_from_the_oldest_message():
+    channel, requests = make_chat(250)
+
+    async def main():
+        return [message.id async for message in channel.history(limit=None)]
+
+    ids = asyncio.run(main())
+    assert ids == [f'message-{index}' for index in reversed(range(250))]
+    # The final page comes back short, which ends pagination
+    assert requests == [(None, 100), (timestamp(150), 100), (timestamp(50), 100)]
+
+
+def test_history_limit():
+    channel, requests = make_chat(250)
+
+    async def main():
+        return [message async for message in channel.history(limit=150, prefetch=0)]
+
+    assert len(asyncio.run(main())) == 150
+    assert requests == [(None, 100), (timestamp(150), 50)]
+
+    channel, requests = make_chat(250)
+    assert asyncio.run(channel.history(limit=0).flatten()) == []
+    assert requests == []
+
+
+def test_history_can_still_be_awaited():
+    channel, _ = make_chat(60)
+
+    async def main():
+        return await channel.history()
+
+    messages = asyncio.run(main())
+    assert isinstance(messages, list)
+    assert len(messages) == 50
+    assert all(isinstance(message, guilded.ChatMessage) for message in messages)
+
+
+def test_topics_page_by_latest_activity():
+    state = guilded.Client().http
+    # Topic 0 was bumped most recently, so it sorts first
+    topics = [
+        {
+            'id': index,
+            'channelId': 'forum',
+            'serverId': 'server-id',
+            'title': 'topic',
+            'content': 'content',
+            'createdBy': 'author',
+            'createdAt': timestamp(index),
+            **({'bumpedAt': timestamp(1000)} if index == 0 else {}),
+        }
+        for index in range(150)
+    ]
+    requests = []
+
+    async def get_forum_topics(channel_id, *, before=None, limit=None):
+        requests.append(before)
+        page = sorted(
+            (topic for topic in topics if before is None or (topic.get('bumpedAt') or topic['createdAt']) < before),
+            key=lambda topic: topic.get('bumpedAt') or topic['createdAt'],
+            reverse=True,
+        )
+        return {'forumTopics': page[:limit]}
+
+    state.get_forum_topics = get_forum_topics
+    forum = guilded.ForumChannel(state=state, group=None, data=channel_data('forum', 'forums'))
+
+    async def main():
+        return [topic.id async for topic in forum.topics(limit=None)]
+
+    ids = asyncio.run(main())
+    assert ids == [0, *reversed(range(1, 150))]
+    assert requests == [None, timestamp(51)]
+
+
+def test_events_page_from_the_latest_start():
+    state = guilded.Client().http
+    events = [
+        {
+            'id': index,
+            'channelId': 'calendar',
+            'serverId': 'server-id',
+            'name': 'event',
+            'createdBy': 'author',
+            'createdAt': timestamp(0),
+            'startsAt': timestamp(index),
+        }
+        for index in range(600)
+    ]
+    requests = []
+
+    async def get_calendar_events(channel_id, *, limit=None, before=None, after=None):
+        requests.append((after, limit))
+        page = [event for event in events if after is None or event['startsAt'] > after]
+        return {'calendarEvents': page[:limit]}
+
+    state.get_calendar_events = get_calendar_events
+    calendar = guilded.CalendarChannel(state=state, group=None, data=channel_data('calendar', 'calendar'))
+
+    async def main():
+        return [event.id async for event in calendar.events(limit=550)]
+
+    assert asyncio.run(main()) == list(range(550))
+    assert requests == [(None, 500), (timestamp(499), 50)]
+
+
+def user_data(user_id):
+    return {'id': user_id, 'name': user_id, 'type': 'user', 'createdAt': timestamp(0)}
+
+
+def make_reaction(user_ids, *, cached=(), get_user=None):
+    state = guilded.Client().http
+    for user_id in cached:
+        state.add_to_user_cache(state.create_user(data=user_data(user_id)))
+
+    async def default_get_user(user_id):
+        await asyncio.sleep(0.001)
+        return {'user': user_data(user_id)}
+
+    state.get_user = get_user or default_get_user
+
+    class Parent:
+        server = None
+        _state = state
+
+    reaction = Reaction.__new__(Reaction)
+    reaction._state = state
+    reaction.parent = Parent
+    reaction._user_ids = set(user_ids)
+    return reaction
+
+
+def test_reaction_users_yields_cached_users_first():
+    user_ids = [f'user{index:04d}' for index in range(20)]
+    cached = user_ids[::2]
+    reaction = make_reaction(user_ids, cached=cached)
+
+    async def main():
+        return [user.id async for user in reaction.users(max_concurrency=3)]
+
+    ids = asyncio.run(main())
+    order = list(reaction._user_ids)
+    assert ids[:len(cached)] == [user_id for user_id in order if user_id in cached]
+    assert sorted(ids) == sorted(user_ids)
+
+
+def test_reaction_users_after_and_limit():
+    reaction = make_reaction([f'user{index:04d}' for index in range(20)])
+    order = list(reaction._user_ids)
+
+    async def main():
+        after = guilded.Object(order[4])
+        return [user.id async for user in reaction.users(after=after, limit=5)]
+
+    assert sorted(asyncio.run(main())) == sorted(order[5:10])
+
+
+def test_reaction_users_raises_worker_errors():
+    async def get_user(user_id):
+        if user_id == 'user0003':
+            raise Forbidden(FakeResponse(403), {'message': 'Missing permissions'})
+        await asyncio.sleep(0.001)
+        return {'user': user_data(user_id)}
+
+    reaction = make_reaction([f'user{index:04d}' for index in range(10)], get_user=get_user)
+
+    async def main():
+        return [user async for user in reaction.users(max_concurrency=2)]
+
+    with pytest.raises(Forbidden):
+        asyncio.run(asyncio.wait_for(main(), timeout=3))
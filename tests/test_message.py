@@ -0,0 +1,78 @@
+import datetime
+
+from guilded.embed import Embed
+from guilded.message import ChatMessage
+from guilded.utils import MISSING
+
+
+class FakeState:
+    cdn_qs_expired = True
+
+    def _get_server(self, server_id):
+        return None
+
+    def _get_user(self, user_id):
+        return None
+
+
+def make_message(**data):
+    payload = {
+        'id': 'message-id',
+        'channelId': 'channel-id',
+        'createdBy': 'user-id',
+        'createdAt': '2023-04-05T06:07:08.123Z',
+        'content': 'hello ![](https://img.guildedcdn.com/ContentMedia/abc-Full.png)',
+        'embeds': [{'title': 'an embed'}],
+        'mentions': {'everyone': True},
+    }
+    payload.update(data)
+    return ChatMessage(state=FakeState(), channel=None, data=payload)
+
+
+def test_content_is_parsed_on_first_access():
+    message = make_message()
+    assert message._content is MISSING
+    assert message._embeds is MISSING
+    assert message._created_at is MISSING
+
+    assert message.content.startswith('hello')
+    assert [embed.title for embed in message.embeds] == ['an embed']
+    assert [attachment.url for attachment in message.attachments] == ['https://img.guildedcdn.com/ContentMedia/abc-Full.png']
+    assert message._mentions.everyone is True
+    assert message._raw_content is None
+
+    assert message.created_at == datetime.datetime(2023, 4, 5, 6, 7, 8, 123000)
+    assert message.updated_at is None
+
+
+def test_embeds_getter_materializes_content():
+    message = make_message()
+    assert [embed.title for embed in message.embeds] == ['an embed']
+    assert message._content is not MISSING
+    assert len(message.attachments) == 1
+
+
+def test_setters_before_getters_are_kept():
+    message = make_message()
+    embeds = [Embed(title='replacement')]
+    message.embeds = embeds
+    message.attachments = []
+
+    assert message.content.startswith('hello')
+    assert message.embeds is embeds
+    assert message.attachments == []
+
+
+def test_content_setter_before_getter():
+    message = make_message()
+    message.content = 'edited'
+    assert message.content == 'edited'
+    assert [embed.title for embed in message.embeds] == ['an embed']
+
+
+def test_timestamp_setters_before_getters():
+    message = make_message(updatedAt='2023-04-05T06:07:09Z')
+    created_at = datetime.datetime(2020, 1, 1)
+    message.created_at = created_at
+    assert message.created_at is created_at
+    assert message.updated_at == datetime.datetime(2023, 4, 5, 6, 7, 9)
@@ -0,0 +1,76 @@
+import asyncio
+
+import guilded
+import guilded.utils
+from guilded.emote import Emote
+from guilded.role import Role
+from guilded.server import Server
+from guilded.user import Member, User
+from guilded.utils import _intern_id
+
+
+def make_server(client):
+    server = Server(state=client.http, data={'id': 'server-id', 'name': 'server', 'ownerId': 'owner-id'})
+    client.http.add_to_server_cache(server)
+    return server
+
+
+def test_core_models_have_no_instance_dict():
+    client = guilded.Client()
+    state = client.http
+    server = make_server(client)
+    models = [
+        server,
+        User(state=state, data={'id': 'user-id', 'name': 'user'}),
+        Member(state=state, data={'user': {'id': 'user-id', 'name': 'user'}, 'roleIds': [1]}, server=server),
+        Role(state=state, data={'id': 1, 'serverId': server.id, 'name': 'role'}),
+        Emote(state=state, data={'id': 1, 'name': 'emote', 'url': 'https://example.com/emote.png'}, server=server),
+        guilded.ChatChannel(state=state, group=None, data={'id': 'channel-id', 'type': 'chat', 'serverId': server.id, 'name': 'chat'}),
+    ]
+    for model in models:
+        assert not hasattr(model, '__dict__'), type(model).__name__
+
+
+def test_ids_shared_across_members_are_interned():
+    client = guilded.Client()
+    server = make_server(client)
+    members = [
+        Member(
+            state=client.http,
+            data={'user': {'id': f'user-{index}', 'name': 'user'}, 'roleIds': [int('12345678')]},
+            server=server,
+        )
+        for index in range(2)
+    ]
+    first, second = (next(iter(member._role_ids)) for member in members)
+    assert first is second
+    assert members[0].server_id is members[1].server_id
+
+
+def test_interned_id_table_is_bounded(monkeypatch):
+    monkeypatch.setattr(guilded.utils, '_MAX_INTERNED_IDS', 10)
+    monkeypatch.setattr(guilded.utils, '_interned_ids', {})
+    for value in range(1000, 1100):
+        assert _intern_id(value) == value
+
+    assert len(guilded.utils._interned_ids) <= 10
+
+
+def test_fill_roles_prunes_deleted_roles_from_member_index():
+    client = guilded.Client()
+    server = make_server(client)
+    server._add_member(Member(
+        state=client.http,
+        data={'user': {'id': 'user-id', 'name': 'user'}, 'roleIds': [1, 2]},
+        server=server,
+    ))
+    assert set(server._role_member_ids) == {1, 2}
+
+    async def get_roles(server_id):
+        return {'roles': [{'id': 1, 'serverId': server_id, 'name': 'kept'}]}
+
+    client.http.get_roles = get_roles
+    asyncio.run(server.fill_roles())
+
+    assert set(server._roles) == {1}
+    assert set(server._role_member_ids) == {1}
@@ -0,0 +1,19 @@
+from guilded.permissions import Permissions
+
+
+def test_factories_return_fresh_instances():
+    permissions = Permissions.none()
+    permissions.value |= 1
+    assert Permissions.none().value == 0
+
+    permissions = Permissions.all()
+    permissions.value = 0
+    assert Permissions.all().administrator
+
+
+def test_values_round_trip():
+    permissions = Permissions('CanReadChats', 'CanCreateChats')
+    assert sorted(permissions.values) == ['CanCreateChats', 'CanReadChats']
+    assert permissions == Permissions('CanCreateChats', 'CanReadChats')
+    assert permissions <= Permissions.all()
+    assert not permissions.administrator
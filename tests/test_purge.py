@@ -0,0 +1,111 @@
+import asyncio
+import datetime
+
+import pytest
+
+import guilded
+from guilded.errors import Forbidden, NotFound
+
+
+class FakeResponse:
+    reason = 'Reason'
+
+    def __init__(self, status):
+        self.status = status
+
+
+def timestamp(index):
+    return (datetime.datetime(2022, 1, 1) + datetime.timedelta(seconds=index)).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+
+def make_channel(count, delete):
+    client = guilded.Client()
+    state = client.http
+    messages = [
+        {
+            'id': f'message-{index}',
+            'type': 'default',
+            'channelId': 'channel-id',
+            'content': str(index),
+            'createdBy': 'author-a' if index % 2 else 'author-b',
+            'createdAt': timestamp(index),
+        }
+        for index in range(count)
+    ]
+
+    async def get_channel_messages(channel_id, *, before=None, after=None, limit=None, include_private=False):
+        if before is not None:
+            before = state.valid_ISO8601(before)
+        page = sorted(
+            (message for message in messages if before is None or message['createdAt'] < before),
+            key=lambda message: message['createdAt'],
+            reverse=True,
+        )
+        return {'messages': page[:limit]}
+
+    state.get_channel_messages = get_channel_messages
+    state.delete_channel_message = delete
+    return guilded.ChatChannel(
+        state=state,
+        group=None,
+        data={'id': 'channel-id', 'type': 'chat', 'serverId': 'server-id', 'name': 'chat'},
+    )
+
+
+def test_purge_deletes_matching_messages_concurrently():
+    async def main():
+        deleted = []
+        in_flight = [0, 0]
+
+        async def delete(channel_id, message_id):
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+            await asyncio.sleep(0.001)
+            in_flight[0] -= 1
+            if message_id == 'message-249':
+                raise NotFound(FakeResponse(404), {'message': 'gone'})
+            deleted.append(message_id)
+
+        channel = make_channel(300, delete)
+        progress = []
+        result = await channel.purge(
+            limit=250,
+            check=lambda message: message.author_id == 'author-a',
+            max_concurrency=4,
+            on_progress=lambda deleted, searched: progress.append((deleted, searched)),
+        )
+
+        # The 250 newest messages are searched; one odd message was
+        # already gone
+        assert len(result) == 124
+        assert sorted(message.id for message in result) == sorted(deleted)
+        assert all(message.author_id == 'author-a' for message in result)
+        assert in_flight[1] <= 4
+        assert progress[-1][0] == 124
+
+    asyncio.run(main())
+
+
+def test_purge_raises_worker_failure_instead_of_hanging():
+    async def main():
+        async def delete(channel_id, message_id):
+            raise Forbidden(FakeResponse(403), {'message': 'no'})
+
+        channel = make_channel(15, delete)
+        with pytest.raises(Forbidden):
+            await asyncio.wait_for(channel.purge(limit=None, max_concurrency=5), timeout=3)
+
+    asyncio.run(main())
+
+
+def test_purge_raises_failure_after_last_page():
+    async def main():
+        async def delete(channel_id, message_id):
+            if message_id == 'message-0':
+                raise Forbidden(FakeResponse(403), {'message': 'no'})
+
+        channel = make_channel(3, delete)
+        with pytest.raises(Forbidden):
+            await asyncio.wait_for(channel.purge(limit=None, max_concurrency=1), timeout=3)
+
+    asyncio.run(main())
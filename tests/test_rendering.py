@@ -0,0 +1,159 @@
+import pytest
+
+from guilded.message import HasContentMixin
+
+
+def text(string, *marks):
+    return {'object': 'text', 'leaves': [{'object': 'leaf', 'text': string, 'marks': [{'type': mark} for mark in marks]}]}
+
+
+def leaves(*pieces):
+    return {
+        'object': 'text',
+        'leaves': [
+            {'object': 'leaf', 'text': string, 'marks': [{'type': mark} for mark in marks]}
+            for string, marks in pieces
+        ],
+    }
+
+
+def inline(type, data, string):
+    return {'object': 'inline', 'type': type, 'data': data, 'nodes': [text(string)]}
+
+
+def paragraph(*elements):
+    return {'object': 'block', 'type': 'paragraph', 'nodes': list(elements)}
+
+
+def document(*nodes):
+    return {'document': {'object': 'document', 'nodes': list(nodes)}}
+
+
+class FakeState:
+    def _get_server_member(self, server_id, user_id):
+        return f'member:{user_id}'
+
+    def _get_user(self, user_id):
+        return f'user:{user_id}'
+
+    def _get_server_channel(self, server_id, channel_id):
+        return f'channel:{channel_id}'
+
+    def _get_emote(self, emote_id):
+        return f'emote:{emote_id}'
+
+
+class Content(HasContentMixin):
+    created_by_bot = False
+
+    def __init__(self, server_id='server-id'):
+        super().__init__()
+        self._state = FakeState()
+        self.server_id = server_id
+
+
+# Expected output was produced by the renderer this one replaced, which
+# built each formatted leaf from a '{unmarked_content}' template wrapped in
+# one mark at a time.
+CASES = [
+    pytest.param(document(), '', id='empty'),
+    pytest.param({}, '', id='no document'),
+    pytest.param(
+        document(paragraph(text('plain')), paragraph(text('second line'))),
+        'plain\nsecond line',
+        id='paragraphs',
+    ),
+    pytest.param(
+        document(paragraph(
+            text('bold', 'bold'),
+            text(' '),
+            text('all', 'bold', 'italic', 'underline', 'strikethrough', 'spoiler'),
+            text(' '),
+            text('unknown', 'inline-code-v2'),
+            text(' '),
+            text('mixed', 'unknown-mark', 'italic'),
+            text(' {braces}', 'bold'),
+        )),
+        '**bold** ||~~__***all***__~~|| unknown *mixed*** {braces}**',
+        id='nested marks',
+    ),
+    pytest.param(
+        document(paragraph(leaves(('a', ('italic', 'bold')), ('b', ()), ('c', ('spoiler',))))),
+        '***a***b||c||',
+        id='leaves',
+    ),
+    pytest.param(
+        document(paragraph(
+            text('hey '),
+            inline('mention', {'mention': {'type': 'person', 'id': 'user-a', 'name': 'A'}}, '@A'),
+            text(' and '),
+            inline('mention', {'mention': {'type': 'role', 'id': 123}}, '@Role'),
+            text(' '),
+            inline('mention', {'mention': {'type': 'everyone', 'id': 'everyone'}}, '@everyone'),
+            text(' '),
+            inline('mention', {'mention': {'type': 'here', 'id': 'here'}}, '@here'),
+            text(' in '),
+            inline('channel', {'channel': {'id': 'channel-a'}}, '#general'),
+            inline('channel', {'channel': {}}, '#missing'),
+        )),
+        'hey <@user-a> and <@123> @everyone @here in <#channel-a>',
+        id='mentions',
+    ),
+    pytest.param(
+        document(paragraph(
+            inline('link', {'href': 'https://guilded.gg'}, 'Guilded'),
+            text(' '),
+            inline('link', {'href': 'https://example.com'}, 'https://example.com'),
+            text(' '),
+            inline('reaction', {'reaction': {'id': 90000000}}, ':smile:'),
+        )),
+        '[Guilded](https://guilded.gg) https://example.com :smile:',
+        id='links and reactions',
+    ),
+    pytest.param(
+        document(
+            paragraph(text('before')),
+            {
+                'object': 'block',
+                'type': 'block-quote-container',
+                'nodes': [{'object': 'block', 'type': 'block-quote-line', 'nodes': [
+                    {'object': 'text', 'leaves': [{'object': 'leaf', 'text': 'quoted', 'marks': []}]},
+                    {'object': 'text', 'leaves': [{'object': 'leaf', 'text': 'lines', 'marks': []}]},
+                ]}],
+            },
+            {'object': 'block', 'type': 'markdown-plain-text', 'nodes': [
+                {'object': 'text', 'leaves': [{'object': 'leaf', 'text': '```code```', 'marks': []}]},
+            ]},
+            paragraph(text('after', 'bold')),
+        ),
+        'before\n\n> quoted\n> lines\n```code```**after**',
+        id='blocks',
+    ),
+]
+
+
+@pytest.mark.parametrize('data, expected', CASES)
+def test_render_matches_previous_renderer(data, expected):
+    assert Content()._get_full_content(data) == expected
+
+
+def test_mentions_are_collected():
+    content = Content()
+    content._get_full_content(CASES[5].values[0])
+
+    assert content._raw_user_mentions == ['user-a']
+    assert content._user_mentions == ['member:user-a']
+    assert content._raw_role_mentions == [123]
+    assert content._raw_channel_mentions == ['channel-a']
+    assert content._channel_mentions == ['channel:channel-a']
+    assert content._mentions_everyone is True
+    assert content._mentions_here is True
+
+
+def test_mention_collection_can_be_skipped():
+    content = Content()
+    rendered = content._get_full_content(CASES[5].values[0], collect_mentions=False)
+
+    assert rendered == CASES[5].values[1]
+    assert content._raw_user_mentions == []
+    assert content._mentions_everyone is False
@@ -0,0 +1,56 @@
+import datetime
+
+import pytest
+
+from guilded.utils import ISO8601, _ISO8601Slot
+
+
+@pytest.mark.parametrize(
+    'string, expected',
+    [
+        # Fast path: 24 characters with milliseconds, 20 without
+        ('2023-04-05T06:07:08.123Z', datetime.datetime(2023, 4, 5, 6, 7, 8, 123000)),
+        ('2023-04-05T06:07:08.000Z', datetime.datetime(2023, 4, 5, 6, 7, 8)),
+        ('2023-04-05T06:07:08Z', datetime.datetime(2023, 4, 5, 6, 7, 8)),
+        # Fallbacks
+        ('2023-04-05T06:07:08.123456Z', datetime.datetime(2023, 4, 5, 6, 7, 8, 123456)),
+        ('2023-04-05T06:07:08.1Z', datetime.datetime(2023, 4, 5, 6, 7, 8, 100000)),
+        ('2023-04-05T06:07:08', datetime.datetime(2023, 4, 5, 6, 7, 8)),
+        (
+            '2023-04-05T06:07:08.1234567+00:00',
+            datetime.datetime(2023, 4, 5, 6, 7, 8, tzinfo=datetime.timezone.utc),
+        ),
+    ],
+)
+def test_iso8601(string, expected):
+    assert ISO8601(string) == expected
+
+
+def test_iso8601_fast_path_matches_strptime():
+    for string, format in (
+        ('2021-12-31T23:59:59.999Z', '%Y-%m-%dT%H:%M:%S.%fZ'),
+        ('2021-12-31T23:59:59Z', '%Y-%m-%dT%H:%M:%SZ'),
+    ):
+        assert ISO8601(string) == datetime.datetime.strptime(string, format)
+
+
+def test_iso8601_none_and_invalid():
+    assert ISO8601(None) is None
+    with pytest.raises(TypeError):
+        ISO8601('not a timestamp')
+    # Looks like the fast path's shape but isn't a valid date
+    with pytest.raises(TypeError):
+        ISO8601('2023-13-45T06:07:08Z')
+
+
+def test_iso8601_slot_parses_once():
+    class Model:
+        __slots__ = ('_created_at',)
+        created_at = _ISO8601Slot('_created_at')
+
+    model = Model()
+    model._created_at = '2023-04-05T06:07:08.123Z'
+    first = model.created_at
+    assert first == datetime.datetime(2023, 4, 5, 6, 7, 8, 123000)
+    assert model._created_at is first
+    assert model.created_at is first